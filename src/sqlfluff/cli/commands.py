@@ -37,7 +37,9 @@ from sqlfluff.core import (
 )
 from sqlfluff.core.config import progress_bar_configuration
 from sqlfluff.core.linter import LintingResult
+from sqlfluff.core.parser.profiler import PROFILE_SORT_KEYS, GrammarProfile
 from sqlfluff.core.plugin.host import get_plugin_manager
+from sqlfluff.core.tracing import start_tracing, stop_tracing, trace_span, write_trace
 from sqlfluff.core.types import Color, FormatType
 
 
@@ -363,6 +365,16 @@ def lint_options(f: Callable) -> Callable:
             "future releases without warning."
         ),
     )(f)
+    f = click.option(
+        "--trace-file",
+        default=None,
+        help=(
+            "A filename to write a trace of the run to, with a span for each "
+            "stage of processing each file and for each rule. The trace is in "
+            "the Chrome trace event format, which can be viewed in a tool such "
+            "as https://ui.perfetto.dev."
+        ),
+    )(f)
     f = click.option(
         "--warn-unused-ignores",
         is_flag=True,
@@ -372,6 +384,51 @@ def lint_options(f: Callable) -> Callable:
     return f
 
 
+def parse_statistics_options(f: Callable) -> Callable:
+    """Add options for outputting parse statistics to commands."""
+    f = click.option(
+        "--parse-statistics",
+        is_flag=True,
+        help=(
+            "Set this flag to record statistics on each segment and grammar "
+            "matched while parsing (attempts, parse cache hits, pruning of "
+            "options, cumulative and self time and match depth), combined "
+            "across all files. This slows down parsing."
+        ),
+    )(f)
+    f = click.option(
+        "--parse-statistics-sort",
+        default="self_time",
+        type=click.Choice(PROFILE_SORT_KEYS, case_sensitive=False),
+        help="How to sort the parse statistics (default=self_time).",
+    )(f)
+    f = click.option(
+        "--parse-statistics-output",
+        default=None,
+        help=(
+            "A filename to write the full parse statistics to, in json format, "
+            "rather than outputting a table of them."
+        ),
+    )(f)
+    return f
+
+
+def output_parse_statistics(
+    formatter: OutputStreamFormatter,
+    profile: Optional[GrammarProfile],
+    sort_by: str,
+    output_path: Optional[str],
+    err: bool = False,
+) -> None:
+    """Output parse statistics as a table, or to a json file."""
+    if not profile:  # pragma: no cover
+        return
+    if output_path:
+        dump_file_payload(output_path, json.dumps(profile.as_records(sort_by)))
+    else:
+        click.echo(formatter.format_parse_profile(profile, sort_by), err=err)
+
+
 def get_config(
     extra_config_path: Optional[str] = None,
     ignore_local_config: bool = False,
@@ -581,6 +638,7 @@ def dump_file_payload(filename: Optional[str], payload: str) -> None:
     is_flag=True,
     help="Perform the operation regardless of .sqlfluffignore configurations",
 )
+@parse_statistics_options
 @click.argument("paths", nargs=-1, type=click.Path(allow_dash=True))
 def lint(
     paths: Tuple[str],
@@ -594,9 +652,13 @@ def lint(
     processes: Optional[int] = None,
     disable_progress_bar: Optional[bool] = False,
     persist_timing: Optional[str] = None,
+    trace_file: Optional[str] = None,
     extra_config_path: Optional[str] = None,
     ignore_local_config: bool = False,
     stdin_filename: Optional[str] = None,
+    parse_statistics: bool = False,
+    parse_statistics_sort: str = "self_time",
+    parse_statistics_output: Optional[str] = None,
     **kwargs,
 ) -> None:
     """Lint SQL files via passing a list of files or using stdin.
@@ -617,9 +679,14 @@ def lint(
         echo 'select col from tbl' | sqlfluff lint -
 
     """
-    config = get_config(
-        extra_config_path, ignore_local_config, require_dialect=False, **kwargs
-    )
+    if trace_file:
+        start_tracing()
+    if parse_statistics:
+        kwargs["parse_statistics"] = True
+    with trace_span("load config", "stage"):
+        config = get_config(
+            extra_config_path, ignore_local_config, require_dialect=False, **kwargs
+        )
     non_human_output = (format != FormatType.human.value) or (write_output is not None)
     file_output = None
     output_stream = make_output_stream(config, format, write_output)
@@ -762,6 +829,9 @@ def lint(
     if persist_timing:
         result.persist_timing_records(persist_timing)
 
+    if trace_file:
+        write_trace(trace_file, stop_tracing())
+
     output_stream.close()
     if bench:
         click.echo("==== overall timings ====")
@@ -773,6 +843,15 @@ def lint(
                 formatter.cli_table(timing_summary[step].items(), cols=3, col_width=20)
             )
 
+    if parse_statistics:
+        output_parse_statistics(
+            formatter,
+            result.parse_profile(),
+            parse_statistics_sort,
+            parse_statistics_output,
+            err=non_human_output,
+        )
+
     if not nofail:
         if not non_human_output:
             formatter.completion_message()
@@ -787,12 +866,15 @@ def do_fixes(
     result: LintingResult,
     formatter: Optional[OutputStreamFormatter] = None,
     fixed_file_suffix: str = "",
+    fix_durability: str = "file",
 ) -> bool:
     """Actually do the fixes."""
     if formatter and formatter.verbosity >= 0:
         click.echo("Persisting Changes...")
     res = result.persist_changes(
-        formatter=formatter, fixed_file_suffix=fixed_file_suffix
+        formatter=formatter,
+        fixed_file_suffix=fixed_file_suffix,
+        fix_durability=fix_durability,
     )
     if all(res.values()):
         if formatter and formatter.verbosity >= 0:
@@ -892,6 +974,7 @@ def _paths_fix(
     show_lint_violations,
     check: bool = False,
     persist_timing: Optional[str] = None,
+    trace_file: Optional[str] = None,
 ) -> None:
     """Handle fixing from paths."""
     # Lint the paths (not with the fix argument at this stage), outputting as we go.
@@ -946,6 +1029,7 @@ def _paths_fix(
                     result,
                     formatter,
                     fixed_file_suffix=fixed_suffix,
+                    fix_durability=linter.config.get("fix_durability", default="file"),
                 )
                 if not success:
                     sys.exit(EXIT_FAIL)  # pragma: no cover
@@ -994,6 +1078,9 @@ def _paths_fix(
     if persist_timing:
         result.persist_timing_records(persist_timing)
 
+    if trace_file:
+        write_trace(trace_file, stop_tracing())
+
     sys.exit(exit_code)
 
 
@@ -1067,6 +1154,7 @@ def fix(
     processes: Optional[int] = None,
     disable_progress_bar: Optional[bool] = False,
     persist_timing: Optional[str] = None,
+    trace_file: Optional[str] = None,
     extra_config_path: Optional[str] = None,
     ignore_local_config: bool = False,
     show_lint_violations: bool = False,
@@ -1090,9 +1178,12 @@ def fix(
             sys.exit(EXIT_ERROR)
         kwargs["verbose"] = -1
 
-    config = get_config(
-        extra_config_path, ignore_local_config, require_dialect=False, **kwargs
-    )
+    if trace_file:
+        start_tracing()
+    with trace_span("load config", "stage"):
+        config = get_config(
+            extra_config_path, ignore_local_config, require_dialect=False, **kwargs
+        )
     fix_even_unparsable = config.get("fix_even_unparsable")
     output_stream = make_output_stream(
         config, None, os.devnull if fixing_stdin else None
@@ -1142,6 +1233,7 @@ def fix(
                 show_lint_violations,
                 check=check,
                 persist_timing=persist_timing,
+                trace_file=trace_file,
             )
 
 
@@ -1164,6 +1256,7 @@ def cli_format(
     processes: Optional[int] = None,
     disable_progress_bar: Optional[bool] = False,
     persist_timing: Optional[str] = None,
+    trace_file: Optional[str] = None,
     extra_config_path: Optional[str] = None,
     ignore_local_config: bool = False,
     stdin_filename: Optional[str] = None,
@@ -1205,9 +1298,12 @@ def cli_format(
         "structure.distinct,"
     )
 
-    config = get_config(
-        extra_config_path, ignore_local_config, require_dialect=False, **kwargs
-    )
+    if trace_file:
+        start_tracing()
+    with trace_span("load config", "stage"):
+        config = get_config(
+            extra_config_path, ignore_local_config, require_dialect=False, **kwargs
+        )
     output_stream = make_output_stream(
         config, None, os.devnull if fixing_stdin else None
     )
@@ -1243,6 +1339,7 @@ def cli_format(
                 bench=bench,
                 show_lint_violations=False,
                 persist_timing=persist_timing,
+                trace_file=trace_file,
             )
 
 
@@ -1296,14 +1393,7 @@ def quoted_presenter(dumper, data):
         "stdout logging."
     ),
 )
-@click.option(
-    "--parse-statistics",
-    is_flag=True,
-    help=(
-        "Set this flag to enabled detailed debugging readout "
-        "on the use of terminators in the parser."
-    ),
-)
+@parse_statistics_options
 @click.option(
     "--nofail",
     is_flag=True,
@@ -1324,6 +1414,8 @@ def parse(
     extra_config_path: Optional[str] = None,
     ignore_local_config: bool = False,
     parse_statistics: bool = False,
+    parse_statistics_sort: str = "self_time",
+    parse_statistics_output: Optional[str] = None,
     stdin_filename: Optional[str] = None,
     **kwargs,
 ) -> None:
@@ -1426,6 +1518,19 @@ def parse(
         # Dump the output to stdout or to file as appropriate.
         dump_file_payload(write_output, file_output)
 
+    if parse_statistics:
+        profile = GrammarProfile()
+        for parsed_string in parsed_strings:
+            if parsed_string.parse_profile:
+                profile.merge(parsed_string.parse_profile)
+        output_parse_statistics(
+            formatter,
+            profile,
+            parse_statistics_sort,
+            parse_statistics_output,
+            err=non_human_output,
+        )
+
     if violations_count > 0 and not nofail:
         sys.exit(EXIT_FAIL)  # pragma: no cover
     else:
@@ -18,6 +18,7 @@ from sqlfluff.cli.helpers import (
 from sqlfluff.cli.outputstream import OutputStream
 from sqlfluff.core import FluffConfig, Linter, SQLBaseError, TimingSummary
 from sqlfluff.core.linter import FormatterInterface, LintedFile, ParsedString
+from sqlfluff.core.parser.profiler import GrammarProfile
 from sqlfluff.core.types import Color
 
 
@@ -215,7 +216,7 @@ class OutputStreamFormatter(FormatterInterface):
         self._dispatch(self.format_dialect_warning(dialect))  # pragma: no cover
 
     def _format_file_violations(
-        self, fname: str, violations: List[SQLBaseError]
+        self, fname: str, violations: List[SQLBaseError], show_filename: bool = True
     ) -> str:
         """Format a set of violations in a `LintingResult`."""
         text_buffer = StringIO()
@@ -230,7 +231,7 @@ class OutputStreamFormatter(FormatterInterface):
         show = fails + warns > 0
 
         # Only print the filename if it's either a failure or verbosity > 1
-        if self.verbosity > 0 or show:
+        if show_filename and (self.verbosity > 0 or show):
             text_buffer.write(self.format_filename(fname, success=fails == 0))
             text_buffer.write("\n")
 
@@ -275,6 +276,25 @@ class OutputStreamFormatter(FormatterInterface):
         )
         self._dispatch(s)
 
+    def dispatch_streamed_violations(
+        self,
+        fname: str,
+        violations: List[SQLBaseError],
+        show_filename: bool,
+    ) -> None:
+        """Dispatch violations found in one section of a streamed file.
+
+        When a file is linted statement by statement, violations are
+        dispatched as each section is linted. The filename should only be
+        shown with the first section which has any violations, and its
+        status then reflects only that section.
+        """
+        if self.verbosity < 0 or not violations:
+            return
+        self._dispatch(
+            self._format_file_violations(fname, violations, show_filename=show_filename)
+        )
+
     def colorize(self, s: str, color: Optional[Color] = None) -> str:
         """Optionally use ANSI colour codes to colour a string."""
         return self.colorize_helper(self.plain_output, s, color)
@@ -499,6 +519,8 @@ class OutputStreamFormatter(FormatterInterface):
         else:
             output_fields = ["violations", "status"]
             special_formats = {}
+        if "cache hits" in all_stats:
+            output_fields += ["cache hits", "cache misses"]
         # Generate content tuples, applying special formats for some fields
         summary_content = [
             (
@@ -515,6 +537,53 @@ class OutputStreamFormatter(FormatterInterface):
         text_buffer.write(self.cli_table(summary_content, max_label_width=14))
         return text_buffer.getvalue()
 
+    def format_parse_profile(
+        self, profile: GrammarProfile, sort_by: str = "self_time", limit: int = 50
+    ) -> str:
+        """Format the statistics from a `GrammarProfile` as a table."""
+        header = (
+            "grammar",
+            "attempts",
+            "cache hits",
+            "cache misses",
+            "pruned",
+            "time (s)",
+            "self (s)",
+            "max depth",
+        )
+        rows = [
+            (
+                record["name"],
+                str(record["attempts"]),
+                str(record["cache_hits"]),
+                str(record["cache_misses"]),
+                (
+                    "{0:.0%}".format(record["prune_ratio"])
+                    if record["prune_ratio"] is not None
+                    else "-"
+                ),
+                "{0:.4f}".format(record["time"]),
+                "{0:.4f}".format(record["self_time"]),
+                str(record["max_depth"]),
+            )
+            for record in profile.as_records(sort_by)[:limit]
+        ]
+        widths = [max(len(row[idx]) for row in [header, *rows]) for idx in range(8)]
+        text_buffer = StringIO()
+        text_buffer.write("==== parse statistics ====\n")
+        for row_idx, row in enumerate([header, *rows]):
+            line = " ".join(
+                # Names are aligned left, and numbers right.
+                pad_line(val, width, "left" if idx == 0 else "right")
+                for idx, (val, width) in enumerate(zip(row, widths))
+            )
+            text_buffer.write(
+                (self.colorize(line, Color.light) if row_idx == 0 else line) + "\n"
+            )
+        if len(profile.stats) > limit:
+            text_buffer.write(f"... and {len(profile.stats) - limit} more.\n")
+        return text_buffer.getvalue()
+
     def format_config_vals(self, config_vals) -> str:
         """Format an iterable of config values from a config object."""
         text_buffer = StringIO()
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
 from copy import copy, deepcopy
 from itertools import chain
 from typing import (
@@ -45,6 +47,13 @@ if TYPE_CHECKING:  # pragma: no cover
 # Instantiate the config logger
 config_logger = logging.getLogger("sqlfluff.config")
 
+# Child configs, keyed on the directory they were loaded for (and anything
+# else which affects how they're loaded). Config files are only read once
+# per process (see `load_config_at_path`), so every file in a directory
+# shares the same config unless it has inline config directives.
+_child_configs: Dict[Tuple[Any, ...], "FluffConfig"] = {}
+_CHILD_CONFIG_CACHE_SIZE = 1024
+
 
 class FluffConfig:
     """The persistent object for internal methods to access configuration.
@@ -480,25 +489,49 @@ class FluffConfig:
         """Instantiate the configured templater."""
         return self.get_templater_class()(**kwargs)
 
-    def make_child_from_path(self, path: str) -> FluffConfig:
+    def make_child_from_path(self, path: str, shared: bool = False) -> FluffConfig:
         """Make a child config at a path but pass on overrides and extra_config_path.
 
+        Child configs are cached for each directory, so that loading the
+        config for many files in the same directory is cheap.
+
         Args:
             path (str): The path to load the new config object from, inheriting
                 the content of the calling `FluffConfig` as base values.
+            shared (bool, optional, defaults to False): If True, return the
+                cached config object for the directory, rather than a copy of
+                it. The result must then not be modified.
 
         Returns:
             :obj:`FluffConfig`: A new config object which copies the current
             config object, but overriding any values set by config values loaded
             from the given path.
         """
-        return self.from_path(
-            path,
-            extra_config_path=self._extra_config_path,
-            ignore_local_config=self._ignore_local_config,
-            overrides=self._overrides,
-            plugin_manager=self._plugin_manager,
+        directory = path if os.path.isdir(path) else os.path.dirname(path)
+        key = (
+            # Config is loaded for the paths between the working
+            # directory and the target, as well as the home directory.
+            os.getcwd(),
+            os.path.expanduser("~"),
+            os.path.abspath(directory),
+            self._extra_config_path,
+            self._ignore_local_config,
+            repr(self._overrides),
         )
+        child = _child_configs.get(key)
+        if child is None or child._plugin_manager is not self._plugin_manager:
+            child = self.from_path(
+                path,
+                extra_config_path=self._extra_config_path,
+                ignore_local_config=self._ignore_local_config,
+                overrides=self._overrides,
+                plugin_manager=self._plugin_manager,
+            )
+            if len(_child_configs) >= _CHILD_CONFIG_CACHE_SIZE:
+                # Evict the oldest entry.
+                del _child_configs[next(iter(_child_configs))]
+            _child_configs[key] = child
+        return child if shared else child.copy()
 
     def diff_to(self, other: FluffConfig) -> ConfigMappingType:
         """Compare this config to another.
@@ -520,6 +553,25 @@ class FluffConfig:
         # e.g. dialect_obj, which is generated on the fly.
         return dict_diff(self._configs, other._configs, ignore=["dialect_obj"])
 
+    def fingerprint(self) -> str:
+        """Return a stable hash of the effective config values.
+
+        This is used to key caches of objects which are derived from the
+        config (e.g. rule packs within worker processes). Private values
+        like the dialect and templater objects are excluded (they are
+        derived from public values), so configs which would behave
+        identically share the same fingerprint, even between processes.
+
+        >>> cfg_a = FluffConfig(overrides={"dialect": "ansi"})
+        >>> cfg_b = FluffConfig(overrides={"dialect": "ansi"})
+        >>> cfg_a.fingerprint() == cfg_b.fingerprint()
+        True
+        >>> cfg_b.set_value(["indentation", "tab_space_size"], 2)
+        >>> cfg_a.fingerprint() == cfg_b.fingerprint()
+        False
+        """
+        return hashlib.sha256(repr(list(self.iter_vals())).encode("utf8")).hexdigest()
+
     def get(
         self, val: str, section: Union[str, Iterable[str]] = "core", default: Any = None
     ) -> Any:
@@ -635,7 +687,7 @@ class FluffConfig:
         know what level of the dict we're in. Dict labels will be returned
         as a blank value before their content.
         """
-        cfg = cfg or self._configs
+        cfg = self._configs if cfg is None else cfg
 
         # Get keys and sort
         keys = sorted(cfg.keys())
@@ -12,7 +12,7 @@ required. Any dependent dialects will be loaded as needed.
 """
 
 from importlib import import_module
-from typing import Iterator, NamedTuple
+from typing import Dict, Iterator, NamedTuple, Tuple
 
 # Eventually it would be a good to dynamically discover dialects
 # from any module beginning with "dialect_" within this folder.
@@ -61,6 +61,12 @@ _legacy_dialects = {
 }
 
 
+# Expanded dialects, by label, along with the hash of the raw dialect
+# they were expanded from. Expanded dialects aren't modified once created,
+# so they can be shared by every config which uses them.
+_expanded_dialects: Dict[str, Tuple[int, Dialect]] = {}
+
+
 def load_raw_dialect(label: str, base_module: str = "sqlfluff.dialects") -> Dialect:
     """Dynamically load a dialect."""
     if label in _legacy_dialects:
@@ -98,9 +104,15 @@ def dialect_readout() -> Iterator[DialectTuple]:
 def dialect_selector(s: str) -> Dialect:
     """Return a dialect given its name."""
     dialect = load_raw_dialect(s)
+    library_hash = dialect.library_hash()
+    cached = _expanded_dialects.get(s)
+    if cached and cached[0] == library_hash:
+        return cached[1]
     # Expand any callable references at this point.
     # NOTE: The result of .expand() is a new class.
-    return dialect.expand()
+    expanded = dialect.expand()
+    _expanded_dialects[s] = (library_hash, expanded)
+    return expanded
 
 
 __all__ = [
@@ -1,7 +1,20 @@
 """Defines the base dialect class."""
 
 import sys
-from typing import Any, Dict, List, Optional, Set, Type, Union, cast
+from copy import deepcopy
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from sqlfluff.core.parser import (
     BaseSegment,
@@ -14,6 +27,9 @@ from sqlfluff.core.parser.lexer import LexerType
 from sqlfluff.core.parser.matchable import Matchable
 from sqlfluff.core.parser.types import BracketPairTuple, DialectElementType
 
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlfluff.core.parser.match_algorithms import PruneIndex
+
 
 class Dialect:
     """Serves as the basis for runtime resolution of Grammar.
@@ -46,10 +62,41 @@ class Dialect:
         # Attributes for documentation
         self.formatted_name: str = formatted_name or name
         self.docstring = docstring or f"The dialect for {self.formatted_name}."
+        # Indexes for pruning grammar options, built as they're used
+        # while parsing. See `sqlfluff.core.parser.match_algorithms`.
+        self.prune_indexes: Dict[int, Tuple[Sequence[Matchable], "PruneIndex"]] = {}
 
     def __repr__(self) -> str:  # pragma: no cover
         return f"<Dialect: {self.name}>"
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Dialect":
+        """Deep copy the dialect, unless it's already expanded.
+
+        Expanded dialects aren't modified, other than to populate the
+        indexes used while parsing. Sharing them (e.g. between copies of
+        a config) means those indexes are only built once.
+        """
+        if self.expanded:
+            return self
+        dialect_copy = self.__class__.__new__(self.__class__)
+        memo[id(self)] = dialect_copy
+        dialect_copy.__dict__.update(deepcopy(self.__dict__, memo))
+        return dialect_copy
+
+    def library_hash(self) -> int:
+        """Hash the content of the library and sets of this dialect.
+
+        This identifies the elements by object rather than by value, so
+        it's cheap to calculate, but will change if any element of the
+        dialect is added or replaced (e.g. by a plugin).
+        """
+        return hash(
+            (
+                tuple((key, id(elem)) for key, elem in self._library.items()),
+                tuple((key, len(value)) for key, value in self._sets.items()),
+            )
+        )
+
     def expand(self) -> "Dialect":
         """Expand any callable references to concrete ones.
 
@@ -1,11 +1,71 @@
 """File Helpers for the parser module."""
 
+import codecs
 import os.path
+from collections import OrderedDict
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterator, Optional, Tuple
 
 import chardet
 
+# The amount of a file which chardet is run over, when detecting encodings.
+ENCODING_SAMPLE_BYTES = 65536
+# Byte order marks, and the encodings which they identify. NOTE: The
+# UTF-32 marks start with the UTF-16 ones, so must be checked first.
+_BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF8, "UTF-8-SIG"),
+    (codecs.BOM_UTF32_LE, "UTF-32"),
+    (codecs.BOM_UTF32_BE, "UTF-32"),
+    (codecs.BOM_UTF16_LE, "UTF-16"),
+    (codecs.BOM_UTF16_BE, "UTF-16"),
+)
+# Detected encodings, keyed on the path, size and modification time of
+# each file, so that unchanged files aren't detected again.
+ENCODING_CACHE_SIZE = 4096
+_encoding_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+
+
+def detect_encoding(data: bytes, truncated: bool = False) -> str:
+    """Detect the encoding of some bytes (e.g. the contents of a file).
+
+    Files with a byte order mark, and files which are valid utf-8 (by far
+    the most common), are identified without needing chardet. Otherwise
+    chardet is run over a sample from the start of the data.
+
+    If `truncated` is set, then the data is a sample from the start of a
+    longer file, and so may end part way through a multi-byte character.
+    """
+    for mark, encoding in _BYTE_ORDER_MARKS:
+        if data.startswith(mark):
+            return encoding
+    if data.isascii():
+        # NOTE: Ascii is a subset of utf-8, but chardet would have said
+        # ascii, and the encoding is reported in some outputs.
+        return "ascii"
+    try:
+        # An incomplete character at the end of a sample isn't an error.
+        codecs.getincrementaldecoder("utf-8")().decode(data, final=not truncated)
+    except UnicodeDecodeError:
+        pass
+    else:
+        return "utf-8"
+    return chardet.detect(data[:ENCODING_SAMPLE_BYTES])["encoding"] or "utf-8"
+
+
+def _get_cached_encoding(fname: str, data: bytes, stat: os.stat_result) -> str:
+    """Detect the encoding of a file, reusing the result if it's unchanged."""
+    key = (os.path.abspath(fname), stat.st_size, stat.st_mtime_ns)
+    try:
+        encoding = _encoding_cache[key]
+        _encoding_cache.move_to_end(key)
+        return encoding
+    except KeyError:
+        pass
+    encoding = _encoding_cache[key] = detect_encoding(data)
+    if len(_encoding_cache) > ENCODING_CACHE_SIZE:
+        _encoding_cache.popitem(last=False)
+    return encoding
+
 
 def get_encoding(fname: str, config_encoding: str = "autodetect") -> str:
     """Get the encoding of the file (autodetect)."""
@@ -14,7 +74,28 @@ def get_encoding(fname: str, config_encoding: str = "autodetect") -> str:
 
     with open(fname, "rb") as f:
         data = f.read()
-    return chardet.detect(data)["encoding"]
+        stat = os.fstat(f.fileno())
+    return _get_cached_encoding(fname, data, stat)
+
+
+def read_file(fname: str, config_encoding: str = "autodetect") -> Tuple[str, str]:
+    """Read a file, returning its contents and encoding.
+
+    The file is only read once, both to detect its encoding (if set to
+    autodetect) and to decode it. As when reading in text mode, newlines
+    are normalised, and characters which can't be decoded are escaped.
+    """
+    with open(fname, "rb") as f:
+        data = f.read()
+        stat = os.fstat(f.fileno())
+    if config_encoding == "autodetect":
+        encoding = _get_cached_encoding(fname, data, stat)
+    else:
+        encoding = config_encoding
+    contents = data.decode(encoding, errors="backslashreplace")
+    if "\r" in contents:
+        contents = contents.replace("\r\n", "\n").replace("\r", "\n")
+    return contents, encoding
 
 
 def iter_intermediate_paths(inner_path: Path, outer_path: Path) -> Iterator[Path]:
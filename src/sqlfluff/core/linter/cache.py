@@ -0,0 +1,413 @@
+"""Defines the on-disk lint cache.
+
+The cache stores the violations found in a file, keyed on everything which
+could change them: the content of the file, its path, the effective config
+for that file and the versions of sqlfluff and any installed plugins. On a
+subsequent run, a file with a matching entry can be reported without
+templating, parsing or linting it again.
+
+NOTE: For templated files, the key does not include the content of any
+*other* files which the template might reference (e.g. jinja macros or
+includes). Changes to those files will not invalidate the cache.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sqlfluff.core.config import FluffConfig
+from sqlfluff.core.errors import (
+    SerializedObject,
+    SQLBaseError,
+    SQLLexError,
+    SQLLintError,
+    SQLParseError,
+    SQLTemplaterError,
+    SQLUnusedNoQaWarning,
+)
+from sqlfluff.core.linter.linted_file import LintedFile
+from sqlfluff.core.rules import BaseRule, RulePack
+
+# Instantiate the linter logger
+linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
+
+
+class CachedLintError(SQLLintError):
+    """A linting error restored from the lint cache.
+
+    The segment which originally caused the error isn't available, so this
+    holds the position, fixability and serialised form of the original
+    error instead.
+    """
+
+    def __init__(
+        self,
+        description: str,
+        rule: BaseRule,
+        line_no: int,
+        line_pos: int,
+        record: SerializedObject,
+        fixable: bool = False,
+        ignore: bool = False,
+        fatal: bool = False,
+        warning: Optional[bool] = None,
+    ) -> None:
+        self.segment = None  # type: ignore[assignment]
+        self.rule = rule
+        self.fixes = []
+        self.record = record
+        self._fixable = fixable
+        SQLBaseError.__init__(
+            self,
+            description=description,
+            line_no=line_no,
+            line_pos=line_pos,
+            ignore=ignore,
+            fatal=fatal,
+            warning=warning,
+        )
+
+    def __reduce__(self) -> Tuple[Type["CachedLintError"], Tuple[Any, ...]]:
+        """Prepare the CachedLintError for pickling."""
+        return type(self), (
+            self.description,
+            self.rule,
+            self.line_no,
+            self.line_pos,
+            self.record,
+            self._fixable,
+            self.ignore,
+            self.fatal,
+            self.warning,
+        )
+
+    def to_dict(self) -> SerializedObject:
+        """Return the serialised form of the original error."""
+        return dict(self.record)
+
+    @property
+    def fixable(self) -> bool:
+        """Was the original error fixable?"""
+        return self._fixable
+
+
+class CachedParseError(SQLParseError):
+    """A parsing error restored from the lint cache.
+
+    Like `CachedLintError`, this holds the serialised form of the original
+    error in place of the unparsable segment.
+    """
+
+    def __init__(
+        self,
+        description: str,
+        line_no: int,
+        line_pos: int,
+        record: SerializedObject,
+        ignore: bool = False,
+        fatal: bool = False,
+        warning: Optional[bool] = None,
+    ) -> None:
+        self.record = record
+        super().__init__(
+            description=description,
+            line_no=line_no,
+            line_pos=line_pos,
+            ignore=ignore,
+            fatal=fatal,
+            warning=warning,
+        )
+
+    def __reduce__(self) -> Tuple[Type["CachedParseError"], Tuple[Any, ...]]:
+        """Prepare the CachedParseError for pickling."""
+        return type(self), (
+            self.description,
+            self.line_no,
+            self.line_pos,
+            self.record,
+            self.ignore,
+            self.fatal,
+            self.warning,
+        )
+
+    def to_dict(self) -> SerializedObject:
+        """Return the serialised form of the original error."""
+        return dict(self.record)
+
+
+# The non-linting errors which can be restored from the cache. Errors
+# from linting rules are handled separately because they need a rule.
+_RESTORABLE_ERRORS: Dict[str, Type[SQLBaseError]] = {
+    cls.__name__: cls
+    for cls in (
+        SQLBaseError,
+        SQLTemplaterError,
+        SQLLexError,
+        SQLUnusedNoQaWarning,
+    )
+}
+
+
+@lru_cache(maxsize=1)
+def _environment_fingerprint() -> str:
+    """Identify the installed versions of sqlfluff and any plugins."""
+    # NOTE: We import here to avoid circular imports.
+    from sqlfluff.core.plugin.host import _discover_plugins, _get_sqlfluff_version
+
+    plugins = sorted(f"{name}=={version}" for _, name, version in _discover_plugins())
+    return ",".join([f"sqlfluff=={_get_sqlfluff_version()}", *plugins])
+
+
+def _serialise_violation(violation: SQLBaseError) -> Optional[Dict[str, Any]]:
+    """Serialise a violation for the cache, or None if that isn't possible."""
+    if isinstance(violation, SQLLintError):
+        error_type = "lint"
+    elif isinstance(violation, SQLParseError):
+        error_type = "parse"
+    elif type(violation).__name__ in _RESTORABLE_ERRORS:
+        error_type = type(violation).__name__
+    else:  # pragma: no cover
+        return None
+    return {
+        "type": error_type,
+        "code": violation.rule_code(),
+        "description": violation.desc(),
+        "line_no": violation.line_no,
+        "line_pos": violation.line_pos,
+        "ignore": violation.ignore,
+        "fatal": violation.fatal,
+        "warning": violation.warning,
+        "fixable": violation.fixable,
+        "record": violation.to_dict(),
+    }
+
+
+def _restore_violation(
+    entry: Dict[str, Any], rules: Dict[str, BaseRule]
+) -> Optional[SQLBaseError]:
+    """Restore a serialised violation, or None if that isn't possible."""
+    kwargs = {
+        "description": entry["description"],
+        "line_no": entry["line_no"],
+        "line_pos": entry["line_pos"],
+        "ignore": entry["ignore"],
+        "fatal": entry["fatal"],
+        "warning": entry["warning"],
+    }
+    if entry["type"] == "lint":
+        rule = rules.get(entry["code"])
+        if not rule:
+            return None
+        return CachedLintError(
+            rule=rule, record=entry["record"], fixable=entry["fixable"], **kwargs
+        )
+    if entry["type"] == "parse":
+        return CachedParseError(record=entry["record"], **kwargs)
+    error_class = _RESTORABLE_ERRORS.get(entry["type"])
+    if not error_class:  # pragma: no cover
+        return None
+    return error_class(**kwargs)
+
+
+class LintCache:
+    """An on-disk cache of linting results.
+
+    Each entry is stored as a separate json file, so that entries can be
+    written safely from several worker processes at once. Entries are
+    evicted once they exceed a maximum age, or (least recently used first)
+    once the cache exceeds a maximum total size.
+
+    Args:
+        cache_dir (str): The directory to store the cache in.
+        max_age_days (float): The age after which an unused entry is evicted.
+            Zero disables age-based eviction.
+        max_size_mb (float): The maximum total size of the cache. Zero
+            disables size-based eviction.
+    """
+
+    def __init__(
+        self, cache_dir: str, max_age_days: float = 0, max_size_mb: float = 0
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.entry_dir = os.path.join(cache_dir, "lint")
+        self.max_age_days = max_age_days
+        self.max_size_mb = max_size_mb
+
+    @classmethod
+    def from_config(cls, config: FluffConfig) -> Optional["LintCache"]:
+        """Create a cache from the config, or return None if disabled."""
+        if not config.get("lint_cache", default=False):
+            return None
+        return cls(
+            cache_dir=config.get("lint_cache_dir", default=".sqlfluff_cache"),
+            max_age_days=config.get("lint_cache_max_age_days", default=0) or 0,
+            max_size_mb=config.get("lint_cache_max_size_mb", default=0) or 0,
+        )
+
+    @staticmethod
+    def key(
+        fname: str,
+        raw_str: str,
+        config: FluffConfig,
+        user_rules: List[Type[BaseRule]],
+    ) -> str:
+        """Generate the cache key for a file."""
+        hasher = hashlib.sha256()
+        for part in (
+            _environment_fingerprint(),
+            os.path.normpath(os.path.abspath(fname)),
+            config.fingerprint(),
+            ",".join(f"{r.__module__}.{r.__qualname__}" for r in user_rules),
+            raw_str,
+        ):
+            hasher.update(part.encode("utf8"))
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.entry_dir, key[:2], key + ".json")
+
+    def get(
+        self, key: str, fname: str, rule_pack: RulePack, fix: bool = False
+    ) -> Optional[LintedFile]:
+        """Fetch the cached result for a file, if present.
+
+        When fixing, only clean files are served from the cache, because
+        fixing a file requires the parse tree.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if fix and entry["violations"]:
+            return None
+
+        rules = {rule.code: rule for rule in rule_pack.rules}
+        violations: List[SQLBaseError] = []
+        for violation_entry in entry["violations"]:
+            violation = _restore_violation(violation_entry, rules)
+            if violation is None:  # pragma: no cover
+                return None
+            violations.append(violation)
+
+        # Touch the entry so that eviction treats it as recently used.
+        try:
+            os.utime(path)
+        except OSError:  # pragma: no cover
+            pass
+        linter_logger.info("Lint cache hit for %s.", fname)
+        return LintedFile(
+            fname,
+            violations,
+            None,
+            None,
+            ignore_mask=None,
+            templated_file=None,
+            encoding=entry["encoding"],
+            cache_hit=True,
+        )
+
+    def put(
+        self,
+        key: str,
+        linted_file: LintedFile,
+        warn_unused_ignores: bool = False,
+        fix: bool = False,
+    ) -> None:
+        """Store the result for a file.
+
+        Any violations masked by inline ``noqa`` comments are removed before
+        storing (and any warnings for unused ``noqa`` comments are added), so
+        that no ignore mask is needed when the entry is restored.
+
+        When fixing, only clean files are stored, because the violations
+        found while fixing may differ from those found while linting.
+        """
+        violations = linted_file.violations
+        if linted_file.ignore_mask:
+            violations = linted_file.ignore_mask.ignore_masked_violations(violations)
+            if warn_unused_ignores:
+                violations = [
+                    *violations,
+                    *linted_file.ignore_mask.generate_warnings_for_unused(),
+                ]
+        serialised = []
+        for violation in violations:
+            violation_entry = _serialise_violation(violation)
+            if violation_entry is None:  # pragma: no cover
+                return
+            serialised.append(violation_entry)
+        if fix and serialised:
+            return
+
+        path = self._entry_path(key)
+        try:
+            self._ensure_cache_dir()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first, and then move into place so
+            # that other processes never read a partially written entry.
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf8",
+                dir=os.path.dirname(path),
+                suffix=".tmp",
+                delete=False,
+            ) as tmp:
+                json.dump(
+                    {"encoding": linted_file.encoding, "violations": serialised}, tmp
+                )
+            os.replace(tmp.name, path)
+        except OSError as err:  # pragma: no cover
+            linter_logger.warning("Unable to write to lint cache: %s", err)
+
+    def _ensure_cache_dir(self) -> None:
+        """Create the cache directory, ignored by git, if it doesn't exist."""
+        if os.path.isdir(self.entry_dir):
+            return
+        os.makedirs(self.entry_dir, exist_ok=True)
+        with open(os.path.join(self.cache_dir, ".gitignore"), "w") as f:
+            f.write("# Created by sqlfluff automatically.\n*\n")
+
+    def evict(self) -> None:
+        """Evict stale entries by age and then by total size."""
+        if not os.path.isdir(self.entry_dir):
+            return
+        entries: List[Tuple[float, int, str]] = []
+        for dirpath, _, filenames in os.walk(self.entry_dir):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:  # pragma: no cover
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        to_remove: List[str] = []
+        if self.max_age_days:
+            threshold = time.time() - self.max_age_days * 86400
+            to_remove += [path for mtime, _, path in entries if mtime < threshold]
+            entries = [entry for entry in entries if entry[0] >= threshold]
+        if self.max_size_mb:
+            # Remove the least recently used entries until we're under the limit.
+            total_size = sum(size for _, size, _ in entries)
+            max_size = self.max_size_mb * 1024 * 1024
+            for _, size, path in sorted(entries):
+                if total_size <= max_size:
+                    break
+                to_remove.append(path)
+                total_size -= size
+
+        for path in to_remove:
+            try:
+                os.remove(path)
+            except OSError:  # pragma: no cover
+                pass
+        if to_remove:
+            linter_logger.info("Evicted %s lint cache entries.", len(to_remove))
@@ -9,6 +9,7 @@ from sqlfluff.core.errors import (
     SQLParseError,
     SQLTemplaterError,
 )
+from sqlfluff.core.parser.profiler import GrammarProfile
 from sqlfluff.core.parser.segments.base import BaseSegment
 from sqlfluff.core.templaters import TemplatedFile
 
@@ -81,6 +82,8 @@ class ParsedString(NamedTuple):
             including any parsed in-file directives.
         fname (str): The name of the file. Used mostly for user feedback.
         source_str (str): The raw content of the source file.
+        parse_profile (:obj:`GrammarProfile`, optional): Statistics on the
+            grammars matched while parsing, if requested.
     """
 
     parsed_variants: List[ParsedVariant]
@@ -89,6 +92,7 @@ class ParsedString(NamedTuple):
     config: FluffConfig
     fname: str
     source_str: str
+    parse_profile: Optional[GrammarProfile] = None
 
     @property
     def violations(self) -> List[SQLBaseError]:
@@ -8,6 +8,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Set,
     Tuple,
 )
 
@@ -16,6 +17,7 @@ from sqlfluff.core.parser import (
     SourceFix,
 )
 from sqlfluff.core.rules.fix import LintFix
+from sqlfluff.core.tracing import trace_span
 
 if TYPE_CHECKING:  # pragma: no cover
     from sqlfluff.core.dialects import Dialect
@@ -119,6 +121,7 @@ def apply_fixes(
     rule_code: str,
     fixes: Dict[int, AnchorEditInfo],
     fix_even_unparsable: bool = False,
+    changed_uuids: Optional[Set[int]] = None,
 ) -> Tuple["BaseSegment", List["BaseSegment"], List["BaseSegment"], bool]:
     """Apply a dictionary of fixes to this segment.
 
@@ -216,6 +219,8 @@ def apply_fixes(
             consumed_pos = False
             for s in f.edit:
                 seg_buffer.append(s)
+                if changed_uuids is not None:
+                    changed_uuids.update(_s.uuid for _s in s.recursive_crawl_all())
                 # If one of them has the same raw representation
                 # then the first that matches gets to take the
                 # original position marker.
@@ -257,7 +262,9 @@ def apply_fixes(
     seg_queue = seg_buffer
     seg_buffer = []
     for seg in seg_queue:
-        s, pre, post, validated = apply_fixes(seg, dialect, rule_code, fixes)
+        s, pre, post, validated = apply_fixes(
+            seg, dialect, rule_code, fixes, changed_uuids=changed_uuids
+        )
         # 'before' and 'after' will usually be empty. Only used when
         # lower-level fixes left 'seg' with non-code (usually
         # whitespace) segments as the first or last children. This is
@@ -269,6 +276,12 @@ def apply_fixes(
         if not validated:
             requires_validate = True
 
+    # If nothing has changed within this segment, return it as is. That way
+    # unchanged regions of the tree keep their uuids.
+    if not fixes_applied and len(seg_buffer) == len(segment.segments):
+        if all(s is seg for s, seg in zip(seg_buffer, segment.segments)):
+            return segment, [], [], True
+
     # Most correct whitespace positioning will have already been handled
     # _however_, the exception is `replace` edits which match start or
     # end with whitespace. We also need to handle any leading or trailing
@@ -313,6 +326,9 @@ def apply_fixes(
             err.add_note(f" After applying fixes: {fixes_applied}.")
         raise err
 
+    if changed_uuids is not None:
+        changed_uuids.add(new_seg.uuid)
+
     # Handle any necessary validation.
     if requires_validate:
         # Was it already unparsable?
@@ -331,7 +347,8 @@ def apply_fixes(
         # Otherwise only validate if there's a match_grammar. Otherwise we may get
         # strange results (for example with the BracketedSegment).
         elif hasattr(new_seg, "match_grammar"):
-            validated = new_seg.validate_segment_with_reparse(dialect)
+            with trace_span("validate reparse", "fix", segment=new_seg.type):
+                validated = new_seg.validate_segment_with_reparse(dialect)
     else:
         validated = not requires_validate
     # Return the new segment and any non-code that needs to bubble up
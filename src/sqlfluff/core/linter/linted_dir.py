@@ -14,6 +14,8 @@ from sqlfluff.core.errors import (
 )
 from sqlfluff.core.formatter import FormatterInterface
 from sqlfluff.core.linter.linted_file import TMP_PRS_ERROR_TYPES, LintedFile
+from sqlfluff.core.linter.writer import FixedFileWriter
+from sqlfluff.core.parser.profiler import GrammarProfile
 from sqlfluff.core.parser.segments.base import BaseSegment
 
 LintingRecord = TypedDict(
@@ -56,9 +58,13 @@ class LintedDir:
         self._unfiltered_tmp_prs_errors_map: Dict[str, int] = {}
         self.num_tmp_prs_errors: int = 0
         self.num_unfixable_lint_errors: int = 0
+        self._num_cache_hits: int = 0
+        self._num_cache_misses: int = 0
         # Timing
         self.step_timings: List[Dict[str, float]] = []
         self.rule_timings: List[Tuple[str, str, float]] = []
+        # Parse statistics, combined for all files (if enabled).
+        self.parse_profile: Optional[GrammarProfile] = None
 
     def add(self, file: LintedFile) -> None:
         """Add a file to this path.
@@ -128,11 +134,19 @@ class LintedDir:
             types=SQLLintError,
             fixable=False,
         )
+        if file.cache_hit is True:
+            self._num_cache_hits += 1
+        elif file.cache_hit is False:
+            self._num_cache_misses += 1
 
         # Append timings if present
         if file.timings:
             self.step_timings.append(file.timings.step_timings)
             self.rule_timings.extend(file.timings.rule_timings)
+        if file.parse_profile:
+            if not self.parse_profile:
+                self.parse_profile = GrammarProfile()
+            self.parse_profile.merge(file.parse_profile)
 
         # Finally, if set to persist files, do that.
         if self.retain_files:
@@ -199,31 +213,38 @@ class LintedDir:
         return self._records
 
     def stats(self) -> Dict[str, int]:
-        """Return a dict containing linting stats about this path."""
-        return {
+        """Return a dict containing linting stats about this path.
+
+        Lint cache hits and misses are only included if the cache was used.
+        """
+        stats = {
             "files": self._num_files,
             "clean": self._num_clean,
             "unclean": self._num_unclean,
             "violations": self._num_violations,
         }
+        if self._num_cache_hits or self._num_cache_misses:
+            stats["cache hits"] = self._num_cache_hits
+            stats["cache misses"] = self._num_cache_misses
+        return stats
 
     def persist_changes(
         self,
         formatter: Optional[FormatterInterface] = None,
         fixed_file_suffix: str = "",
+        fix_durability: str = "file",
     ) -> Dict[str, Union[bool, str]]:
         """Persist changes to files in the given path.
 
         This also logs the output as we go using the formatter if present.
+        See `FixedFileWriter` for the options for `fix_durability`.
         """
         assert self.retain_files, "cannot `persist_changes()` without `retain_files`"
         # Run all the fixes for all the files and return a dict
-        buffer: Dict[str, Union[bool, str]] = {}
-        for file in self.files:
-            buffer[file.path] = file.persist_tree(
-                suffix=fixed_file_suffix, formatter=formatter
-            )
-        return buffer
+        with FixedFileWriter(durability=fix_durability, formatter=formatter) as writer:
+            for file in self.files:
+                writer.add(file, suffix=fixed_file_suffix)
+        return writer.results
 
     def discard_fixes_for_lint_errors_in_files_with_tmp_or_prs_errors(self) -> None:
         """Discard lint fixes for files with templating or parse errors."""
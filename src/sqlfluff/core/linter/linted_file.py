@@ -12,7 +12,7 @@ import stat
 import tempfile
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
 
 from sqlfluff.core.errors import (
     CheckTuple,
@@ -23,6 +23,7 @@ from sqlfluff.core.errors import (
 )
 from sqlfluff.core.formatter import FormatterInterface
 from sqlfluff.core.linter.patch import FixPatch, generate_source_patches
+from sqlfluff.core.parser.profiler import GrammarProfile
 
 # Classes needed only for type checking
 from sqlfluff.core.parser.segments import BaseSegment
@@ -63,7 +64,23 @@ class FileTimings:
 
 
 class LintedFile(NamedTuple):
-    """A class to store the idea of a linted file."""
+    """A class to store the idea of a linted file.
+
+    If the lint cache is in use, `cache_hit` indicates whether the result
+    was restored from the cache (in which case there is no `tree` or
+    `templated_file`). If the cache is not in use, it is None.
+
+    When tracing is enabled and the file was linted in a worker process,
+    `trace_events` holds the spans recorded while linting it, so that they
+    can be passed back to the main process.
+
+    If the `parse_statistics` config value is set, `parse_profile` holds
+    the statistics on the grammars matched while parsing the file.
+
+    When fixing in parallel, `fix_result` holds the result of `fix_string()`
+    computed within the worker process, so that the main process only has
+    to write it out.
+    """
 
     path: str
     violations: List[SQLBaseError]
@@ -72,6 +89,10 @@ class LintedFile(NamedTuple):
     ignore_mask: Optional[IgnoreMask]
     templated_file: Optional[TemplatedFile]
     encoding: str
+    cache_hit: Optional[bool] = None
+    trace_events: Optional[List[Dict[str, Any]]] = None
+    parse_profile: Optional[GrammarProfile] = None
+    fix_result: Optional[Tuple[str, bool]] = None
 
     def check_tuples(
         self, raise_on_non_linting_violations: bool = True
@@ -208,6 +229,8 @@ class LintedFile(NamedTuple):
         completely dialect agnostic. A Segment is determined by the
         Lexer from portions of strings after templating.
         """
+        if self.fix_result is not None:
+            return self.fix_result
         assert self.templated_file, "Fixing a string requires successful templating."
         linter_logger.debug("Original Tree: %r", self.templated_file.templated_str)
         assert self.tree, "Fixing a string requires successful parsing."
@@ -381,6 +404,24 @@ class LintedFile(NamedTuple):
                 str_buff += raw_source_string[source_slice]
         return str_buff
 
+    def with_fix_result(self) -> "LintedFile":
+        """Return a copy of this file with the result of `fix_string()`.
+
+        This is used to apply fixes within worker processes, so that only
+        writing the files out is left for the main process. Files without
+        any fixable violations are returned unchanged.
+        """
+        if self.fix_result is not None or not self.num_violations(fixable=True):
+            return self
+        return self._replace(fix_result=self.fix_string())
+
+    def fixed_output_path(self, suffix: str = "") -> str:
+        """The path to write the fixed file to, with any suffix."""
+        if not suffix:
+            return self.path
+        root, ext = os.path.splitext(self.path)
+        return root + suffix + ext
+
     def persist_tree(
         self, suffix: str = "", formatter: Optional[FormatterInterface] = None
     ) -> bool:
@@ -389,13 +430,8 @@ class LintedFile(NamedTuple):
             write_buff, success = self.fix_string()
 
             if success:
-                fname = self.path
-                # If there is a suffix specified, then use it.s
-                if suffix:
-                    root, ext = os.path.splitext(fname)
-                    fname = root + suffix + ext
                 self._safe_create_replace_file(
-                    self.path, fname, write_buff, self.encoding
+                    self.path, self.fixed_output_path(suffix), write_buff, self.encoding
                 )
                 result_label = "FIXED"
             else:  # pragma: no cover
@@ -411,7 +447,11 @@ class LintedFile(NamedTuple):
 
     @staticmethod
     def _safe_create_replace_file(
-        input_path: str, output_path: str, write_buff: str, encoding: str
+        input_path: str,
+        output_path: str,
+        write_buff: str,
+        encoding: str,
+        fsync: bool = True,
     ) -> None:
         # Write to a temporary file first, so in case of encoding or other
         # issues, we don't delete or corrupt the user's existing file.
@@ -438,7 +478,8 @@ class LintedFile(NamedTuple):
         ) as tmp:
             tmp.file.write(write_buff)
             tmp.flush()
-            os.fsync(tmp.fileno())
+            if fsync:
+                os.fsync(tmp.fileno())
         # Once the temp file is safely written, replace the existing file.
         if mode is not None:
             os.chmod(tmp.name, mode)
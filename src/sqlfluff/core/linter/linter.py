@@ -30,7 +30,7 @@ from sqlfluff.core.errors import (
     SQLParseError,
     SQLTemplaterError,
 )
-from sqlfluff.core.helpers.file import get_encoding
+from sqlfluff.core.helpers.file import read_file
 from sqlfluff.core.linter.common import (
     ParsedString,
     ParsedVariant,
@@ -46,11 +46,14 @@ from sqlfluff.core.linter.linted_file import (
     LintedFile,
 )
 from sqlfluff.core.linter.linting_result import LintingResult
+from sqlfluff.core.linter.writer import FixedFileWriter
 from sqlfluff.core.parser import Lexer, Parser
+from sqlfluff.core.parser.profiler import GrammarProfile
 from sqlfluff.core.parser.segments.base import BaseSegment, SourceFix
 from sqlfluff.core.rules import BaseRule, RulePack, get_ruleset
 from sqlfluff.core.rules.fix import LintFix
 from sqlfluff.core.rules.noqa import IgnoreMask
+from sqlfluff.core.tracing import trace_span
 
 if TYPE_CHECKING:  # pragma: no cover
     from sqlfluff.core.dialects import Dialect
@@ -132,9 +135,9 @@ class Linter:
         fname: str, root_config: FluffConfig
     ) -> Tuple[str, FluffConfig, str]:
         """Load a raw file and the associated config."""
-        file_config = root_config.make_child_from_path(fname)
+        with trace_span("load config", "stage", file=fname):
+            file_config = root_config.make_child_from_path(fname, shared=True)
         config_encoding: str = file_config.get("encoding", default="autodetect")
-        encoding = get_encoding(fname=fname, config_encoding=config_encoding)
         # Check file size before loading.
         limit = file_config.get("large_file_skip_byte_limit")
         if limit:
@@ -148,10 +151,12 @@ class Linter:
                     "'large_file_skip_byte_limit' value, or disable by setting it "
                     "to zero."
                 )
-        with open(fname, encoding=encoding, errors="backslashreplace") as target_file:
-            raw_file = target_file.read()
-        # Scan the raw file for config commands.
-        file_config.process_raw_file_for_config(raw_file, fname)
+        raw_file, encoding = read_file(fname, config_encoding=config_encoding)
+        # Scan the raw file for config commands. The config is shared with
+        # other files in the same directory, so copy it before changing it.
+        if "sqlfluff" in raw_file:
+            file_config = file_config.copy()
+            file_config.process_raw_file_for_config(raw_file, fname)
         # Return the raw file and config
         return raw_file, file_config, encoding
 
@@ -224,6 +229,7 @@ class Linter:
         config: FluffConfig,
         fname: Optional[str] = None,
         parse_statistics: bool = False,
+        profile: Optional[GrammarProfile] = None,
     ) -> Tuple[Optional[BaseSegment], List[SQLParseError]]:
         parser = Parser(config=config)
         violations = []
@@ -236,6 +242,7 @@ class Linter:
                 tuple(tokens),
                 fname=fname,
                 parse_statistics=parse_statistics,
+                profile=profile,
             )
         except SQLParseError as err:
             linter_logger.info("PARSING FAILED! : %s", err)
@@ -315,25 +322,38 @@ class Linter:
         rendered: RenderedFile,
         parse_statistics: bool = False,
     ) -> ParsedString:
-        """Parse a rendered file."""
+        """Parse a rendered file.
+
+        If `parse_statistics` is set (or the `parse_statistics` config value
+        is set), then a profile of the grammars matched while parsing each
+        variant is recorded in the `parse_profile` of the result.
+        """
         tokens: Optional[Sequence[BaseSegment]]
         parsed_variants: List[ParsedVariant] = []
         _lexing_time = 0.0
         _parsing_time = 0.0
+        profile = (
+            GrammarProfile()
+            if parse_statistics
+            or rendered.config.get("parse_statistics", default=False)
+            else None
+        )
 
         for idx, variant in enumerate(rendered.templated_variants):
             t0 = time.monotonic()
             linter_logger.info("Parse Rendered. Lexing Variant %s", idx)
-            tokens, lex_errors = cls._lex_templated_file(variant, rendered.config)
+            with trace_span("lex", "stage", file=rendered.fname, variant=idx):
+                tokens, lex_errors = cls._lex_templated_file(variant, rendered.config)
             t1 = time.monotonic()
             linter_logger.info("Parse Rendered. Parsing Variant %s", idx)
             if tokens:
-                parsed, parse_errors = cls._parse_tokens(
-                    tokens,
-                    rendered.config,
-                    fname=rendered.fname,
-                    parse_statistics=parse_statistics,
-                )
+                with trace_span("parse", "stage", file=rendered.fname, variant=idx):
+                    parsed, parse_errors = cls._parse_tokens(
+                        tokens,
+                        rendered.config,
+                        fname=rendered.fname,
+                        profile=profile,
+                    )
             else:  # pragma: no cover
                 parsed = None
                 parse_errors = []
@@ -365,6 +385,7 @@ class Linter:
             config=rendered.config,
             fname=rendered.fname,
             source_str=rendered.source_str,
+            parse_profile=profile,
         )
 
     @classmethod
@@ -411,6 +432,20 @@ class Linter:
             ignore_mask = None
 
         save_tree = tree
+        # To avoid running rules which can't find anything in this file, we
+        # index the types of segment present in the tree. This is rebuilt
+        # when fixes are applied (cheaply, because unchanged segments keep
+        # their cached type sets).
+        dialect = config.get("dialect_obj")
+        segment_types = tree.descendant_type_set | tree.class_types
+        # To avoid re-evaluating rules over regions of the tree which haven't
+        # changed, we track the uuids of any segments changed by each set of
+        # fixes (keyed by the number of fixes applied so far), and the number
+        # of fixes which had been applied when each rule last ran and found
+        # nothing to fix.
+        changed_at: Dict[int, int] = {}
+        last_crawled: Dict[str, int] = {}
+        fixes_applied = 0
         # There are two phases of rule running.
         # 1. The main loop is for most rules. These rules are assumed to
         # interact and cause a cascade of fixes requiring multiple passes.
@@ -453,6 +488,34 @@ class Linter:
                     disable=progress_bar_configuration.disable_progress_bar,
                 )
 
+                # Performance: When only linting, rules don't affect each
+                # other, so those which support it are run together in a
+                # single traversal of the tree, rather than one per rule.
+                crawled_together: Dict[
+                    str, Tuple[List[SQLLintError], List[LintFix], float]
+                ] = {}
+                if not fix:
+                    with trace_span("rules", "rule", file=fname) as span:
+                        crawled_together = BaseRule.crawl_together(
+                            [
+                                rule
+                                for rule in rules_this_phase
+                                if rule.is_applicable(segment_types, dialect)
+                            ],
+                            tree,
+                            dialect=dialect,
+                            fix=fix,
+                            templated_file=templated_file,
+                            ignore_mask=ignore_mask,
+                            fname=fname,
+                            config=config,
+                        )
+                        # The rules are interleaved, so just record the time
+                        # spent evaluating each one.
+                        span["rules"] = {
+                            code: result[2] for code, result in crawled_together.items()
+                        }
+
                 for crawler in progress_bar_crawler:
                     # Performance: After first loop pass, skip rules that don't
                     # do fixes. Any results returned won't be seen by the user
@@ -466,7 +529,38 @@ class Linter:
                     ):
                         continue
 
+                    # Performance: After first loop pass, rules which support it
+                    # only evaluate the regions of the tree which have changed
+                    # since they last ran. If nothing has changed, skip them.
+                    # NOTE: This is only safe if the rule found nothing to fix
+                    # last time. If it did, those fixes may not have been
+                    # applied (e.g. because they would cause a loop), and
+                    # whether they are accepted can depend on changes elsewhere
+                    # in the file, so it must look at the whole tree again.
+                    changed_uuids: Optional[Set[int]] = None
+                    if (
+                        fix
+                        and not is_first_linter_pass()
+                        and crawler.is_context_local
+                        and crawler.code in last_crawled
+                    ):
+                        changed_uuids = {
+                            uuid
+                            for uuid, n in changed_at.items()
+                            if n > last_crawled[crawler.code]
+                        }
+                        if not changed_uuids:
+                            continue
+                    last_crawled[crawler.code] = fixes_applied
+
                     progress_bar_crawler.set_description(f"rule {crawler.code}")
+
+                    # Performance: Skip rules which can't find anything in
+                    # this file, e.g. because none of the segment types they
+                    # look for are present.
+                    if not crawler.is_applicable(segment_types, dialect):
+                        continue
+
                     t0 = time.monotonic()
 
                     # fixes should be a dict {} with keys edit, delete, create
@@ -474,17 +568,35 @@ class Linter:
                     # edit and create are list of tuples. The first element is
                     # the "anchor", the segment to look for either to edit or to
                     # insert BEFORE. The second is the element to insert or create.
-                    linting_errors, _, fixes, _ = crawler.crawl(
-                        tree,
-                        dialect=config.get("dialect_obj"),
-                        fix=fix,
-                        templated_file=templated_file,
-                        ignore_mask=ignore_mask,
-                        fname=fname,
-                        config=config,
-                    )
+                    if crawler.code in crawled_together:
+                        linting_errors, fixes, eval_time = crawled_together[
+                            crawler.code
+                        ]
+                        # Attribute the time spent evaluating the rule above.
+                        t0 -= eval_time
+                    else:
+                        with trace_span(
+                            "rule",
+                            "rule",
+                            file=fname,
+                            rule=crawler.code,
+                            phase=phase,
+                            loop=loop,
+                        ):
+                            linting_errors, _, fixes, _ = crawler.crawl(
+                                tree,
+                                dialect=dialect,
+                                fix=fix,
+                                templated_file=templated_file,
+                                ignore_mask=ignore_mask,
+                                fname=fname,
+                                config=config,
+                                changed_uuids=changed_uuids,
+                            )
                     if is_first_linter_pass():
                         initial_linting_errors += linting_errors
+                    if fixes:
+                        last_crawled.pop(crawler.code, None)
 
                     if fix and fixes:
                         linter_logger.info(f"Applying Fixes [{crawler.code}]: {fixes}")
@@ -523,13 +635,20 @@ class Linter:
                             # This is the happy path. We have fixes, now we want to
                             # apply them.
                             last_fixes = fixes
-                            new_tree, _, _, _valid = apply_fixes(
-                                tree,
-                                config.get("dialect_obj"),
-                                crawler.code,
-                                anchor_info,
-                                fix_even_unparsable=config.get("fix_even_unparsable"),
-                            )
+                            new_uuids: Set[int] = set()
+                            with trace_span(
+                                "apply fixes", "fix", file=fname, rule=crawler.code
+                            ):
+                                new_tree, _, _, _valid = apply_fixes(
+                                    tree,
+                                    config.get("dialect_obj"),
+                                    crawler.code,
+                                    anchor_info,
+                                    fix_even_unparsable=config.get(
+                                        "fix_even_unparsable"
+                                    ),
+                                    changed_uuids=new_uuids,
+                                )
 
                             # Check for infinite loops. We use a combination of the
                             # fixed templated file and the list of source fixes to
@@ -558,8 +677,15 @@ class Linter:
                                 # We've not seen this version of the file so
                                 # far. Continue.
                                 tree = new_tree
+                                segment_types = (
+                                    tree.descendant_type_set | tree.class_types
+                                )
                                 previous_versions.add(loop_check_tuple)
                                 changed = True
+                                fixes_applied += 1
+                                changed_at.update(
+                                    (uuid, fixes_applied) for uuid in new_uuids
+                                )
                                 continue
                             else:
                                 # Applying these fixes took us back to a state
@@ -649,20 +775,21 @@ class Linter:
         if root_variant:
             linter_logger.info("lint_parsed - linting root variant (%s)", parsed.fname)
             assert root_variant.tree  # We just checked this.
-            (
-                fixed_tree,
-                initial_linting_errors,
-                ignore_mask,
-                rule_timings,
-            ) = cls.lint_fix_parsed(
-                root_variant.tree,
-                config=parsed.config,
-                rule_pack=rule_pack,
-                fix=fix,
-                fname=parsed.fname,
-                templated_file=variant.templated_file,
-                formatter=formatter,
-            )
+            with trace_span("lint", "stage", file=parsed.fname, fix=fix):
+                (
+                    fixed_tree,
+                    initial_linting_errors,
+                    ignore_mask,
+                    rule_timings,
+                ) = cls.lint_fix_parsed(
+                    root_variant.tree,
+                    config=parsed.config,
+                    rule_pack=rule_pack,
+                    fix=fix,
+                    fname=parsed.fname,
+                    templated_file=variant.templated_file,
+                    formatter=formatter,
+                )
 
             # Set legacy variables for now
             # TODO: Revise this
@@ -743,6 +870,7 @@ class Linter:
             ignore_mask=ignore_mask,
             templated_file=templated_file,
             encoding=encoding,
+            parse_profile=parsed.parse_profile,
         )
 
         # This is the main command line output from linting.
@@ -841,27 +969,29 @@ class Linter:
         templated_variants: List[TemplatedFile] = []
         templater_violations: List[SQLTemplaterError] = []
 
-        try:
-            for variant, templater_errs in self.templater.process_with_variants(
-                in_str=in_str, fname=fname, config=config, formatter=self.formatter
-            ):
-                if variant:
-                    templated_variants.append(variant)
-                # NOTE: We could very easily end up with duplicate errors between
-                # different variants and this code doesn't currently do any
-                # deduplication between them. That will be resolved in further
-                # testing.
-                # TODO: Resolve potential duplicate templater violations between
-                # variants before we enable jinja variant linting by default.
-                templater_violations += templater_errs
-                if len(templated_variants) >= variant_limit:
-                    # Stop if we hit the limit.
-                    break
-        except SQLTemplaterError as templater_err:
-            # Fatal templating error. Capture it and don't generate a variant.
-            templater_violations.append(templater_err)
-        except SQLFluffSkipFile as skip_file_err:  # pragma: no cover
-            linter_logger.warning(str(skip_file_err))
+        with trace_span("template", "stage", file=fname) as span:
+            try:
+                for variant, templater_errs in self.templater.process_with_variants(
+                    in_str=in_str, fname=fname, config=config, formatter=self.formatter
+                ):
+                    if variant:
+                        templated_variants.append(variant)
+                    # NOTE: We could very easily end up with duplicate errors between
+                    # different variants and this code doesn't currently do any
+                    # deduplication between them. That will be resolved in further
+                    # testing.
+                    # TODO: Resolve potential duplicate templater violations between
+                    # variants before we enable jinja variant linting by default.
+                    templater_violations += templater_errs
+                    if len(templated_variants) >= variant_limit:
+                        # Stop if we hit the limit.
+                        break
+            except SQLTemplaterError as templater_err:
+                # Fatal templating error. Capture it and don't generate a variant.
+                templater_violations.append(templater_err)
+            except SQLFluffSkipFile as skip_file_err:  # pragma: no cover
+                linter_logger.warning(str(skip_file_err))
+            span["variants"] = len(templated_variants)
 
         if not templated_variants:
             linter_logger.info("TEMPLATING FAILED: %s", templater_violations)
@@ -1085,33 +1215,40 @@ class Linter:
             disable=files_count <= 1 or progress_bar_configuration.disable_progress_bar,
         )
 
-        for i, linted_file in enumerate(runner.run(expanded_paths, fix), start=1):
-            linted_dir = expanded_path_to_linted_dir[linted_file.path]
-            linted_dir.add(linted_file)
-            # If any fatal errors, then stop iteration.
-            if any(v.fatal for v in linted_file.violations):  # pragma: no cover
-                linter_logger.error("Fatal linting error. Halting further linting.")
-                break
+        # Fixed files are written out in the background, while linting continues.
+        with FixedFileWriter(
+            durability=self.config.get("fix_durability", default="file"),
+            formatter=self.formatter,
+        ) as writer:
+            for i, linted_file in enumerate(runner.run(expanded_paths, fix), start=1):
+                linted_dir = expanded_path_to_linted_dir[linted_file.path]
+                linted_dir.add(linted_file)
+                # If any fatal errors, then stop iteration.
+                if any(v.fatal for v in linted_file.violations):  # pragma: no cover
+                    linter_logger.error("Fatal linting error. Halting further linting.")
+                    break
 
-            # If we're applying fixes, then do that here.
-            if apply_fixes:
-                num_tmp_prs_errors = linted_file.num_violations(
-                    types=TMP_PRS_ERROR_TYPES,
-                    filter_ignore=False,
-                    filter_warning=False,
-                )
-                if fix_even_unparsable or num_tmp_prs_errors == 0:
-                    linted_file.persist_tree(
-                        suffix=fixed_file_suffix, formatter=self.formatter
+                # If we're applying fixes, then do that here.
+                if apply_fixes:
+                    num_tmp_prs_errors = linted_file.num_violations(
+                        types=TMP_PRS_ERROR_TYPES,
+                        filter_ignore=False,
+                        filter_warning=False,
                     )
-
-            # Progress bar for files is rendered only when there is more than one file.
-            # Additionally, as it's updated after each loop, we need to get file name
-            # from the next loop. This is why `enumerate` starts with `1` and there
-            # is `i < len` to not exceed files list length.
-            progress_bar_files.update(n=1)
-            if i < len(expanded_paths):
-                progress_bar_files.set_description(f"file {expanded_paths[i]}")
+                    if fix_even_unparsable or num_tmp_prs_errors == 0:
+                        writer.add(linted_file, suffix=fixed_file_suffix)
+
+                # Progress bar for files is rendered only when there is more than
+                # one file. Additionally, as it's updated after each loop, we need
+                # to get file name from the next loop. This is why `enumerate`
+                # starts with `1` and there is `i < len` to not exceed files list
+                # length.
+                progress_bar_files.update(n=1)
+                if i < len(expanded_paths):
+                    progress_bar_files.set_description(f"file {expanded_paths[i]}")
+
+        if runner.lint_cache:
+            runner.lint_cache.evict()
 
         result.stop_timer()
         return result
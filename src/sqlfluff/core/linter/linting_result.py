@@ -20,6 +20,7 @@ from typing import (
 from sqlfluff.core.errors import CheckTuple, SQLBaseError
 from sqlfluff.core.formatter import FormatterInterface
 from sqlfluff.core.linter.linted_dir import LintedDir, LintingRecord
+from sqlfluff.core.parser.profiler import GrammarProfile
 from sqlfluff.core.timing import RuleTimingSummary, TimingSummary
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -143,6 +144,19 @@ class LintingResult:
             rules_timing.add(dir.rule_timings)
         return {**timing.summary(), **rules_timing.summary()}
 
+    def parse_profile(self) -> Optional[GrammarProfile]:
+        """Return the parse statistics, combined across all files.
+
+        This is None unless the `parse_statistics` config value is set.
+        """
+        profile: Optional[GrammarProfile] = None
+        for dir in self.paths:
+            if dir.parse_profile:
+                if not profile:
+                    profile = GrammarProfile()
+                profile.merge(dir.parse_profile)
+        return profile
+
     def persist_timing_records(self, filename: str) -> None:
         """Persist the timing records as a csv for external analysis."""
         meta_fields = [
@@ -202,13 +216,18 @@ class LintingResult:
         )
 
     def persist_changes(
-        self, formatter: Optional[FormatterInterface], fixed_file_suffix: str = ""
+        self,
+        formatter: Optional[FormatterInterface],
+        fixed_file_suffix: str = "",
+        fix_durability: str = "file",
     ) -> Dict[str, Union[bool, str]]:
         """Run all the fixes for all the files and return a dict."""
         return combine_dicts(
             *(
                 path.persist_changes(
-                    formatter=formatter, fixed_file_suffix=fixed_file_suffix
+                    formatter=formatter,
+                    fixed_file_suffix=fixed_file_suffix,
+                    fix_durability=fix_durability,
                 )
                 for path in self.paths
             )
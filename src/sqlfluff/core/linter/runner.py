@@ -7,28 +7,101 @@ Implements various runner types for SQLFluff:
   - Multithread (used only by automated tests)
 """
 
+import atexit
 import bdb
 import functools
 import logging
 import multiprocessing
 import multiprocessing.dummy
 import multiprocessing.pool
+import os
 import signal
 import sys
 import traceback
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
 from types import TracebackType
-from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from sqlfluff.core import FluffConfig, Linter
 from sqlfluff.core.errors import SQLFluffSkipFile
 from sqlfluff.core.linter import LintedFile, RenderedFile
+from sqlfluff.core.linter.cache import LintCache
+from sqlfluff.core.linter.streaming import (
+    STREAMING_TEMPLATERS,
+    lint_file_streaming,
+    load_streamed_config,
+)
 from sqlfluff.core.plugin.host import is_main_process
+from sqlfluff.core.rules import BaseRule, RulePack
+from sqlfluff.core.tracing import (
+    add_trace_events,
+    is_tracing,
+    start_tracing,
+    stop_tracing,
+    trace_span,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from sqlfluff.core.templaters import RawTemplater
 
 linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
 
 PartialLintCallable = Callable[[], LintedFile]
 
+# Objects derived from config, cached per process and keyed on the config
+# fingerprint. Within long lived worker processes, this means the cost of
+# building them is paid once per worker rather than once per file. Configs
+# which vary file by file (e.g. with inline config directives) would grow
+# these without limit, so the rule pack cache is bounded.
+RULE_PACK_CACHE_SIZE = 32
+_rule_pack_cache: "OrderedDict[Tuple[str, Tuple[str, ...]], RulePack]" = OrderedDict()
+_templater_cache: Dict[str, "RawTemplater"] = {}
+
+
+def get_cached_rulepack(
+    config: FluffConfig, user_rules: List[Type[BaseRule]]
+) -> RulePack:
+    """Get a rule pack for the given config, reusing one if already built."""
+    key = (
+        config.fingerprint(),
+        tuple(f"{rule.__module__}.{rule.__qualname__}" for rule in user_rules),
+    )
+    try:
+        rule_pack = _rule_pack_cache[key]
+        _rule_pack_cache.move_to_end(key)
+        return rule_pack
+    except KeyError:
+        pass
+    rule_pack = Linter(config=config, user_rules=user_rules).get_rulepack(config=config)
+    _rule_pack_cache[key] = rule_pack
+    if len(_rule_pack_cache) > RULE_PACK_CACHE_SIZE:
+        _rule_pack_cache.popitem(last=False)
+    return rule_pack
+
+
+def get_cached_templater(config: FluffConfig) -> "RawTemplater":
+    """Get a templater for the given config, reusing one if already built."""
+    key = config.fingerprint()
+    templater = _templater_cache.get(key)
+    if templater is None:
+        templater = _templater_cache[key] = config.get_templater()
+    return templater
+
 
 class BaseRunner(ABC):
     """Base runner class."""
@@ -40,8 +113,15 @@ class BaseRunner(ABC):
     ) -> None:
         self.linter = linter
         self.config = config
+        self.lint_cache = LintCache.from_config(config)
 
     pass_formatter = True
+    # Whether to load and render files within the partial (and therefore
+    # within the worker) rather than ahead of time in the main process.
+    render_in_partial = False
+    # Whether to build rule packs within the partial (using the per-process
+    # cache) rather than building a fresh one for each file and passing it.
+    cache_rule_packs = False
 
     def iter_rendered(self, fnames: List[str]) -> Iterator[Tuple[str, RenderedFile]]:
         """Iterate through rendered files ready for linting."""
@@ -62,20 +142,118 @@ class BaseRunner(ABC):
 
         Generates filenames and objects which return LintedFiles.
         """
+        streaming_limit = self.config.get("streaming_lint_byte_limit", default=0)
+        if (
+            streaming_limit
+            and not fix
+            and self.linter.templater.name in STREAMING_TEMPLATERS
+        ):
+            # Large files are linted statement by statement, rather than
+            # being loaded whole. They bypass the lint cache.
+            streamed = {
+                fname for fname in fnames if os.path.getsize(fname) > streaming_limit
+            }
+            for fname in fnames:
+                if fname in streamed:
+                    yield fname, functools.partial(
+                        _stream_and_lint_file,
+                        fname,
+                        self.config,
+                        self.linter.user_rules,
+                        self.linter.formatter if self.pass_formatter else None,
+                    )
+            fnames = [fname for fname in fnames if fname not in streamed]
+
+        if self.render_in_partial:
+            # Only pass the path and root config. Loading, templating, lexing,
+            # parsing and linting all then happen within the partial.
+            for fname in self.linter.templater.sequence_files(
+                fnames, config=self.config, formatter=self.linter.formatter
+            ):
+                yield (
+                    fname,
+                    functools.partial(
+                        _render_and_lint_file,
+                        fname,
+                        self.config,
+                        self.linter.user_rules,
+                        fix,
+                        self.lint_cache,
+                    ),
+                )
+            return
+
+        if self.lint_cache:
+            yield from self._iter_cached_partials(fnames, self.lint_cache, fix)
+            return
+
         for fname, rendered in self.iter_rendered(fnames):
-            # Generate a fresh ruleset
-            rule_pack = self.linter.get_rulepack(config=rendered.config)
-            yield (
+            yield fname, self._lint_partial(rendered, fix)
+
+    def _lint_partial(self, rendered: RenderedFile, fix: bool) -> PartialLintCallable:
+        """Generate a partial to lint a rendered file."""
+        if self.cache_rule_packs:
+            return functools.partial(
+                _lint_rendered_file,
+                rendered,
+                self.linter.user_rules,
+                fix,
+            )
+        # Generate a fresh ruleset
+        rule_pack = self.linter.get_rulepack(config=rendered.config)
+        return functools.partial(
+            self.linter.lint_rendered,
+            rendered,
+            rule_pack,
+            fix,
+            # Formatters may or may not be passed. They don't pickle
+            # nicely so aren't appropriate in a multiprocessing world.
+            self.linter.formatter if self.pass_formatter else None,
+        )
+
+    def _iter_cached_partials(
+        self, fnames: List[str], lint_cache: LintCache, fix: bool
+    ) -> Iterator[Tuple[str, PartialLintCallable]]:
+        """Iterate through partials, using the lint cache where possible.
+
+        Files with an entry in the cache aren't rendered at all. The partial
+        for those files just returns the cached result.
+        """
+        for fname in self.linter.templater.sequence_files(
+            fnames, config=self.config, formatter=self.linter.formatter
+        ):
+            try:
+                raw_file, config, encoding = self.linter.load_raw_file_and_config(
+                    fname, self.config
+                )
+            except SQLFluffSkipFile as s:
+                linter_logger.warning(str(s))
+                continue
+            key = LintCache.key(fname, raw_file, config, self.linter.user_rules)
+            cached = lint_cache.get(
+                key,
                 fname,
-                functools.partial(
-                    self.linter.lint_rendered,
-                    rendered,
-                    rule_pack,
-                    fix,
-                    # Formatters may or may not be passed. They don't pickle
-                    # nicely so aren't appropriate in a multiprocessing world.
-                    self.linter.formatter if self.pass_formatter else None,
-                ),
+                get_cached_rulepack(config, self.linter.user_rules),
+                fix,
+            )
+            if cached:
+                if self.pass_formatter and self.linter.formatter:
+                    self.linter.formatter.dispatch_file_violations(
+                        fname,
+                        cached,
+                        only_fixable=fix,
+                        warn_unused_ignores=config.get("warn_unused_ignores"),
+                    )
+                yield fname, functools.partial(_return_cached, cached)
+                continue
+            rendered = self.linter.render_string(raw_file, fname, config, encoding)
+            yield fname, functools.partial(
+                _lint_and_store,
+                self._lint_partial(rendered, fix),
+                lint_cache,
+                key,
+                config.get("warn_unused_ignores"),
+                fix,
             )
 
     @abstractmethod
@@ -97,6 +275,11 @@ class BaseRunner(ABC):
         if isinstance(e, IOError):
             # IOErrors are caught in commands.py, so propagate it
             raise (e)  # pragma: no cover
+        if isinstance(e, SQLFluffSkipFile):
+            # If files are loaded within the worker, skips are raised from
+            # there. Handle them in the same way as in `iter_rendered`.
+            linter_logger.warning(str(e))
+            return
         linter_logger.warning(
             f"""Unable to lint {fname} due to an internal error. \
 Please report this as an issue with your query's contents and stacktrace below!
@@ -112,7 +295,9 @@ class SequentialRunner(BaseRunner):
         """Sequential implementation."""
         for fname, partial in self.iter_partials(fnames, fix=fix):
             try:
-                yield partial()
+                with trace_span("file", "file", file=fname):
+                    linted_file = partial()
+                yield linted_file
             except (bdb.BdbQuit, KeyboardInterrupt):  # pragma: no cover
                 raise
             except Exception as e:
@@ -126,10 +311,18 @@ class ParallelRunner(BaseRunner):
     # Don't pass the formatter in a parallel world, they
     # don't pickle well.
     pass_formatter = False
+    cache_rule_packs = True
+    # Pools which are kept alive between runs, keyed by runner class and
+    # number of processes. Shared across all parallel runner classes.
+    _persistent_pools: ClassVar[
+        Dict[Tuple[Type["ParallelRunner"], int], multiprocessing.pool.Pool]
+    ] = {}
 
     def __init__(self, linter: Linter, config: FluffConfig, processes: int) -> None:
         super().__init__(linter, config)
         self.processes = processes
+        self.render_in_partial = config.get("parallel_templating", default=False)
+        self.persistent_pool = config.get("persistent_worker_pool", default=False)
 
     def run(self, fnames: List[str], fix: bool) -> Iterator[LintedFile]:
         """Parallel implementation.
@@ -139,14 +332,16 @@ class ParallelRunner(BaseRunner):
         the main thread can do the IO work while passing the parsing
         and linting work out to the threads.
         """
-        with self._create_pool(
-            self.processes,
-            self._init_global,
-        ) as pool:
+        # Rule packs are built within the workers, but the results which
+        # come back reference the rule classes. Load the rules here first
+        # (via the plugin manager) so that they're not first imported
+        # while unpickling those results.
+        get_cached_rulepack(self.config, self.linter.user_rules)
+        with self._pool() as pool:
             try:
                 for lint_result in self._map(
                     pool,
-                    self._apply,
+                    functools.partial(self._apply, trace=is_tracing(), fix=fix),
                     self.iter_partials(fnames, fix=fix),
                 ):
                     if isinstance(lint_result, DelayedException):
@@ -156,6 +351,9 @@ class ParallelRunner(BaseRunner):
                             self._handle_lint_path_exception(lint_result.fname, e)
                     else:
                         # It's a LintedDir.
+                        if lint_result.trace_events:
+                            add_trace_events(lint_result.trace_events)
+                            lint_result = lint_result._replace(trace_events=None)
                         if self.linter.formatter:
                             self.linter.formatter.dispatch_file_violations(
                                 lint_result.path,
@@ -172,20 +370,96 @@ class ParallelRunner(BaseRunner):
                 # in case it takes awhile.
                 print("Received keyboard interrupt. Cleaning up and shutting down...")
                 pool.terminate()
+                self._discard_persistent_pool(pool)
+
+    @contextmanager
+    def _pool(self) -> Iterator[multiprocessing.pool.Pool]:
+        """Provide a pool, either freshly created or persistent.
+
+        Persistent pools are created on first use and then reused by any
+        later runs with the same runner class and number of processes. This
+        means that the startup cost of each worker (and the cost of warming
+        its caches) is paid once, rather than once per run.
+        """
+        initargs = (self.config, self.linter.user_rules)
+        if not self.persistent_pool:
+            with self._create_pool(
+                self.processes, self._init_worker, initargs
+            ) as fresh_pool:
+                yield fresh_pool
+            return
+
+        key = (self.__class__, self.processes)
+        pool = self._persistent_pools.get(key)
+        if pool is None:
+            linter_logger.info(
+                "Creating persistent pool of %s workers.", self.processes
+            )
+            pool = self._create_pool(self.processes, self._init_worker, initargs)
+            self._persistent_pools[key] = pool
+        try:
+            yield pool
+        except BaseException:
+            # If the run did not complete (e.g. it was abandoned part way
+            # through), then the pool may still have outstanding work. Shut
+            # it down rather than reusing it.
+            self._discard_persistent_pool(pool)
+            pool.terminate()
+            raise
+
+    @classmethod
+    def _discard_persistent_pool(cls, pool: multiprocessing.pool.Pool) -> None:
+        """Stop tracking a pool so that it isn't reused."""
+        for key, persistent_pool in list(cls._persistent_pools.items()):
+            if persistent_pool is pool:
+                del cls._persistent_pools[key]
+
+    @classmethod
+    def close_persistent_pools(cls) -> None:
+        """Shut down any persistent pools.
+
+        This is called automatically on exit, but may also be called
+        directly to release the worker processes sooner.
+        """
+        while cls._persistent_pools:
+            _, pool = cls._persistent_pools.popitem()
+            pool.close()
+            pool.join()
 
     @staticmethod
     def _apply(
         partial_tuple: Tuple[str, PartialLintCallable],
+        trace: bool = False,
+        fix: bool = False,
     ) -> Union["DelayedException", LintedFile]:
-        """Shim function used in parallel mode."""
+        """Shim function used in parallel mode.
+
+        If `trace` is set but tracing isn't enabled here, then we're in a
+        worker process, so the spans for the file are recorded and returned
+        with the result.
+
+        If `fix` is set, then the fixed file is also generated here, so that
+        the main process only needs to write it out.
+        """
         # Unpack the tuple and ditch the filename in this case.
         fname, partial = partial_tuple
+        in_worker = trace and not is_tracing()
+        if in_worker:
+            start_tracing()
         try:
-            return partial()
+            with trace_span("file", "file", file=fname):
+                linted_file = partial()
+                if fix:
+                    linted_file = linted_file.with_fix_result()
         # Capture any exceptions and return as delayed exception to handle
         # in the main thread.
         except Exception as e:
             return DelayedException(e, fname=fname)
+        finally:
+            events = stop_tracing() if in_worker else None
+        if events:
+            return linted_file._replace(trace_events=events)
+        return linted_file
 
     @classmethod
     def _init_global(cls) -> None:  # pragma: no cover
@@ -193,11 +467,30 @@ class ParallelRunner(BaseRunner):
         is_main_process.set(False)
         super()._init_global()
 
+    @classmethod
+    def _init_worker(
+        cls, config: FluffConfig, user_rules: List[Type[BaseRule]]
+    ) -> None:  # pragma: no cover
+        """Initialise global state and warm the caches for a worker.
+
+        Building the rule pack also loads the plugins and rules, and
+        unpickling the config loads the dialect. Doing this up front means
+        the first file each worker receives isn't penalised for it.
+        """
+        cls._init_global()
+        get_cached_rulepack(config, user_rules)
+        get_cached_templater(config)
+
     @classmethod
     def _create_pool(
-        cls, processes: int, initializer: Callable[[], None]
+        cls,
+        processes: int,
+        initializer: Callable[..., None],
+        initargs: Tuple[Any, ...] = (),
     ) -> multiprocessing.pool.Pool:
-        return cls.POOL_TYPE(processes=processes, initializer=initializer)
+        return cls.POOL_TYPE(
+            processes=processes, initializer=initializer, initargs=initargs
+        )
 
     @classmethod
     @abstractmethod
@@ -216,6 +509,10 @@ class ParallelRunner(BaseRunner):
         ...
 
 
+# Make sure any persistent worker processes are shut down cleanly on exit.
+atexit.register(ParallelRunner.close_persistent_pools)
+
+
 class MultiProcessRunner(ParallelRunner):
     """Runner that does parallel processing using multiple processes."""
 
@@ -281,6 +578,97 @@ class MultiThreadRunner(ParallelRunner):
         return pool.imap(func=func, iterable=iterable)
 
 
+def _render_and_lint_file(
+    fname: str,
+    root_config: FluffConfig,
+    user_rules: List[Type[BaseRule]],
+    fix: bool,
+    lint_cache: Optional[LintCache] = None,
+) -> LintedFile:
+    """Load, render and lint a single file.
+
+    This is used as the partial when `parallel_templating` is enabled, and
+    so is designed to be called within a worker process. Only the arguments
+    (rather than any rendered file or rule pack) need to be passed across
+    the process boundary.
+    """
+    linter = Linter(config=root_config, user_rules=user_rules)
+    # The templater object isn't passed when the config is pickled, so
+    # use one from this process.
+    linter.templater = get_cached_templater(root_config)
+    raw_file, config, encoding = linter.load_raw_file_and_config(fname, root_config)
+    rule_pack = get_cached_rulepack(config, user_rules)
+    if not lint_cache:
+        rendered = linter.render_string(raw_file, fname, config, encoding)
+        return linter.lint_rendered(rendered, rule_pack, fix)
+    key = LintCache.key(fname, raw_file, config, user_rules)
+    cached = lint_cache.get(key, fname, rule_pack, fix)
+    if cached:
+        return cached
+    rendered = linter.render_string(raw_file, fname, config, encoding)
+    return _lint_and_store(
+        functools.partial(linter.lint_rendered, rendered, rule_pack, fix),
+        lint_cache,
+        key,
+        config.get("warn_unused_ignores"),
+        fix,
+    )
+
+
+def _stream_and_lint_file(
+    fname: str,
+    root_config: FluffConfig,
+    user_rules: List[Type[BaseRule]],
+    formatter: Any = None,
+) -> LintedFile:
+    """Lint a large untemplated file statement by statement.
+
+    Like `_render_and_lint_file`, the file and its config are loaded within
+    the partial, but the file is read and linted in sections rather than
+    being loaded whole.
+    """
+    linter = Linter(config=root_config, user_rules=user_rules)
+    linter.templater = get_cached_templater(root_config)
+    config = load_streamed_config(fname, root_config)
+    rule_pack = get_cached_rulepack(config, user_rules)
+    return lint_file_streaming(linter, fname, config, rule_pack, formatter)
+
+
+def _lint_rendered_file(
+    rendered: RenderedFile,
+    user_rules: List[Type[BaseRule]],
+    fix: bool,
+) -> LintedFile:
+    """Lint a rendered file using a cached rule pack.
+
+    This is used as the partial for parallel runners, and so is designed to
+    be called within a worker process.
+    """
+    rule_pack = get_cached_rulepack(rendered.config, user_rules)
+    return Linter.lint_rendered(rendered, rule_pack, fix)
+
+
+def _return_cached(linted_file: LintedFile) -> LintedFile:
+    """Return a result from the lint cache.
+
+    This is used as the partial for files with an entry in the lint cache.
+    """
+    return linted_file
+
+
+def _lint_and_store(
+    partial: PartialLintCallable,
+    lint_cache: LintCache,
+    key: str,
+    warn_unused_ignores: bool,
+    fix: bool,
+) -> LintedFile:
+    """Lint a file using the given partial, and store the result in the cache."""
+    linted_file = partial()
+    lint_cache.put(key, linted_file, warn_unused_ignores, fix)
+    return linted_file._replace(cache_hit=False)
+
+
 class DelayedException(Exception):
     """Multiprocessing process pool uses this to propagate exceptions."""
 
@@ -0,0 +1,367 @@
+"""Lint large untemplated files statement by statement.
+
+Normally a file is read into memory whole, and then lexed, parsed and linted
+as one tree which is kept until the end of the run. For files which aren't
+templated (i.e. using the raw or placeholder templaters) we can instead read
+the file through a memory mapped buffer, split it into sections of whole
+statements and lint each section in turn. Violations are dispatched as each
+section is linted and the tree for each section is discarded, so peak memory
+depends on the size of the largest statement rather than the whole file.
+
+NOTE: Rules which look at the start or the end of the file (LT13 and LT12)
+are only applied to the first and last sections respectively. Any other
+rules which consider more than one statement at a time will only see the
+statements within each section.
+"""
+
+import logging
+import mmap
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlfluff.core.config import FluffConfig
+from sqlfluff.core.errors import SQLBaseError, SQLFluffSkipFile, SQLParseError
+from sqlfluff.core.helpers.file import ENCODING_SAMPLE_BYTES, detect_encoding
+from sqlfluff.core.linter.cache import _restore_violation, _serialise_violation
+from sqlfluff.core.linter.linted_file import FileTimings, LintedFile
+from sqlfluff.core.linter.linter import Linter
+from sqlfluff.core.parser.profiler import GrammarProfile
+from sqlfluff.core.rules import BaseRule, RulePack
+from sqlfluff.core.rules.noqa import IgnoreMask, NoQaDirective
+
+# Instantiate the linter logger
+linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
+
+# The templaters which leave the source unchanged (other than substituting
+# placeholders), and so can be linted in sections.
+STREAMING_TEMPLATERS = ("raw", "placeholder")
+# Statements are batched into sections of at least this many bytes. Each
+# section has some overhead, but linting time grows faster than linearly
+# with the size of each section, so they're kept small.
+SECTION_BYTES = 2048
+# If a section doesn't parse, it's likely that it was split in the wrong
+# place (e.g. on a semicolon inside a procedure body). It's then linted
+# together with the following sections, up to this many times.
+MAX_SECTION_MERGES = 4
+
+# Rules which only make sense at the start or end of a file.
+_FILE_START_RULES = ("LT13",)
+_FILE_END_RULES = ("LT12",)
+
+# The tokens which matter when splitting statements. Comments and quoted
+# strings are matched whole so that any semicolons or brackets within them
+# are skipped.
+_SPLIT_TOKEN_REGEX = re.compile(
+    rb"--[^\n]*"
+    rb"|/\*.*?\*/"
+    rb"|'(?:[^'\\]|\\.)*'"
+    rb'|"[^"]*"'
+    rb"|`[^`]*`"
+    rb"|[;()]",
+    re.DOTALL,
+)
+# Any trailing whitespace and comment on the same line as a semicolon is kept
+# with the preceding statement (so that any noqa comment stays with it).
+_STATEMENT_TAIL_REGEX = re.compile(rb"[ \t]*(?:--[^\n]*)?\r?\n?")
+# Inline config directives, which must be found before linting any section.
+_INLINE_CONFIG_REGEX = re.compile(rb"^--[ ]?sqlfluff[^\r\n]*", re.MULTILINE)
+# Descriptions of unparsable sections which include their position.
+_PARSE_ERROR_POSITION_REGEX = re.compile(r"^Line \d+, Position \d+:")
+
+
+def iter_statement_bounds(buffer: Any) -> Iterator[Tuple[int, int]]:
+    """Iterate the byte offsets of each statement in a buffer.
+
+    Statements are split after each semicolon which isn't in brackets,
+    a comment or a quoted string. The bounds cover the whole buffer.
+    """
+    depth = 0
+    start = 0
+    for match in _SPLIT_TOKEN_REGEX.finditer(buffer):
+        token = match.group()
+        if token == b"(":
+            depth += 1
+        elif token == b")":
+            depth = max(depth - 1, 0)
+        elif token == b";" and not depth:
+            tail = _STATEMENT_TAIL_REGEX.match(buffer, match.end())
+            end = tail.end() if tail else match.end()
+            yield start, end
+            start = end
+    if start < len(buffer):
+        yield start, len(buffer)
+
+
+def _iter_sections(
+    bounds: List[Tuple[int, int]], section_bytes: int
+) -> Iterator[Tuple[int, int]]:
+    """Batch statement bounds into sections of at least `section_bytes`."""
+    section_start: Optional[int] = None
+    for start, end in bounds:
+        if section_start is None:
+            section_start = start
+        if end - section_start >= section_bytes:
+            yield section_start, end
+            section_start = None
+    if section_start is not None:
+        yield section_start, bounds[-1][1]
+
+
+def _detect_encoding(buffer: Any, config_encoding: str) -> str:
+    """Detect the encoding of a buffer from a sample of it."""
+    if config_encoding != "autodetect":
+        return config_encoding
+    sample = buffer[:ENCODING_SAMPLE_BYTES]
+    return detect_encoding(sample, truncated=len(buffer) > len(sample))
+
+
+def _shift_position(
+    position: Dict[str, Any], line_offset: int, pos_offset: int, char_offset: int
+) -> None:
+    """Shift a serialised position from a section into file space."""
+    for prefix in ("start", "end"):
+        line_no = position.get(f"{prefix}_line_no")
+        if line_no is None:
+            continue
+        if line_no == 1:
+            position[f"{prefix}_line_pos"] += pos_offset
+        position[f"{prefix}_line_no"] = line_no + line_offset
+        if f"{prefix}_file_pos" in position:
+            position[f"{prefix}_file_pos"] += char_offset
+
+
+class _StreamedSection:
+    """The position of a section within the file being streamed."""
+
+    def __init__(self, text: str, line_offset: int, pos_offset: int, char_offset: int):
+        self.text = text
+        self.line_offset = line_offset
+        self.pos_offset = pos_offset
+        self.char_offset = char_offset
+
+    def shift_violation(
+        self, violation: SQLBaseError, rules: Dict[str, BaseRule]
+    ) -> Optional[SQLBaseError]:
+        """Shift a violation into file space, dropping its segment."""
+        entry = _serialise_violation(violation)
+        if entry is None:  # pragma: no cover
+            return None
+        entry["line_pos"] += self.pos_offset if entry["line_no"] == 1 else 0
+        entry["line_no"] += self.line_offset
+        record = entry["record"]
+        if entry["type"] == "parse":
+            entry["description"] = record["description"] = (
+                _PARSE_ERROR_POSITION_REGEX.sub(
+                    f"Line {entry['line_no']}, Position {entry['line_pos']}:",
+                    entry["description"],
+                )
+            )
+        _shift_position(record, self.line_offset, self.pos_offset, self.char_offset)
+        for fix in record.get("fixes", []):
+            _shift_position(fix, self.line_offset, self.pos_offset, self.char_offset)
+        return _restore_violation(entry, rules)
+
+    def shift_directive(self, directive: NoQaDirective) -> NoQaDirective:
+        """Shift a noqa directive into file space."""
+        if directive.line_no == 1:
+            directive.line_pos += self.pos_offset
+        directive.line_no += self.line_offset
+        return directive
+
+
+def load_streamed_config(fname: str, root_config: FluffConfig) -> FluffConfig:
+    """Load the config for a file which will be streamed.
+
+    Like `Linter.load_raw_file_and_config`, this includes any inline config
+    directives in the file, but without reading the whole file into memory.
+    """
+    file_config = root_config.make_child_from_path(fname, shared=True)
+    with open(fname, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        encoding = _detect_encoding(
+            buffer, file_config.get("encoding", default="autodetect")
+        )
+        directives = [
+            match.group().decode(encoding, errors="backslashreplace")
+            for match in _INLINE_CONFIG_REGEX.finditer(buffer)
+        ]
+    if directives:
+        file_config = file_config.copy()
+        file_config.process_raw_file_for_config("\n".join(directives), fname)
+    return file_config
+
+
+def lint_file_streaming(
+    linter: Linter,
+    fname: str,
+    config: FluffConfig,
+    rule_pack: RulePack,
+    formatter: Any = None,
+) -> LintedFile:
+    """Lint a file section by section, dispatching violations as we go.
+
+    The returned `LintedFile` has no tree. Any noqa directives have already
+    been applied to its violations, but are kept in its ignore mask so that
+    any which are unused can still be reported.
+    """
+    rules = {rule.code: rule for rule in rule_pack.rules}
+    violations: List[SQLBaseError] = []
+    step_timings: Dict[str, float] = defaultdict(float)
+    rule_timings: Dict[Tuple[str, str], float] = defaultdict(float)
+    parse_profile: Optional[GrammarProfile] = None
+    # Range directives apply until the end of the file, but single line
+    # directives can be retired once linting has moved past their line.
+    range_directives: List[NoQaDirective] = []
+    line_directives: List[NoQaDirective] = []
+    unused_directives: List[NoQaDirective] = []
+    show_filename = True
+
+    with open(fname, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        encoding = _detect_encoding(
+            buffer, config.get("encoding", default="autodetect")
+        )
+        if ";".encode(encoding) == b";":
+            bounds = list(iter_statement_bounds(buffer))
+        else:  # pragma: no cover
+            # We can only split encodings where a semicolon is a single byte.
+            bounds = [(0, len(buffer))]
+        limit = config.get("large_file_skip_byte_limit")
+        largest = max(end - start for start, end in bounds)
+        if limit and largest > limit:
+            raise SQLFluffSkipFile(
+                f"The largest statement in file {fname!r} is {largest} bytes "
+                f"which is over the limit of {limit} bytes. Skipping to avoid "
+                "parser lock. Users can increase this limit in their config by "
+                "setting the 'large_file_skip_byte_limit' value, or disable by "
+                "setting it to zero."
+            )
+        sections = list(_iter_sections(bounds, SECTION_BYTES))
+
+        line_offset = pos_offset = char_offset = 0
+        merge_start: Optional[int] = None
+        merges = 0
+        for idx, (start, end) in enumerate(sections):
+            if merge_start is not None:
+                start = merge_start
+            is_last = idx == len(sections) - 1
+            section = _StreamedSection(
+                Linter._normalise_newlines(
+                    buffer[start:end].decode(encoding, errors="backslashreplace")
+                ),
+                line_offset,
+                pos_offset,
+                char_offset,
+            )
+            rendered = linter.render_string(section.text, fname, config, encoding)
+            parsed = linter.parse_rendered(rendered)
+            if parsed.parse_profile:
+                if not parse_profile:
+                    parse_profile = GrammarProfile()
+                parse_profile.merge(parsed.parse_profile)
+            if (
+                not is_last
+                and merges < MAX_SECTION_MERGES
+                and any(isinstance(v, SQLParseError) for v in parsed.violations)
+            ):
+                linter_logger.info(
+                    "Section of %s at line %s didn't parse. Merging with the next.",
+                    fname,
+                    line_offset + 1,
+                )
+                merge_start = start
+                merges += 1
+                continue
+            merge_start = None
+            merges = 0
+            linted_section = linter.lint_parsed(
+                parsed, rule_pack, fix=False, encoding=encoding
+            )
+            del rendered, parsed
+
+            if linted_section.timings:
+                for step, step_time in linted_section.timings.step_timings.items():
+                    step_timings[step] += step_time
+                for code, name, rule_time in linted_section.timings.rule_timings:
+                    rule_timings[(code, name)] += rule_time
+
+            skipped_rules = (_FILE_START_RULES if start else ()) + (
+                () if is_last else _FILE_END_RULES
+            )
+            section_violations = []
+            for violation in linted_section.violations:
+                if violation.rule_code() in skipped_rules:
+                    continue
+                shifted = section.shift_violation(violation, rules)
+                if shifted:
+                    section_violations.append(shifted)
+
+            # Apply any noqa directives.
+            if linted_section.ignore_mask:
+                first_line = line_offset + 1
+                unused_directives += [
+                    d for d in line_directives if d.line_no < first_line and not d.used
+                ]
+                line_directives = [
+                    d for d in line_directives if d.line_no >= first_line
+                ]
+                for directive in linted_section.ignore_mask.directives:
+                    section.shift_directive(directive)
+                    if directive.action:
+                        range_directives.append(directive)
+                    else:
+                        line_directives.append(directive)
+            if range_directives or line_directives:
+                section_violations = IgnoreMask(
+                    range_directives + line_directives
+                ).ignore_masked_violations(section_violations)
+
+            violations += section_violations
+            if formatter:
+                shown = [v for v in section_violations if not v.ignore]
+                formatter.dispatch_streamed_violations(fname, shown, show_filename)
+                show_filename = show_filename and not shown
+            del linted_section
+
+            # Move the offsets on to the end of this section.
+            line_offset += section.text.count("\n")
+            last_newline = section.text.rfind("\n")
+            if last_newline >= 0:
+                pos_offset = len(section.text) - last_newline - 1
+            else:
+                pos_offset += len(section.text)
+            char_offset += len(section.text)
+
+    # Keep the remaining directives, so that warnings can be generated for
+    # any which weren't used.
+    ignore_mask = IgnoreMask(unused_directives + line_directives + range_directives)
+    if formatter and config.get("warn_unused_ignores"):
+        unused = ignore_mask.generate_warnings_for_unused()
+        formatter.dispatch_streamed_violations(fname, unused, show_filename)
+        show_filename = show_filename and not unused
+
+    linted_file = LintedFile(
+        fname,
+        violations,
+        FileTimings(
+            dict(step_timings),
+            [(code, name, t) for (code, name), t in rule_timings.items()],
+        ),
+        None,
+        ignore_mask=ignore_mask,
+        templated_file=None,
+        encoding=encoding,
+        parse_profile=parse_profile,
+    )
+    if formatter:
+        if show_filename:
+            # Nothing has been dispatched yet, so dispatch as normal.
+            formatter.dispatch_file_violations(
+                fname, linted_file, only_fixable=False, warn_unused_ignores=False
+            )
+        if linted_file.get_violations(types=SQLParseError):
+            formatter.dispatch_dialect_warning(config.get("dialect"))
+    return linted_file
@@ -0,0 +1,212 @@
+"""Writing out fixed files.
+
+When fixing many files, writing each one out (and waiting for it to be
+flushed to disk) in the main process as results come back means that
+linting stalls while the disk catches up. The `FixedFileWriter` instead
+writes files out in batches on a pool of threads, so that the writing
+overlaps with linting.
+
+How hard to try to make sure the files are on disk before moving on is
+set by the `fix_durability` config value:
+
+- "file": Each file is flushed to disk before it replaces the original
+  (the default, and how files have always been written).
+- "directory": Files aren't flushed individually, but once a batch of
+  files has been written, each directory they're in is flushed once.
+  This is much faster on some systems but if the machine crashes soon
+  after fixing, some fixed files may be left empty on some filesystems.
+- "none": Leave flushing entirely to the operating system.
+"""
+
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import TracebackType
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple, Type, Union
+
+from sqlfluff.core.errors import SQLFluffUserError
+from sqlfluff.core.formatter import FormatterInterface
+from sqlfluff.core.linter.linted_file import LintedFile
+
+# Instantiate the linter logger
+linter_logger: logging.Logger = logging.getLogger("sqlfluff.linter")
+
+FIX_DURABILITY_MODES = ("file", "directory", "none")
+# The number of files written by each task, and the number of threads
+# writing them out. Writing is mostly waiting on the disk, so more threads
+# than processors can be useful.
+WRITE_BATCH_SIZE = 32
+WRITER_THREADS = 4
+
+
+class _PendingWrite(NamedTuple):
+    """A fixed file waiting to be written."""
+
+    input_path: str
+    output_path: str
+    write_buff: str
+    encoding: str
+
+
+def _fsync_directory(path: str) -> None:
+    """Flush a directory, so that any files moved into it are on disk."""
+    try:
+        fd = os.open(path or ".", os.O_RDONLY)
+    except OSError:  # pragma: no cover
+        # Directories can't be opened on some platforms (e.g. Windows).
+        return
+    try:
+        os.fsync(fd)
+    except OSError:  # pragma: no cover
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_batch(batch: List[_PendingWrite], durability: str) -> None:
+    """Write out a batch of files (called within the writer threads)."""
+    for write in batch:
+        LintedFile._safe_create_replace_file(
+            write.input_path,
+            write.output_path,
+            write.write_buff,
+            write.encoding,
+            fsync=durability == "file",
+        )
+    if durability == "directory":
+        for dirname in sorted({os.path.dirname(w.output_path) for w in batch}):
+            _fsync_directory(dirname)
+
+
+class FixedFileWriter:
+    """Writes out fixed files in batches, on a pool of threads.
+
+    Files are added with `add()`. Any which have fixes are written out in
+    the background and the result for each file is passed to the formatter
+    (in the order they were added) once it's written. Call `close()` (or
+    use the writer as a context manager) to wait for everything to be
+    written. Any errors from writing the files are raised from `add()` or
+    `close()` in the calling thread.
+    """
+
+    def __init__(
+        self,
+        durability: str = "file",
+        formatter: Optional[FormatterInterface] = None,
+        batch_size: int = WRITE_BATCH_SIZE,
+        threads: int = WRITER_THREADS,
+    ) -> None:
+        if durability not in FIX_DURABILITY_MODES:
+            raise SQLFluffUserError(
+                f"Invalid value for `fix_durability`: {durability!r}. "
+                "Expected 'file', 'directory' or 'none'."
+            )
+        self.durability = durability
+        self.formatter = formatter
+        self.batch_size = batch_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="sqlfluff-writer"
+        )
+        self._batch: List[_PendingWrite] = []
+        # The files added so far whose results haven't been dispatched, with
+        # their result label, whether they were fixed successfully and the
+        # task writing them (if any). The first `_batch_start` of them have
+        # been submitted, the rest are waiting in the current batch.
+        self._pending: Deque[Tuple[str, str, bool, Optional[Future]]] = deque()
+        self._batch_start = 0
+        self.results: Dict[str, Union[bool, str]] = {}
+
+    def __enter__(self) -> "FixedFileWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type:
+            # Don't write any more files if something's gone wrong, but
+            # let any which are being written finish.
+            self._batch = []
+            for _, _, _, future in self._pending:
+                if future:
+                    future.cancel()
+            self._executor.shutdown(wait=True)
+            return
+        self.close()
+
+    def add(self, linted_file: LintedFile, suffix: str = "") -> None:
+        """Queue a linted file to be written out, if it has any fixes."""
+        if linted_file.num_violations(fixable=True) > 0:
+            write_buff, success = linted_file.fix_string()
+            if success:
+                self._batch.append(
+                    _PendingWrite(
+                        linted_file.path,
+                        linted_file.fixed_output_path(suffix),
+                        write_buff,
+                        linted_file.encoding,
+                    )
+                )
+                result_label = "FIXED"
+            else:  # pragma: no cover
+                result_label = "FAIL"
+        else:
+            result_label = "SKIP"
+            success = True
+        self._pending.append((linted_file.path, result_label, success, None))
+        # If there's nothing waiting to be written, then there's no need to
+        # wait for a full batch before dispatching the result.
+        if not self._batch or len(self._batch) >= self.batch_size:
+            self._submit_batch()
+        self._dispatch_results(wait=False)
+
+    def close(self) -> Dict[str, Union[bool, str]]:
+        """Wait for all files to be written, and return the results.
+
+        The results map each path to whether it was fixed successfully.
+        """
+        self._submit_batch()
+        try:
+            self._dispatch_results(wait=True)
+        finally:
+            self._executor.shutdown(wait=True)
+        return self.results
+
+    def _submit_batch(self) -> None:
+        """Start writing the files in the current batch."""
+        if self._batch:
+            linter_logger.debug("Writing batch of %s fixed files.", len(self._batch))
+            future = self._executor.submit(_write_batch, self._batch, self.durability)
+            self._batch = []
+        else:
+            future = None
+        # Attach the task to all the files added since the last batch.
+        for idx in range(self._batch_start, len(self._pending)):
+            path, result_label, success, _ = self._pending[idx]
+            self._pending[idx] = (path, result_label, success, future)
+        self._batch_start = len(self._pending)
+
+    def _dispatch_results(self, wait: bool) -> None:
+        """Dispatch the results of any files which have been written.
+
+        Results are dispatched in the order the files were added, so this
+        stops at the first file which hasn't been written yet (or which
+        isn't in a batch yet), unless `wait` is set.
+        """
+        while self._batch_start and self._pending:
+            path, result_label, success, future = self._pending[0]
+            if future:
+                if not wait and not future.done():
+                    return
+                # Raise any errors from writing the batch.
+                future.result()
+            self._pending.popleft()
+            self._batch_start -= 1
+            self.results[path] = success
+            if self.formatter:
+                self.formatter.dispatch_persist_filename(
+                    filename=path, result=result_label
+                )
@@ -27,12 +27,14 @@ from typing import (
 from tqdm import tqdm
 
 from sqlfluff.core.config import progress_bar_configuration
+from sqlfluff.core.errors import SQLFluffUserError
 
 if TYPE_CHECKING:  # pragma: no cover
     from sqlfluff.core.config import FluffConfig
     from sqlfluff.core.dialects.base import Dialect
     from sqlfluff.core.parser.match_result import MatchResult
     from sqlfluff.core.parser.matchable import Matchable
+    from sqlfluff.core.parser.profiler import GrammarProfile
 
 # Get the parser logger
 parser_logger = logging.getLogger("sqlfluff.parser")
@@ -64,6 +66,9 @@ class ParseContext:
         self,
         dialect: "Dialect",
         indentation_config: Optional[Dict[str, Any]] = None,
+        parse_cache_size: int = 0,
+        parse_cache_eviction: str = "lru",
+        profile: Optional["GrammarProfile"] = None,
     ) -> None:
         """Initialize a new instance of the class.
 
@@ -72,7 +77,21 @@ class ParseContext:
             indentation_config (Optional[Dict[str, Any]], optional): The indentation
                 configuration used by Indent and Dedent to control the intended
                 indentation of certain features. Defaults to None.
+            parse_cache_size (int, optional): The maximum number of entries in
+                the parse cache. Defaults to 0, which means unbounded.
+            parse_cache_eviction (str, optional): How to evict entries from the
+                parse cache once it's full. Either "lru" to evict the least
+                recently used entries, or "position" to evict the entries
+                furthest behind the parser. Defaults to "lru".
+            profile (Optional[GrammarProfile], optional): A profile to record
+                statistics on each grammar matched into. Defaults to None,
+                in which case no profile is recorded.
         """
+        if parse_cache_eviction not in ("lru", "position"):
+            raise SQLFluffUserError(
+                "Invalid value for `parse_cache_eviction`: "
+                f"{parse_cache_eviction!r}. Expected 'lru' or 'position'."
+            )
         self.dialect = dialect
         # Indentation config is used by Indent and Dedent and used to control
         # the intended indentation of certain features. Specifically it is
@@ -84,13 +103,21 @@ class ParseContext:
         self.uuid = uuid.uuid4()
         # A dict for parse caching. This is reset for each file,
         # but persists for the duration of an individual file parse.
+        # NOTE: Python dicts preserve insertion order, so the first key
+        # is always the oldest (or least recently used) entry.
         self._parse_cache: Dict[Tuple[Any, ...], "MatchResult"] = {}
+        self.parse_cache_size = parse_cache_size
+        self.parse_cache_eviction = parse_cache_eviction
         # A dictionary for keeping track of some statistics on parsing
         # for performance optimisation.
         # Focused around BaseGrammar._longest_trimmed_match().
-        # Initialise only with "next_counts", the rest will be int
-        # and are dealt with in .increment().
-        self.parse_stats: Dict[str, Any] = {"next_counts": defaultdict(int)}
+        self.parse_stats: Dict[str, Any] = {
+            "next_counts": defaultdict(int),
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "cache_evictions": 0,
+        }
+        self.profile = profile
         # The following attributes are only accessible via a copy
         # and not in the init method.
         # NOTE: We default to the name `File` which is not
@@ -106,6 +133,12 @@ class ParseContext:
         # copying it when necessary.
         # NOTE: Includes inherited parent terminators.
         self.terminators: Tuple["Matchable", ...] = ()
+        # The terminators which `_terminators_key` was last generated for,
+        # along with the key itself. See `terminators_key()`.
+        self._terminators_key: Tuple[Tuple["Matchable", ...], Tuple[str, ...]] = (
+            (),
+            (),
+        )
         # Value for holding a reference to the progress bar.
         self._tqdm: Optional[tqdm[NoReturn]] = None
         # Variable to store whether we're tracking progress. When looking
@@ -136,8 +169,22 @@ class ParseContext:
         return cls(
             dialect=config.get("dialect_obj"),
             indentation_config=indentation_config,
+            parse_cache_size=config.get("parse_cache_size", default=0) or 0,
+            parse_cache_eviction=config.get("parse_cache_eviction", default="lru"),
         )
 
+    def terminators_key(self) -> Tuple[str, ...]:
+        """Get the cache keys of the current terminators.
+
+        These form part of the key for the parse cache. They are only
+        regenerated when the terminators change.
+        """
+        terminators, key = self._terminators_key
+        if terminators is not self.terminators:
+            key = tuple(terminator.cache_key() for terminator in self.terminators)
+            self._terminators_key = (self.terminators, key)
+        return key
+
     def _set_terminators(
         self,
         clear_terminators: bool = False,
@@ -218,6 +265,7 @@ class ParseContext:
         clear_terminators: bool = False,
         push_terminators: Optional[Sequence["Matchable"]] = None,
         track_progress: Optional[bool] = None,
+        profile: bool = False,
     ) -> Iterator["ParseContext"]:
         """Increment match depth.
 
@@ -236,7 +284,14 @@ class ParseContext:
                 tracking for deeper matches. This avoids having the linting
                 progress bar jump forward when performing greedy matches on
                 terminators.
+            profile (:obj:`bool`, optional): Whether to record this match
+                in the profile (if there is one). This should be set when
+                `name` is the name of a segment or grammar in the dialect,
+                rather than a description of part of a grammar. A segment
+                matched directly within a reference to it is only recorded
+                once.
         """
+        _profile = self.profile if profile and name != self.match_segment else None
         self._match_stack.append(self.match_segment)
         self.match_segment = name
         self.match_depth += 1
@@ -247,9 +302,13 @@ class ParseContext:
         elif track_progress is True:  # pragma: no cover
             # We can't go from False to True. Raise an issue if not.
             assert self.track_progress is True, "Cannot set tracking from False to True"
+        if _profile is not None:
+            _profile.start(name, self.match_depth)
         try:
             yield self
         finally:
+            if _profile is not None:
+                _profile.stop()
             self._reset_terminators(
                 _append, _terms, clear_terminators=clear_terminators
             )
@@ -312,10 +371,52 @@ class ParseContext:
 
         If no match is found in the cache, this returns None.
         """
-        return self._parse_cache.get((loc_key, matcher_key))
+        key = (loc_key, matcher_key)
+        match = self._parse_cache.get(key)
+        if self.profile is not None:
+            self.profile.record_cache(match is not None)
+        if match is None:
+            self.parse_stats["cache_misses"] += 1
+            return None
+        self.parse_stats["cache_hits"] += 1
+        if self.parse_cache_size and self.parse_cache_eviction == "lru":
+            # Move the entry to the end, as the most recently used.
+            del self._parse_cache[key]
+            self._parse_cache[key] = match
+        return match
 
     def put_parse_cache(
         self, loc_key: Tuple[Any, ...], matcher_key: str, match: "MatchResult"
     ) -> None:
-        """Store a match in the cache for later retrieval."""
+        """Store a match in the cache for later retrieval.
+
+        If the cache is bounded and this makes it too big, then
+        entries are evicted according to `parse_cache_eviction`.
+        """
         self._parse_cache[(loc_key, matcher_key)] = match
+        if self.parse_cache_size and len(self._parse_cache) > self.parse_cache_size:
+            self._evict_parse_cache()
+
+    def _evict_parse_cache(self) -> None:
+        """Evict entries from the parse cache to bring it back within size.
+
+        For "lru" eviction, this removes the single least recently used
+        entry. For "position" eviction, this removes the quarter of the
+        cache which is furthest behind the parser. Because the parser
+        mostly moves forward through the file, those are the entries
+        least likely to be used again (e.g. for statements it has already
+        moved past). Evicting in batches means that the sorting required
+        to find those entries is only done occasionally.
+        """
+        if self.parse_cache_eviction == "lru":
+            del self._parse_cache[next(iter(self._parse_cache))]
+            self.parse_stats["cache_evictions"] += 1
+            return
+        # NOTE: The second element of the location key is the position
+        # in the templated file.
+        to_evict = sorted(self._parse_cache, key=lambda key: key[0][1])[
+            : max(len(self._parse_cache) - (self.parse_cache_size * 3) // 4, 1)
+        ]
+        for key in to_evict:
+            del self._parse_cache[key]
+        self.parse_stats["cache_evictions"] += len(to_evict)
@@ -143,7 +143,9 @@ class AnyNumberOf(BaseGrammar):
 
         n_matches = 0
         # Keep track of the number of times each option has been matched.
-        option_counter = {elem.cache_key(): 0 for elem in self._elements}
+        # NOTE: Structurally identical options share a cache key, so we
+        # count them by identity instead.
+        option_counter = {id(elem): 0 for elem in self._elements}
         # Keep track of how far we've got.
         matched_idx = idx
         # The working index is to cover non-code elements which aren't
@@ -199,6 +201,7 @@ class AnyNumberOf(BaseGrammar):
                     self._elements,
                     working_idx,
                     ctx,
+                    use_index=True,
                 )
 
             # Did we fail to match?
@@ -220,8 +223,8 @@ class AnyNumberOf(BaseGrammar):
             assert matched_option
 
             # Update counts of each option in case we've hit limits.
-            matched_key = matched_option.cache_key()
-            if matched_option.cache_key() in option_counter:
+            matched_key = id(matched_option)
+            if matched_key in option_counter:
                 option_counter[matched_key] += 1
                 # Check if we have matched an option too many times.
                 if (
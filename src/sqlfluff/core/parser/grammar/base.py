@@ -13,13 +13,13 @@ from typing import (
     TypeVar,
     Union,
 )
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlfluff.core.helpers.string import curtail_string
 from sqlfluff.core.parser.context import ParseContext
 from sqlfluff.core.parser.match_algorithms import greedy_match
 from sqlfluff.core.parser.match_result import MatchResult
-from sqlfluff.core.parser.matchable import Matchable
+from sqlfluff.core.parser.matchable import Matchable, structural_cache_key
 from sqlfluff.core.parser.segments import BaseSegment
 from sqlfluff.core.parser.types import ParseMode, SimpleHintType
 
@@ -165,14 +165,18 @@ class BaseGrammar(Matchable):
             f"(only {self.supported_parse_modes})"
         )
         self.parse_mode = parse_mode
-        # Generate a cache key
-        self._cache_key = uuid4().hex
+        # The cache key is generated when first used, once any
+        # subclass has finished configuring the grammar.
+        self._cache_key: Optional[str] = None
 
     def cache_key(self) -> str:
         """Get the cache key for this grammar.
 
-        For grammars these are unique per-instance.
+        For grammars these are derived from their type and configuration,
+        so structurally identical grammars share the same key.
         """
+        if self._cache_key is None:
+            self._cache_key = structural_cache_key(self)
         return self._cache_key
 
     def is_optional(self) -> bool:
@@ -300,6 +304,7 @@ class BaseGrammar(Matchable):
                     )
         new_grammar = copy.copy(self)
         new_grammar._elements = new_elems
+        new_grammar._cache_key = None
 
         if replace_terminators:  # pragma: no cover
             # Override (NOTE: Not currently used).
@@ -419,6 +424,7 @@ class Ref(BaseGrammar):
             name=self._ref,
             clear_terminators=self.reset_terminators,
             push_terminators=self.terminators,
+            profile=True,
         ) as ctx:
             return elem.match(segments, idx, parse_context)
 
@@ -149,6 +149,8 @@ class Delimited(OneOf):
                     ),
                     idx=working_idx,
                     parse_context=ctx,
+                    # Only our own elements are fixed enough to index.
+                    use_index=not seeking_delimiter,
                 )
 
             if not match:
@@ -168,6 +168,21 @@ class StringLexer:
         else:
             return None
 
+    def _match_at(self, string: str, pos: int) -> Optional[LexedElement]:
+        """Match at a position in a string, without slicing the string."""
+        if string.startswith(self.template, pos):
+            return LexedElement(self.template, self)
+        else:
+            return None
+
+    def could_start_with(self, char: str) -> bool:
+        """Could this matcher match a string starting with this character?
+
+        This is used by the lexer to narrow down which matchers to try at
+        each position.
+        """
+        return self.template.startswith(char)
+
     def search(self, forward_string: str) -> Optional[Tuple[int, int]]:
         """Use string methods to find a substring."""
         loc = forward_string.find(self.template)
@@ -314,6 +329,15 @@ class RegexLexer(StringLexer):
         # do get matched by .
         flags = regex.DOTALL
         self._compiled_regex = regex.compile(self.template, flags)
+        # Anchors, word boundaries and lookbehinds behave differently when
+        # matching at an offset rather than at the start of a string. Patterns
+        # which contain them are matched against a slice so that the results
+        # are the same either way.
+        self._position_sensitive = bool(
+            regex.search(r"(?<!\[)\^|\\[AbBG]|\(\?<[=!]", self.template)
+        )
+        # Cache for `could_start_with()`, by character.
+        self._start_chars: Dict[str, bool] = {}
 
     def _match(self, forward_string: str) -> Optional[LexedElement]:
         """Use regexes to match chunks."""
@@ -330,6 +354,36 @@ class RegexLexer(StringLexer):
                 )
         return None
 
+    def _match_at(self, string: str, pos: int) -> Optional[LexedElement]:
+        """Use regexes to match chunks at a position in a string."""
+        if self._position_sensitive:
+            return self._match(string[pos:])
+        match = self._compiled_regex.match(string, pos)
+        if match:
+            # We can only match strings with length
+            match_str = match.group(0)
+            if match_str:
+                return LexedElement(match_str, self)
+            else:  # pragma: no cover
+                lexer_logger.warning(
+                    f"Zero length Lex item returned from {self.name!r}. Report this as "
+                    "a bug."
+                )
+        return None
+
+    def could_start_with(self, char: str) -> bool:
+        """Could this matcher match a string starting with this character?
+
+        A partial match means that the character could be the start of a
+        match, given the right string after it.
+        """
+        result = self._start_chars.get(char)
+        if result is None:
+            result = self._start_chars[char] = bool(
+                self._compiled_regex.match(char, partial=True)
+            )
+        return result
+
     def search(self, forward_string: str) -> Optional[Tuple[int, int]]:
         """Use regex to find a substring."""
         match = self._compiled_regex.search(forward_string)
@@ -843,23 +897,40 @@ class Lexer:
 
     @staticmethod
     def lex_match(forward_string: str, lexer_matchers: List[StringLexer]) -> LexMatch:
-        """Iteratively match strings using the selection of submatchers."""
+        """Iteratively match strings using the selection of submatchers.
+
+        At each position, the matchers are tried in order and the first to
+        match wins. For performance, only the matchers which could match a
+        string starting with the character at that position are tried, and
+        we work through the string by offset rather than by slicing it.
+        """
         elem_buff: List[LexedElement] = []
-        while True:
-            if len(forward_string) == 0:
-                return LexMatch(forward_string, elem_buff)
-            for matcher in lexer_matchers:
-                res = matcher.match(forward_string)
-                if res.elements:
-                    # If we have new segments then whoop!
-                    elem_buff += res.elements
-                    forward_string = res.forward_string
+        # The matchers to try, by first character.
+        candidates: Dict[str, List[StringLexer]] = {}
+        pos = 0
+        while pos < len(forward_string):
+            char = forward_string[pos]
+            matchers = candidates.get(char)
+            if matchers is None:
+                matchers = candidates[char] = [
+                    matcher
+                    for matcher in lexer_matchers
+                    if matcher.could_start_with(char)
+                ]
+            for matcher in matchers:
+                matched = matcher._match_at(forward_string, pos)
+                if matched:
+                    # If we have new segments then whoop! Handle any
+                    # subdivision and move on.
+                    elem_buff += matcher._subdivide(matched)
+                    pos += len(matched.raw)
                     # Cycle back around again and start with the top
                     # matcher again.
                     break
             else:
                 # We've got so far, but now can't match. Return
-                return LexMatch(forward_string, elem_buff)
+                break
+        return LexMatch(forward_string[pos:], elem_buff)
 
     @staticmethod
     def map_template_slices(
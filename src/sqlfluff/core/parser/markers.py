@@ -3,7 +3,6 @@
 This class is a construct to keep track of positions within a file.
 """
 
-from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from sqlfluff.core.helpers.slice import zero_slice
@@ -12,7 +11,17 @@ if TYPE_CHECKING:
     from sqlfluff.core.templaters import TemplatedFile  # pragma: no cover
 
 
-@dataclass(frozen=True)
+# Source and templated positions are each stored as a single integer, with
+# the start in the high bits and the stop in the low bits. That's far more
+# compact than a `slice` object, and there's one marker per segment.
+_SPAN_BITS = 40
+_SPAN_MASK = (1 << _SPAN_BITS) - 1
+
+
+def _pack_slice(span: slice) -> int:
+    return (span.start << _SPAN_BITS) | span.stop
+
+
 class PositionMarker:
     """A reference to a position in a file.
 
@@ -27,25 +36,73 @@ class PositionMarker:
         - Positions within the fixed file are identified with a line number and line
           position, which identify a point.
         - Arithmetic comparisons are on the location in the fixed file.
+        - Markers are immutable. There is one for every segment, so they use
+          `__slots__` and store their slices packed into integers.
     """
 
-    source_slice: slice
-    templated_slice: slice
+    __slots__ = (
+        "_source",
+        "_templated",
+        "templated_file",
+        "working_line_no",
+        "working_line_pos",
+    )
+
     templated_file: "TemplatedFile"
-    # If not set, these will be initialised in the post init.
-    working_line_no: int = -1
-    working_line_pos: int = -1
+    working_line_no: int
+    working_line_pos: int
 
-    def __post_init__(self) -> None:
+    def __init__(
+        self,
+        source_slice: slice,
+        templated_slice: slice,
+        templated_file: "TemplatedFile",
+        # If not set, these will be inferred from the templated file.
+        working_line_no: int = -1,
+        working_line_pos: int = -1,
+    ) -> None:
+        self._source = _pack_slice(source_slice)
+        self._templated = _pack_slice(templated_slice)
+        self.templated_file = templated_file
         # If the working position has not been explicitly set
         # then infer it from the position in the templated file.
         # This is accurate up until the point that any fixes have
         # been applied.
-        if self.working_line_no == -1 or self.working_line_pos == -1:
-            line_no, line_pos = self.templated_position()
-            # Use the base method because we're working with a frozen class
-            object.__setattr__(self, "working_line_no", line_no)
-            object.__setattr__(self, "working_line_pos", line_pos)
+        if working_line_no == -1 or working_line_pos == -1:
+            working_line_no, working_line_pos = templated_file.get_line_pos_of_char_pos(
+                templated_slice.start, source=False
+            )
+        self.working_line_no = working_line_no
+        self.working_line_pos = working_line_pos
+
+    def __repr__(self) -> str:
+        return (
+            f"PositionMarker(source_slice={self.source_slice!r}, "
+            f"templated_slice={self.templated_slice!r}, "
+            f"templated_file={self.templated_file!r}, "
+            f"working_line_no={self.working_line_no!r}, "
+            f"working_line_pos={self.working_line_pos!r})"
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Prepare the PositionMarker for pickling."""
+        return type(self), (
+            self.source_slice,
+            self.templated_slice,
+            self.templated_file,
+            self.working_line_no,
+            self.working_line_pos,
+        )
+
+    @property
+    def source_slice(self) -> slice:
+        """The slice of the source file covered by this marker."""
+        return slice(self._source >> _SPAN_BITS, self._source & _SPAN_MASK)
+
+    @property
+    def templated_slice(self) -> slice:
+        """The slice of the templated file covered by this marker."""
+        return slice(self._templated >> _SPAN_BITS, self._templated & _SPAN_MASK)
 
     def __str__(self) -> str:
         return self.to_source_string()
@@ -67,6 +124,9 @@ class PositionMarker:
             return False  # pragma: no cover
         return self.working_loc == other.working_loc
 
+    def __hash__(self) -> int:
+        return hash(self.working_loc)
+
     @property
     def working_loc(self) -> Tuple[int, int]:
         """Location tuple for the working position."""
@@ -128,12 +188,12 @@ class PositionMarker:
     ) -> "PositionMarker":
         """Create a parent marker from it's children."""
         source_slice = slice(
-            min(m.source_slice.start for m in markers if m),
-            max(m.source_slice.stop for m in markers if m),
+            min(m._source for m in markers if m) >> _SPAN_BITS,
+            max(m._source & _SPAN_MASK for m in markers if m),
         )
         templated_slice = slice(
-            min(m.templated_slice.start for m in markers if m),
-            max(m.templated_slice.stop for m in markers if m),
+            min(m._templated for m in markers if m) >> _SPAN_BITS,
+            max(m._templated & _SPAN_MASK for m in markers if m),
         )
         templated_files = {m.templated_file for m in markers if m}
         if len(templated_files) != 1:  # pragma: no cover
@@ -144,13 +204,13 @@ class PositionMarker:
     def source_position(self) -> Tuple[int, int]:
         """Return the line and position of this marker in the source."""
         return self.templated_file.get_line_pos_of_char_pos(
-            self.source_slice.start, source=True
+            self._source >> _SPAN_BITS, source=True
         )
 
     def templated_position(self) -> Tuple[int, int]:
         """Return the line and position of this marker in the source."""
         return self.templated_file.get_line_pos_of_char_pos(
-            self.templated_slice.start, source=False
+            self._templated >> _SPAN_BITS, source=False
         )
 
     @property
@@ -195,9 +255,9 @@ class PositionMarker:
 
     def is_point(self) -> bool:
         """A marker is a point if it has zero length in templated and source file."""
-        return self.slice_is_point(self.source_slice) and self.slice_is_point(
-            self.templated_slice
-        )
+        return (self._source >> _SPAN_BITS) == (self._source & _SPAN_MASK) and (
+            self._templated >> _SPAN_BITS
+        ) == (self._templated & _SPAN_MASK)
 
     @staticmethod
     def infer_next_position(raw: str, line_no: int, line_pos: int) -> Tuple[int, int]:
@@ -5,7 +5,16 @@ or BaseGrammar to un-bloat those classes.
 """
 
 from collections import defaultdict
-from typing import DefaultDict, FrozenSet, List, Optional, Sequence, Tuple, cast
+from typing import (
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 from sqlfluff.core.errors import SQLParseError
 from sqlfluff.core.parser.context import ParseContext
@@ -77,16 +86,102 @@ def first_non_whitespace(
     return None
 
 
+class PruneIndex:
+    """An index of options by the first token they could match.
+
+    This holds the same information as calling `.simple()` on each option,
+    but arranged so that the options for a given first token can be found
+    with dictionary lookups rather than by testing each option in turn.
+    The results of lookups are also memoised, so that repeated lookups for
+    the same token are just a single dictionary lookup.
+
+    Because the simple representation of an option depends on the dialect,
+    an index is only valid for the dialect it was built with.
+    """
+
+    def __init__(
+        self, options: Sequence[Matchable], parse_context: ParseContext
+    ) -> None:
+        self.options = tuple(options)
+        # Indices of options which aren't simple, and so always need matching.
+        self._unpruned: List[int] = []
+        self._by_raw: DefaultDict[str, List[int]] = defaultdict(list)
+        self._by_type: DefaultDict[str, List[int]] = defaultdict(list)
+        self._lookups: Dict[Tuple[Optional[str], FrozenSet[str]], List[Matchable]] = {}
+        for opt_idx, opt in enumerate(self.options):
+            simple = opt.simple(parse_context=parse_context)
+            if simple is None:
+                self._unpruned.append(opt_idx)
+                continue
+            simple_raws, simple_types = simple
+            for raw in simple_raws:
+                self._by_raw[raw].append(opt_idx)
+            for _type in simple_types:
+                self._by_type[_type].append(opt_idx)
+
+    def available_options(
+        self, first_raw: str, first_types: FrozenSet[str]
+    ) -> List[Matchable]:
+        """The options which could match a given first token, in order.
+
+        NOTE: The returned list is shared between lookups and
+        so should not be mutated.
+        """
+        # The raw only affects the result if some option is looking for it.
+        raw_key = first_raw if first_raw in self._by_raw else None
+        try:
+            return self._lookups[(raw_key, first_types)]
+        except KeyError:
+            pass
+        opt_indices = set(self._unpruned)
+        if raw_key is not None:
+            opt_indices.update(self._by_raw[raw_key])
+        for _type in first_types:
+            if _type in self._by_type:
+                opt_indices.update(self._by_type[_type])
+        available = [self.options[opt_idx] for opt_idx in sorted(opt_indices)]
+        self._lookups[(raw_key, first_types)] = available
+        return available
+
+
+def get_prune_index(
+    options: Sequence[Matchable], parse_context: ParseContext
+) -> PruneIndex:
+    """Fetch the `PruneIndex` for a fixed sequence of options.
+
+    Indices are built once, on first use, and stored on the dialect.
+    They're keyed on the identity of the sequence, so this should only be
+    used for sequences which live as long as the dialect does (i.e. the
+    elements of a grammar) rather than ones constructed during matching.
+    """
+    prune_indexes = parse_context.dialect.prune_indexes
+    try:
+        cached_options, prune_index = prune_indexes[id(options)]
+        # Check the identity, in case the id has been reused.
+        if cached_options is options:
+            return prune_index
+    except KeyError:
+        pass
+    prune_index = PruneIndex(options, parse_context)
+    prune_indexes[id(options)] = (options, prune_index)
+    return prune_index
+
+
 def prune_options(
     options: Sequence[Matchable],
     segments: Sequence[BaseSegment],
     parse_context: ParseContext,
     start_idx: int = 0,
+    use_index: bool = False,
 ) -> List[Matchable]:
     """Use the simple matchers to prune which options to match on.
 
     Works in the context of a grammar making choices between options
     such as AnyOf or the content of Delimited.
+
+    If `use_index` is set, then the `options` must be a fixed sequence
+    (see `get_prune_index()`), and pruning is done using a `PruneIndex`
+    for the current dialect rather than by testing each option in turn.
     """
     available_options = []
     prune_buff = []
@@ -99,6 +194,16 @@ def prune_options(
         return list(options)
     first_raw, first_types = first
 
+    # NOTE: Indexes are stored on the dialect, so without one (which
+    # is only really the case in tests), we fall back to a linear scan.
+    if use_index and parse_context.dialect:
+        available_options = get_prune_index(options, parse_context).available_options(
+            first_raw, first_types
+        )
+        if parse_context.profile is not None:
+            parse_context.profile.record_prune(len(options), len(available_options))
+        return available_options
+
     for opt in options:
         simple = opt.simple(parse_context=parse_context)
         if simple is None:
@@ -133,6 +238,8 @@ def prune_options(
             prune_buff.append(opt)
             continue
 
+    if parse_context.profile is not None:
+        parse_context.profile.record_prune(len(options), len(available_options))
     return available_options
 
 
@@ -141,6 +248,7 @@ def longest_match(
     matchers: Sequence[Matchable],
     idx: int,
     parse_context: ParseContext,
+    use_index: bool = False,
 ) -> Tuple[MatchResult, Optional[Matchable]]:
     """Return longest match from a selection of matchers.
 
@@ -160,12 +268,15 @@ def longest_match(
     NOTE: This matching method is the workhorse of the parser. It drives the
     functionality of the AnyOf & AnyNumberOf grammars, and therefore by extension
     the degree of branching within the parser. It's performance can be monitored
-    using the `parse_stats` object on the context.
+    using the `parse_stats` object on the context, or in more detail using a
+    `GrammarProfile` (see `sqlfluff parse --parse-statistics`).
 
     The things which determine the performance of this method are:
     1. Pruning. This method uses `prune_options()` to filter down which matchable
         options proceed to the full matching step. Ideally only very few do and this
-        can handle the majority of the filtering.
+        can handle the majority of the filtering. If the `matchers` are the
+        fixed elements of a grammar, then setting `use_index` allows this to
+        use a precomputed `PruneIndex` rather than testing each option.
     2. Caching. This method uses the parse cache (`check_parse_cache` and
         `put_parse_cache`) on the ParseContext to speed up repetitive matching
         operations. As we make progress through a file there will often not be a
@@ -191,7 +302,11 @@ def longest_match(
     # some complexity from this function so that we just take the first segment.
     # Maybe that's just small potatoes though.
     available_options = prune_options(
-        matchers, segments, parse_context=parse_context, start_idx=idx
+        matchers,
+        segments,
+        parse_context=parse_context,
+        start_idx=idx,
+        use_index=use_index,
     )
 
     # If no available options, return no match.
@@ -215,6 +330,10 @@ def longest_match(
         # has been trimmed and we don't want to assume we can match
         # things which have now been trimmed off.
         max_idx,
+        # Terminators inherited from outer grammars can change how a
+        # matcher matches, and structurally identical matchers (which
+        # share a cache key) may be used with different terminators.
+        parse_context.terminators_key(),
     )
 
     best_match = MatchResult.empty_at(idx)
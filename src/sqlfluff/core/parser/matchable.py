@@ -1,8 +1,18 @@
 """The definition of a matchable interface."""
 
 import copy
+import hashlib
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, FrozenSet, Optional, Sequence, Tuple, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    FrozenSet,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from sqlfluff.core.parser.context import ParseContext
@@ -13,6 +23,62 @@ if TYPE_CHECKING:  # pragma: no cover
 T = TypeVar("T", bound="Matchable")
 
 
+def _describe_value(value: Any) -> str:
+    """Describe a value for a structural cache key, independent of the process."""
+    # NOTE: Segment classes are also Matchable, via their metaclass, but
+    # abstract instance checks don't work well with metaclasses, so we
+    # look for the method directly.
+    cache_key = getattr(value, "cache_key", None)
+    if callable(cache_key):
+        return cast(str, cache_key())
+    elif isinstance(value, (list, tuple)):
+        return "[" + ",".join(_describe_value(elem) for elem in value) + "]"
+    elif isinstance(value, (set, frozenset)):
+        return "{" + ",".join(sorted(_describe_value(elem) for elem in value)) + "}"
+    elif isinstance(value, dict):
+        return (
+            "{"
+            + ",".join(
+                sorted(
+                    f"{_describe_value(k)}:{_describe_value(v)}"
+                    for k, v in value.items()
+                )
+            )
+            + "}"
+        )
+    elif hasattr(value, "pattern") and hasattr(value, "flags"):
+        # Compiled regular expressions.
+        return f"regex({value.pattern!r}, {value.flags})"
+    elif isinstance(value, type) or (
+        callable(value) and hasattr(value, "__qualname__")
+    ):
+        return f"{getattr(value, '__module__', None)}.{value.__qualname__}"
+    return repr(value)
+
+
+def structural_cache_key(matchable: "Matchable") -> str:
+    """Generate a cache key from the type and configuration of a matchable.
+
+    The key is derived from the class of the matchable and all of its
+    attributes (recursively using the keys of any elements which are
+    themselves matchable). That means structurally identical matchables
+    share a key, and that keys are stable between processes and runs.
+
+    NOTE: `Ref` elements are resolved against the dialect at match time,
+    so any cache which is shared *between* dialects should also be keyed
+    on the dialect.
+    """
+    state = {
+        key: value
+        for key, value in vars(matchable).items()
+        # Exclude the key itself and any cached values.
+        if not key.startswith(("_cache_key", "__cache_"))
+    }
+    cls = type(matchable)
+    description = f"{cls.__module__}.{cls.__qualname__}({_describe_value(state)})"
+    return hashlib.blake2b(description.encode("utf8"), digest_size=16).hexdigest()
+
+
 class Matchable(ABC):
     """A base object defining the matching interface."""
 
@@ -70,5 +136,7 @@ class Matchable(ABC):
 
         This string should be unique at the parsing stage such that
         if there has already been a match against this key for a set
-        of segments, that we can reuse that match.
+        of segments, that we can reuse that match. It should also be
+        deterministic, so that keys can be compared between processes
+        (see `structural_cache_key()`).
         """
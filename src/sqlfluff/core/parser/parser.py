@@ -1,14 +1,132 @@
 """Defines the Parser class."""
 
-from typing import TYPE_CHECKING, Optional, Sequence, Type
+import logging
+import multiprocessing
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Type
 
 from sqlfluff.core.config import FluffConfig
 from sqlfluff.core.parser.context import ParseContext
 from sqlfluff.core.parser.helpers import check_still_complete
+from sqlfluff.core.parser.match_result import MatchResult
+from sqlfluff.core.parser.profiler import GrammarProfile
+from sqlfluff.core.tracing import (
+    TraceEvent,
+    add_trace_events,
+    is_tracing,
+    start_tracing,
+    stop_tracing,
+    trace_span,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from sqlfluff.core.parser.segments import BaseFileSegment, BaseSegment
 
+parser_logger = logging.getLogger("sqlfluff.parser")
+
+# The minimum number of statements to parse in each process. Below
+# this, the overhead of starting processes isn't worth it.
+MIN_STATEMENTS_PER_PROCESS = 50
+
+# The config for statements parsed within a worker process. This
+# is set by `_init_statement_worker()` when each worker starts.
+_worker_config: Optional[FluffConfig] = None
+
+
+def split_statements(segments: Sequence["BaseSegment"]) -> List[slice]:
+    """Split lexed segments into slices at top level statement delimiters.
+
+    Splits are made after each semicolon (or run of semicolons), unless
+    it's within brackets or within a templated block (e.g. a jinja
+    `{% for %}` loop), in which case it's probably not the end of a
+    whole statement.
+
+    Returns:
+        :obj:`list` of :obj:`slice`: Contiguous slices covering all the
+        segments. Each (except perhaps the first) starts with the first
+        code after a delimiter.
+    """
+    slices: List[slice] = []
+    start_idx = 0
+    bracket_depth = 0
+    block_depth = 0
+    after_delimiter = False
+    for idx, segment in enumerate(segments):
+        if not segment.is_code:
+            block_type = getattr(segment, "block_type", None)
+            if block_type == "block_start":
+                block_depth += 1
+            elif block_type == "block_end":
+                block_depth = max(block_depth - 1, 0)
+            continue
+        if segment.raw == ";":
+            after_delimiter = not bracket_depth and not block_depth
+            continue
+        if after_delimiter:
+            # Split just before the first code after the delimiter.
+            slices.append(slice(start_idx, idx))
+            start_idx = idx
+            after_delimiter = False
+        if segment.raw in ("(", "[", "{"):
+            bracket_depth += 1
+        elif segment.raw in (")", "]", "}"):
+            bracket_depth = max(bracket_depth - 1, 0)
+    slices.append(slice(start_idx, len(segments)))
+    return slices
+
+
+def _init_statement_worker(
+    config: FluffConfig, trace: bool = False
+) -> None:  # pragma: no cover
+    """Store the config for parsing statements within a worker process."""
+    global _worker_config
+    _worker_config = config
+    if trace:
+        start_tracing()
+
+
+def _match_statements(
+    batch: List[Tuple["BaseSegment", ...]],
+) -> Tuple[List[Optional[MatchResult]], List[TraceEvent]]:  # pragma: no cover
+    """Match a batch of statements within a worker process.
+
+    This returns the match results rather than the parsed segments,
+    because they're much cheaper to send back to the main process. Any
+    trace events recorded while matching are returned with them.
+    """
+    assert _worker_config
+    root_segment: Type["BaseFileSegment"] = _worker_config.get(
+        "dialect_obj"
+    ).get_root_segment()
+    ctx = ParseContext.from_config(config=_worker_config)
+    matches: List[Optional[MatchResult]] = []
+    for segments in batch:
+        with trace_span("statement", "parse") as span:
+            if segments and segments[0].pos_marker:
+                span["line"] = segments[0].pos_marker.working_line_no
+            matches.append(_match_statement(root_segment, segments, ctx))
+    if not is_tracing():
+        return matches, []
+    events = stop_tracing()
+    start_tracing()
+    return matches, events
+
+
+def _match_statement(
+    root_segment: Type["BaseFileSegment"],
+    segments: Tuple["BaseSegment", ...],
+    parse_context: ParseContext,
+) -> Optional[MatchResult]:
+    """Match a single statement, as though it were the whole file.
+
+    Returns None if there's no code to match.
+    """
+    start_idx, end_idx = root_segment.code_bounds(segments)
+    if start_idx == end_idx:
+        return None
+    return root_segment.match_grammar.match(
+        segments[:end_idx], start_idx, parse_context
+    )
+
 
 class Parser:
     """Instantiates parsed queries from a sequence of lexed raw segments."""
@@ -25,14 +143,21 @@ class Parser:
         self.RootSegment: Type[BaseFileSegment] = self.config.get(
             "dialect_obj"
         ).get_root_segment()
+        self.parse_processes: int = self.config.get("parse_processes", default=1) or 1
 
     def parse(
         self,
         segments: Sequence["BaseSegment"],
         fname: Optional[str] = None,
         parse_statistics: bool = False,
+        profile: Optional[GrammarProfile] = None,
     ) -> Optional["BaseSegment"]:
-        """Parse a series of lexed tokens using the current dialect."""
+        """Parse a series of lexed tokens using the current dialect.
+
+        If a `profile` is provided, then statistics on each grammar matched
+        are recorded into it. If `parse_statistics` is set, then statistics
+        are also logged once parsing is complete.
+        """
         if not segments:  # pragma: no cover
             # This should normally never happen because there will usually
             # be an end_of_file segment. It would probably only happen in
@@ -43,12 +168,28 @@ class Parser:
         # context of a context manager. That's because it's the initial
         # instantiation.
         ctx = ParseContext.from_config(config=self.config)
-        # Kick off parsing with the root segment. The BaseFileSegment has
-        # a unique entry point to facilitate exactly this. All other segments
-        # will use the standard .match() route.
-        root = self.RootSegment.root_parse(
-            tuple(segments), fname=fname, parse_context=ctx
+        if parse_statistics and profile is None:
+            profile = GrammarProfile()
+        ctx.profile = profile
+        # NOTE: Statements parsed in other processes can't be profiled.
+        root = (
+            None
+            if profile
+            else self._parse_statements_in_parallel(tuple(segments), fname=fname)
         )
+        if not root:
+            if profile:
+                profile.start(self.RootSegment.__name__, 0)
+            try:
+                # Kick off parsing with the root segment. The BaseFileSegment has
+                # a unique entry point to facilitate exactly this. All other
+                # segments will use the standard .match() route.
+                root = self.RootSegment.root_parse(
+                    tuple(segments), fname=fname, parse_context=ctx
+                )
+            finally:
+                if profile:
+                    profile.stop()
 
         # Basic Validation, that we haven't dropped anything.
         check_still_complete(tuple(segments), (root,), ())
@@ -73,6 +214,87 @@ class Parser:
                 key=lambda item: item[1],
             ):
                 ctx.logger.warning(f"{val}: {key!r}")
+            assert profile
+            ctx.logger.warning("## Grammars with the most time spent matching")
+            for record in profile.as_records()[:20]:
+                ctx.logger.warning(
+                    f"{record['self_time']:.4f}s: {record['name']} "
+                    f"({record['attempts']} attempts)"
+                )
             ctx.logger.warning("==== End Parse Statistics ====")
 
         return root
+
+    def _parse_statements_in_parallel(
+        self,
+        segments: Tuple["BaseSegment", ...],
+        fname: Optional[str] = None,
+    ) -> Optional["BaseFileSegment"]:
+        """Parse the statements of a large file in parallel, if configured.
+
+        The file is split at top level delimiters (see `split_statements()`),
+        and each statement is matched separately in a pool of processes.
+        The results are then applied to the original segments to build the
+        file segment, so the position markers are unchanged.
+
+        Returns None if parallel parsing isn't configured or possible, or
+        if any statement fails to parse on its own (for example, a procedure
+        whose body contains semicolons), in which case the whole file
+        should be parsed as usual.
+        """
+        if (
+            self.parse_processes <= 1
+            or not self.RootSegment.can_parse_statements_separately
+            # Daemonic processes (e.g. when linting files in parallel)
+            # aren't allowed to start processes of their own.
+            or multiprocessing.current_process().daemon
+        ):
+            return None
+        slices = split_statements(segments)
+        if len(slices) < self.parse_processes * MIN_STATEMENTS_PER_PROCESS:
+            return None
+
+        statements = [segments[_slice] for _slice in slices]
+        # Divide the statements into a few batches per process, so
+        # that the work is reasonably balanced between them.
+        num_batches = self.parse_processes * 4
+        batches = [
+            statements[
+                idx
+                * len(statements)
+                // num_batches : (idx + 1)
+                * len(statements)
+                // num_batches
+            ]
+            for idx in range(num_batches)
+        ]
+        parser_logger.info(
+            "Parsing %s statements in %s processes.",
+            len(statements),
+            self.parse_processes,
+        )
+        with multiprocessing.get_context("spawn").Pool(
+            processes=self.parse_processes,
+            initializer=_init_statement_worker,
+            initargs=(self.config, is_tracing()),
+        ) as pool:
+            matches = []
+            for batch_matches, events in pool.map(_match_statements, batches):
+                matches.extend(batch_matches)
+                add_trace_events(events)
+
+        content: List["BaseSegment"] = []
+        for statement, match in zip(statements, matches):
+            if match is None:
+                content.extend(statement)
+                continue
+            _, end_idx = self.RootSegment.code_bounds(statement)
+            if not match or match.matched_slice.stop != end_idx:
+                parser_logger.info(
+                    "Unable to parse statements separately, parsing whole file."
+                )
+                return None
+            content.extend(statement[: match.matched_slice.start])
+            content.extend(match.apply(statement))
+            content.extend(statement[match.matched_slice.stop :])
+        return self.RootSegment(tuple(content), fname=fname)
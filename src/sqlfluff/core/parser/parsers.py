@@ -5,14 +5,14 @@ Matchable objects which return individual segments.
 
 from abc import abstractmethod
 from typing import Any, Callable, Collection, Dict, Optional, Sequence, Tuple, Type
-from uuid import uuid4
 
 import regex
 
 from sqlfluff.core.parser.context import ParseContext
 from sqlfluff.core.parser.match_result import MatchResult
-from sqlfluff.core.parser.matchable import Matchable
+from sqlfluff.core.parser.matchable import Matchable, structural_cache_key
 from sqlfluff.core.parser.segments import BaseSegment, RawSegment
+from sqlfluff.core.parser.segments.raw import instance_types_for
 from sqlfluff.core.parser.types import SimpleHintType
 
 
@@ -37,18 +37,23 @@ class BaseParser(Matchable):
         # Store instance_types rather than just type to allow
         # for multiple possible types to be supported in derivative
         # classes.
-        self._instance_types: Tuple[str, ...] = (type or raw_class.type,)
+        self._instance_types: Tuple[str, ...] = instance_types_for(
+            type or raw_class.type
+        )
         self.optional = optional
         self._trim_chars = trim_chars
         self.casefold = casefold
-        # Generate a cache key
-        self._cache_key = uuid4().hex
+        # The cache key is generated when first used, once any
+        # subclass has finished configuring the parser.
+        self._cache_key: Optional[str] = None
 
     def cache_key(self) -> str:
         """Get the cache key for this parser.
 
-        For parsers, they're unique per-instance.
+        For parsers, these are derived from their type and configuration.
         """
+        if self._cache_key is None:
+            self._cache_key = structural_cache_key(self)
         return self._cache_key
 
     def is_optional(self) -> bool:
@@ -0,0 +1,138 @@
+"""A profiler for the grammars of a dialect.
+
+When enabled (e.g. with `sqlfluff parse --parse-statistics`), the parse
+context records statistics against each segment class and each named
+grammar (i.e. anything referenced with `Ref`) as it's matched. This is
+designed to help find which parts of a dialect make a file slow to parse.
+
+Profiles for several files (or several processes) can be combined using
+`GrammarProfile.merge()`.
+"""
+
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
+
+# The fields which profiles can be sorted on.
+PROFILE_SORT_KEYS = (
+    "self_time",
+    "time",
+    "attempts",
+    "cache_hits",
+    "cache_misses",
+    "prune_ratio",
+    "max_depth",
+)
+
+
+@dataclass
+class GrammarStats:
+    """The statistics for a single grammar or segment class.
+
+    Cache hits and misses, and the options considered and kept when
+    pruning, are those in the grammar's own matching (i.e. not within
+    any other named grammar which it references).
+    """
+
+    attempts: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    options: int = 0
+    options_kept: int = 0
+    time: float = 0.0
+    self_time: float = 0.0
+    max_depth: int = 0
+
+    @property
+    def prune_ratio(self) -> Optional[float]:
+        """The proportion of options pruned before matching, if any."""
+        if not self.options:
+            return None
+        return 1 - self.options_kept / self.options
+
+    def merge(self, other: "GrammarStats") -> None:
+        """Add the statistics from another instance into this one."""
+        self.attempts += other.attempts
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        self.options += other.options
+        self.options_kept += other.options_kept
+        self.time += other.time
+        self.self_time += other.self_time
+        self.max_depth = max(self.max_depth, other.max_depth)
+
+
+class GrammarProfile:
+    """Statistics on the grammars matched while parsing.
+
+    Segments and grammars which are recursive (e.g. expressions) may be
+    matched within themselves. Their cumulative `time` only counts the
+    outermost match, so that time isn't counted twice.
+    """
+
+    def __init__(self) -> None:
+        self.stats: DefaultDict[str, GrammarStats] = defaultdict(GrammarStats)
+        # The stack of grammars being matched, each with the time it
+        # started and the time spent within other grammars since.
+        self._stack: List[Tuple[str, GrammarStats, float, List[float]]] = []
+        # How many times each grammar is on the stack, so that the
+        # cumulative time of recursive grammars isn't counted twice.
+        self._active: DefaultDict[str, int] = defaultdict(int)
+
+    def start(self, name: str, depth: int) -> None:
+        """Start matching a grammar."""
+        stats = self.stats[name]
+        stats.attempts += 1
+        stats.max_depth = max(stats.max_depth, depth)
+        self._active[name] += 1
+        self._stack.append((name, stats, time.perf_counter(), [0.0]))
+
+    def stop(self) -> None:
+        """Stop matching the grammar most recently started."""
+        name, stats, start, child_time = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        stats.self_time += elapsed - child_time[0]
+        self._active[name] -= 1
+        if not self._active[name]:
+            stats.time += elapsed
+        if self._stack:
+            self._stack[-1][3][0] += elapsed
+
+    def record_cache(self, hit: bool) -> None:
+        """Record a parse cache lookup within the current grammar."""
+        if not self._stack:  # pragma: no cover
+            return
+        if hit:
+            self._stack[-1][1].cache_hits += 1
+        else:
+            self._stack[-1][1].cache_misses += 1
+
+    def record_prune(self, options: int, kept: int) -> None:
+        """Record the pruning of options within the current grammar."""
+        if not self._stack:  # pragma: no cover
+            return
+        stats = self._stack[-1][1]
+        stats.options += options
+        stats.options_kept += kept
+
+    def merge(self, other: "GrammarProfile") -> None:
+        """Add the statistics from another profile into this one."""
+        for name, stats in other.stats.items():
+            self.stats[name].merge(stats)
+
+    def as_records(self, sort_by: str = "self_time") -> List[Dict[str, Any]]:
+        """Return the statistics for each grammar, sorted descending.
+
+        This is the format used for the json output.
+        """
+        assert sort_by in PROFILE_SORT_KEYS, f"Cannot sort profile by {sort_by!r}"
+        records = [
+            {"name": name, **asdict(stats), "prune_ratio": stats.prune_ratio}
+            for name, stats in self.stats.items()
+        ]
+        return sorted(
+            records,
+            key=lambda record: (record[sort_by] if record[sort_by] is not None else -1),
+            reverse=True,
+        )
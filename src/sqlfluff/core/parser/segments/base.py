@@ -11,6 +11,7 @@ Here we define:
 # Import annotations for py 3.7 to allow `weakref.ReferenceType["BaseSegment"]`
 from __future__ import annotations
 
+import hashlib
 import logging
 import weakref
 from dataclasses import dataclass
@@ -107,6 +108,11 @@ def _iter_base_types(
         yield from base._class_types
 
 
+# The number of segment classes defined with each qualified name. These are
+# used to distinguish the cache keys of classes which share a name.
+_segment_definitions: Dict[str, int] = {}
+
+
 class SegmentMetaclass(type, Matchable):
     """The metaclass for segments.
 
@@ -134,10 +140,18 @@ class SegmentMetaclass(type, Matchable):
         here saves calculating it at runtime for each
         instance of the class.
         """
-        # Create a cache uuid on definition.
-        # We do it here so every _definition_ of a segment
-        # gets a unique UUID regardless of dialect.
-        class_dict["_cache_key"] = uuid4().hex
+        # Create a cache key on definition, from the module and name of
+        # the class. The name includes the dialect module, so every
+        # _definition_ of a segment gets a unique key, which is also
+        # stable between processes and runs.
+        qualname = (
+            f"{class_dict.get('__module__')}.{class_dict.get('__qualname__', name)}"
+        )
+        definition_count = _segment_definitions.get(qualname, 0) + 1
+        _segment_definitions[qualname] = definition_count
+        class_dict["_cache_key"] = hashlib.blake2b(
+            f"{qualname}#{definition_count}".encode("utf8"), digest_size=16
+        ).hexdigest()
 
         # Populate the `_class_types` property on creation.
         added_type = class_dict.get("type", None)
@@ -645,7 +659,7 @@ class BaseSegment(metaclass=SegmentMetaclass):
 
         assert cls.match_grammar, f"{cls.__name__} has no match grammar."
 
-        with parse_context.deeper_match(name=cls.__name__) as ctx:
+        with parse_context.deeper_match(name=cls.__name__, profile=True) as ctx:
             match = cls.match_grammar.match(segments, idx, ctx)
 
         # Wrap are return regardless of success.
@@ -21,6 +21,11 @@ class BaseFileSegment(BaseSegment):
     can_start_end_non_code = True
     # A file can be empty!
     allow_empty = True
+    # Whether the `match_grammar` is just a series of statements separated
+    # by semicolons, such that parsing each statement separately gives the
+    # same result as parsing the whole file. This allows statements to be
+    # parsed in parallel. See `Parser.parse()`.
+    can_parse_statements_separately = False
 
     def __init__(
         self,
@@ -40,6 +45,29 @@ class BaseFileSegment(BaseSegment):
     def get_table_references(self) -> Set[str]:
         """Use parsed tree to extract table references."""
 
+    @staticmethod
+    def code_bounds(segments: Tuple[BaseSegment, ...]) -> Tuple[int, int]:
+        """Find the bounds of the code in some segments, trimming any non code.
+
+        Returns:
+            :obj:`tuple` of the index of the first code segment and the index
+            after the last code segment. If there are no code segments, both
+            are equal.
+        """
+        # Trim the start
+        _start_idx = 0
+        for _start_idx in range(len(segments)):
+            if segments[_start_idx].is_code:
+                break
+
+        # Trim the end
+        _end_idx = len(segments)
+        for _end_idx in range(len(segments), _start_idx - 1, -1):
+            if segments[_end_idx - 1].is_code:
+                break
+
+        return _start_idx, _end_idx
+
     @classmethod
     def root_parse(
         cls,
@@ -54,17 +82,7 @@ class BaseFileSegment(BaseSegment):
 
         Anything unexpected at the end is regarded as unparsable.
         """
-        # Trim the start
-        _start_idx = 0
-        for _start_idx in range(len(segments)):
-            if segments[_start_idx].is_code:
-                break
-
-        # Trim the end
-        _end_idx = len(segments)
-        for _end_idx in range(len(segments), _start_idx - 1, -1):
-            if segments[_end_idx - 1].is_code:
-                break
+        _start_idx, _end_idx = cls.code_bounds(segments)
 
         if _start_idx == _end_idx:
             # Return just a file of non-code segments.
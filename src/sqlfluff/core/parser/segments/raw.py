@@ -4,7 +4,18 @@ This is designed to be the root segment, without
 any children, and the output of the lexer.
 """
 
-from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 from uuid import uuid4
 
 import regex as re
@@ -12,9 +23,49 @@ import regex as re
 from sqlfluff.core.parser.markers import PositionMarker
 from sqlfluff.core.parser.segments.base import BaseSegment, SourceFix
 
+# Single element type tuples, shared between segments of the same type
+# rather than building a new tuple for each one.
+_instance_type_tuples: Dict[str, Tuple[str, ...]] = {}
+
+
+def instance_types_for(type: str) -> Tuple[str, ...]:
+    """Get a shared `instance_types` tuple for a single type."""
+    try:
+        return _instance_type_tuples[type]
+    except KeyError:
+        return _instance_type_tuples.setdefault(type, (type,))
+
+
+# The instance attributes of all raw segments.
+_RAW_SEGMENT_SLOTS: Tuple[str, ...] = (
+    "_raw",
+    "_raw_upper",
+    "_raw_value",
+    "_source_fixes",
+    "_parent",
+    "_parent_idx",
+    "pos_marker",
+    "segments",
+    "instance_types",
+    "trim_start",
+    "trim_chars",
+    "uuid",
+    "quoted_value",
+    "escape_replacements",
+    "casefold",
+)
+
 
 class RawSegment(BaseSegment):
-    """This is a segment without any subsegments."""
+    """This is a segment without any subsegments.
+
+    There is one raw segment for every token in a file, so their instance
+    attributes are held in `__slots__` rather than in a `__dict__`. Any
+    cached properties inherited from `BaseSegment` are still held in a
+    `__dict__`, which is only created if they're used.
+    """
+
+    __slots__ = _RAW_SEGMENT_SLOTS
 
     type = "raw"
     _is_code = True
@@ -51,7 +102,10 @@ class RawSegment(BaseSegment):
             self._raw = raw
         else:
             self._raw = self._default_raw
-        self._raw_upper = self._raw.upper()
+        # Many raws (e.g. whitespace and symbols) are unchanged in upper case,
+        # in which case share the same string.
+        raw_upper = self._raw.upper()
+        self._raw_upper = self._raw if raw_upper == self._raw else raw_upper
         # pos marker is required here. We ignore the typing initially
         # because it might *initially* be unset, but it will be reset
         # later.
@@ -61,7 +115,7 @@ class RawSegment(BaseSegment):
         self.instance_types: Tuple[str, ...]
         if type:
             assert not instance_types, "Cannot set `type` and `instance_types`."
-            self.instance_types = (type,)
+            self.instance_types = instance_types_for(type)
         else:
             self.instance_types = instance_types
         # What should we trim off the ends to get to content
@@ -71,24 +125,39 @@ class RawSegment(BaseSegment):
         self._source_fixes = source_fixes
         # UUID for matching (the int attribute of it)
         self.uuid = uuid or uuid4().int
-        self.representation = "<{}: ({}) {!r}>".format(
-            self.__class__.__name__, self.pos_marker, self.raw
-        )
+        self._parent = None
+        self._parent_idx = None
         self.quoted_value = quoted_value
         self.escape_replacements = escape_replacements
         self.casefold = casefold
         self._raw_value: str = self._raw_normalized()
 
     def __repr__(self) -> str:
-        # This is calculated at __init__, because all elements are immutable
-        # and this was previously recalculating the pos marker,
-        # and became very expensive
-        return self.representation
+        return "<{}: ({}) {!r}>".format(
+            self.__class__.__name__, self.pos_marker, self.raw
+        )
 
     def __setattr__(self, key: str, value: Any) -> None:
         """Overwrite BaseSegment's __setattr__ with BaseSegment's superclass."""
         super(BaseSegment, self).__setattr__(key, value)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the current state to allow pickling."""
+        state = {
+            slot: getattr(self, slot)
+            for slot in _RAW_SEGMENT_SLOTS
+            if hasattr(self, slot)
+        }
+        state.update(getattr(self, "__dict__", {}))
+        # Kill the parent ref. It won't pickle well.
+        state["_parent"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Set state during process of unpickling."""
+        for key, value in state.items():
+            setattr(self, key, value)
+
     # ################ PUBLIC PROPERTIES
 
     @property
@@ -121,6 +190,21 @@ class RawSegment(BaseSegment):
         """Returns self to be compatible with calls to its superclass."""
         return [self]
 
+    @property
+    def descendant_type_set(self) -> FrozenSet[str]:
+        """Raw segments have no descendants."""
+        return frozenset()
+
+    @property
+    def direct_descendant_type_set(self) -> Set[str]:
+        """Raw segments have no descendants."""
+        return set()
+
+    @property
+    def first_non_whitespace_segment_raw_upper(self) -> Optional[str]:
+        """Returns the raw in upper case, unless it's whitespace."""
+        return self._raw_upper if self._raw_upper.strip() else None
+
     @property
     def class_types(self) -> FrozenSet[str]:
         """The set of full types for this segment, including inherited.
@@ -272,6 +356,30 @@ class RawSegment(BaseSegment):
             source_fixes=source_fixes or self.source_fixes,
         )
 
+    def copy(
+        self,
+        segments: Optional[Tuple["BaseSegment", ...]] = None,
+        parent: Optional["BaseSegment"] = None,
+        parent_idx: Optional[int] = None,
+    ) -> "RawSegment":
+        """Copy the segment, keeping the same position marker.
+
+        Raw segments have no children, so unlike `BaseSegment.copy()` this
+        is never recursive.
+        """
+        cls = self.__class__
+        assert not segments, f"Cannot provide `segments` to {cls.__name__} `.copy()`"
+        new_segment = cls.__new__(cls)
+        for slot in _RAW_SEGMENT_SLOTS:
+            setattr(new_segment, slot, getattr(self, slot))
+        # Transfer any attributes of subclasses and any cached properties.
+        new_segment.__dict__.update(getattr(self, "__dict__", {}))
+        # Reset the parent if provided.
+        if parent:
+            assert parent_idx is not None, "parent_idx must be provided it parent is."
+            new_segment.set_parent(parent, parent_idx)
+        return new_segment
+
     def _get_raw_segment_kwargs(self) -> Dict[str, Any]:
         return {
             "quoted_value": self.quoted_value,
@@ -7,11 +7,17 @@ as performant as possible, we cache the plugin manager within
 the context of each thread.
 """
 
+import hashlib
 import importlib.metadata
+import json
 import logging
+import os
+import sys
+import tempfile
 from contextvars import ContextVar
-from typing import Iterator, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import platformdirs
 import pluggy
 
 from sqlfluff.core.plugin import plugin_base_name, project_name
@@ -28,6 +34,13 @@ plugins_loaded: ContextVar[bool] = ContextVar("plugins_loaded", default=False)
 # maintain the value of this variable.
 is_main_process: ContextVar[bool] = ContextVar("is_main_process", default=True)
 
+# The plugins found in the installed distributions are saved in a manifest,
+# in the user cache directory unless set with this environment variable.
+PLUGIN_CACHE_DIR_ENV = "SQLFLUFF_PLUGIN_CACHE_DIR"
+PLUGIN_MANIFEST_FILENAME = "plugin_manifest.json"
+# The number of different sets of installed distributions to keep.
+PLUGIN_MANIFEST_SIZE = 8
+
 
 def _get_sqlfluff_version() -> str:
     """Get the SQLFluff package version from importlib.
@@ -38,18 +51,122 @@ def _get_sqlfluff_version() -> str:
     return importlib.metadata.version("sqlfluff")
 
 
+def _get_plugin_manifest_path() -> Optional[str]:
+    """Get the path of the plugin manifest, or None if it's disabled.
+
+    The location can be set with the `SQLFLUFF_PLUGIN_CACHE_DIR` environment
+    variable. Setting it to "none" disables the manifest.
+    """
+    cache_dir = os.environ.get(PLUGIN_CACHE_DIR_ENV)
+    if cache_dir is None:
+        cache_dir = platformdirs.user_cache_dir("sqlfluff", "sqlfluff")
+    elif cache_dir.lower() == "none":
+        return None
+    return os.path.join(cache_dir, PLUGIN_MANIFEST_FILENAME)
+
+
+def _plugin_manifest_key() -> str:
+    """Generate a key for the installed distributions.
+
+    Distributions are found by looking for metadata directories in each
+    entry of `sys.path`. Installing, removing or upgrading a distribution
+    adds or removes one of those directories, so we key on their names
+    and the modification time of the entry points file in each.
+    """
+    hasher = hashlib.sha1(sys.version.encode())
+    for path in sys.path:
+        # An empty entry means the current directory.
+        path = os.path.abspath(path or ".")
+        hasher.update(path.encode())
+        try:
+            entries = sorted(os.scandir(path), key=lambda entry: entry.name)
+        except OSError:
+            # Non existent paths, or zip files.
+            continue
+        for entry in entries:
+            if not entry.name.endswith((".dist-info", ".egg-info")):
+                continue
+            try:
+                mtime = os.stat(
+                    os.path.join(entry.path, "entry_points.txt")
+                ).st_mtime_ns
+            except OSError:
+                mtime = 0
+            hasher.update(f"{entry.name}:{mtime}".encode())
+    return hasher.hexdigest()
+
+
+def _load_plugin_manifest(path: str, key: str) -> Optional[List[Tuple[str, str, str]]]:
+    """Load the plugins for the given key from the manifest, if present."""
+    try:
+        with open(path) as f:
+            manifest: Dict[str, Any] = json.load(f)
+    except (OSError, ValueError):
+        return None
+    plugins = manifest.get(key)
+    if plugins is None:
+        return None
+    return [(name, value, version) for name, value, version in plugins]
+
+
+def _save_plugin_manifest(
+    path: str, key: str, plugins: List[Tuple[str, str, str]]
+) -> None:
+    """Save the plugins for the given key to the manifest.
+
+    Different python environments (or working directories) can share a
+    manifest, so we keep the most recent few keys.
+    """
+    try:
+        with open(path) as f:
+            manifest: Dict[str, Any] = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    manifest.pop(key, None)
+    manifest[key] = plugins
+    while len(manifest) > PLUGIN_MANIFEST_SIZE:
+        manifest.pop(next(iter(manifest)))
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first, so that concurrent processes
+        # never read a partially written manifest.
+        with tempfile.NamedTemporaryFile(
+            "w", dir=os.path.dirname(path), suffix=".tmp", delete=False
+        ) as tmp:
+            json.dump(manifest, tmp)
+        os.replace(tmp.name, path)
+    except OSError as err:  # pragma: no cover
+        plugin_logger.info("Unable to save plugin manifest: %r", err)
+
+
 def _discover_plugins() -> Iterator[Tuple[importlib.metadata.EntryPoint, str, str]]:
     """Uses the same mechanism as pluggy to introspect available plugins.
 
     This method is then intended to allow loading of plugins individually,
     for better error handling.
+
+    Looking through the entry points of every installed distribution can
+    be slow in large environments, so the plugins found are saved in a
+    manifest, keyed on the installed distributions (see
+    `_plugin_manifest_key`).
     """
-    for dist in list(importlib.metadata.distributions()):
-        for ep in dist.entry_points:
+    manifest_path = _get_plugin_manifest_path()
+    plugins: Optional[List[Tuple[str, str, str]]] = None
+    if manifest_path:
+        key = _plugin_manifest_key()
+        plugins = _load_plugin_manifest(manifest_path, key)
+    if plugins is None:
+        plugins = [
+            (ep.name, ep.value, dist.version)
+            for dist in list(importlib.metadata.distributions())
+            for ep in dist.entry_points
             # Check it's a SQLFluff one
-            if ep.group != project_name:
-                continue
-            yield ep, ep.name, dist.version
+            if ep.group == project_name
+        ]
+        if manifest_path:
+            _save_plugin_manifest(manifest_path, key, plugins)
+    for name, value, version in plugins:
+        yield importlib.metadata.EntryPoint(name, value, project_name), name, version
 
 
 def _load_plugin(
@@ -20,14 +20,17 @@ import fnmatch
 import logging
 import pathlib
 import re
+import time
 from collections import defaultdict, namedtuple
 from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     ClassVar,
     DefaultDict,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     Optional,
@@ -36,6 +39,7 @@ from typing import (
     Tuple,
     Type,
     Union,
+    cast,
 )
 
 import regex
@@ -46,7 +50,11 @@ from sqlfluff.core.parser import BaseSegment, RawSegment
 from sqlfluff.core.plugin.host import is_main_process, plugins_loaded
 from sqlfluff.core.rules.config_info import get_config_info
 from sqlfluff.core.rules.context import RuleContext
-from sqlfluff.core.rules.crawlers import BaseCrawler
+from sqlfluff.core.rules.crawlers import (
+    BaseCrawler,
+    MultiplexingCrawler,
+    SegmentSeekerCrawler,
+)
 from sqlfluff.core.rules.fix import LintFix
 from sqlfluff.core.templaters.base import TemplatedFile
 
@@ -419,6 +427,15 @@ class BaseRule(metaclass=RuleMetaclass):
     # Should we document this rule as fixable? Used by the metaclass to add
     # a line to the docstring.
     is_fix_compatible = False
+    # Does the result of evaluating this rule on a segment depend only on that
+    # segment, its children and its immediate parent (and therefore siblings)?
+    # If so (and it doesn't use memory or a raw stack), then in later fix loops
+    # it's only evaluated on segments which have changed since it last ran, and
+    # on their children. Only applies to rules using a `SegmentSeekerCrawler`.
+    is_context_local = False
+    # The names of the dialects this rule applies to. If set, the rule is
+    # skipped for files in any other dialect.
+    target_dialects: Optional[FrozenSet[str]] = None
 
     # Add comma separated string to Base Rule to ensure that it uses the same
     # Configuration that is defined in the Config.py file
@@ -483,6 +500,23 @@ class BaseRule(metaclass=RuleMetaclass):
             ).format(self.__class__.__name__)
         )  # pragma: no cover
 
+    def is_applicable(
+        self, segment_types: AbstractSet[str], dialect: "Dialect"
+    ) -> bool:
+        """Could this rule find anything in a tree, given the types within it?
+
+        Args:
+            segment_types: The types of all the segments in the tree,
+                including the root segment.
+            dialect: The dialect of the tree.
+        """
+        if (
+            self.target_dialects is not None
+            and dialect.name not in self.target_dialects
+        ):
+            return False
+        return self.crawl_behaviour.could_match(segment_types)
+
     def crawl(
         self,
         tree: BaseSegment,
@@ -492,6 +526,7 @@ class BaseRule(metaclass=RuleMetaclass):
         ignore_mask: Optional["IgnoreMask"],
         fname: Optional[str],
         config: "FluffConfig",
+        changed_uuids: Optional[Set[int]] = None,
     ) -> Tuple[
         List[SQLLintError],
         Tuple[RawSegment, ...],
@@ -500,10 +535,19 @@ class BaseRule(metaclass=RuleMetaclass):
     ]:
         """Run the rule on a given tree.
 
+        If `changed_uuids` is provided (only for rules which are
+        `is_context_local`), then only the regions of the tree which
+        contain those segments are evaluated.
+
         Returns:
             A tuple of (vs, raw_stack, fixes, memory)
 
         """
+        if (
+            self.target_dialects is not None
+            and dialect.name not in self.target_dialects
+        ):
+            return [], tuple(), [], None
         root_context = RuleContext(
             dialect=dialect,
             fix=fix,
@@ -511,6 +555,7 @@ class BaseRule(metaclass=RuleMetaclass):
             path=pathlib.Path(fname) if fname else None,
             segment=tree,
             config=config,
+            changed_uuids=changed_uuids,
         )
         vs: List[SQLLintError] = []
         fixes: List[LintFix] = []
@@ -519,91 +564,188 @@ class BaseRule(metaclass=RuleMetaclass):
         memory = root_context.memory
         context = root_context
         for context in self.crawl_behaviour.crawl(root_context):
-            try:
-                context.memory = memory
-                res = self._eval(context=context)
-            except (bdb.BdbQuit, KeyboardInterrupt):  # pragma: no cover
-                raise
-            # Any exception at this point would halt the linter and
-            # cause the user to get no results
-            except Exception as e:
-                # If a filename is present, include it in the critical exception.
-                self.logger.critical(
-                    (
-                        f"Applying rule {self.code} to {fname!r} "
-                        f"threw an Exception: {e}"
-                        if fname
-                        else f"Applying rule {self.code} threw an Exception: {e}"
+            ok, memory = self._eval_context(
+                context, memory, tree, templated_file, ignore_mask, fname, vs, fixes
+            )
+            if not ok:
+                return vs, context.raw_stack, fixes, context.memory
+        return vs, context.raw_stack if context else tuple(), fixes, context.memory
+
+    def _eval_context(
+        self,
+        context: RuleContext,
+        memory: Any,
+        tree: BaseSegment,
+        templated_file: Optional["TemplatedFile"],
+        ignore_mask: Optional["IgnoreMask"],
+        fname: Optional[str],
+        vs: List[SQLLintError],
+        fixes: List[LintFix],
+    ) -> Tuple[bool, Any]:
+        """Evaluate the rule on one context yielded by a crawler.
+
+        Any violations and fixes found are added to `vs` and `fixes`.
+
+        Returns:
+            A tuple of whether to carry on crawling (i.e. the rule didn't
+            raise an exception), and the memory for the next evaluation.
+        """
+        try:
+            context.memory = memory
+            res = self._eval(context=context)
+        except (bdb.BdbQuit, KeyboardInterrupt):  # pragma: no cover
+            raise
+        # Any exception at this point would halt the linter and
+        # cause the user to get no results
+        except Exception as e:
+            # If a filename is present, include it in the critical exception.
+            self.logger.critical(
+                (
+                    f"Applying rule {self.code} to {fname!r} "
+                    f"threw an Exception: {e}"
+                    if fname
+                    else f"Applying rule {self.code} threw an Exception: {e}"
+                ),
+                exc_info=True,
+            )
+            assert context.segment.pos_marker
+            exception_line, _ = context.segment.pos_marker.source_position()
+            self._log_critical_errors(e)
+            vs.append(
+                SQLLintError(
+                    rule=self,
+                    segment=context.segment,
+                    fixes=[],
+                    description=(
+                        f"Unexpected exception: {str(e)};\n"
+                        "Could you open an issue at "
+                        "https://github.com/sqlfluff/sqlfluff/issues ?\n"
+                        "You can ignore this exception for now, by adding "
+                        f"'-- noqa: {self.code}' at the end\n"
+                        f"of line {exception_line}\n"
                     ),
-                    exc_info=True,
-                )
-                assert context.segment.pos_marker
-                exception_line, _ = context.segment.pos_marker.source_position()
-                self._log_critical_errors(e)
-                vs.append(
-                    SQLLintError(
-                        rule=self,
-                        segment=context.segment,
-                        fixes=[],
-                        description=(
-                            f"Unexpected exception: {str(e)};\n"
-                            "Could you open an issue at "
-                            "https://github.com/sqlfluff/sqlfluff/issues ?\n"
-                            "You can ignore this exception for now, by adding "
-                            f"'-- noqa: {self.code}' at the end\n"
-                            f"of line {exception_line}\n"
-                        ),
-                    )
                 )
-                return vs, context.raw_stack, fixes, context.memory
+            )
+            return False, memory
 
-            new_lerrs: List[SQLLintError] = []
-            new_fixes: List[LintFix] = []
+        new_lerrs: List[SQLLintError] = []
+        new_fixes: List[LintFix] = []
 
-            if res is None or res == []:
-                # Assume this means no problems (also means no memory)
-                pass
-            elif isinstance(res, LintResult):
-                # Extract any memory
-                memory = res.memory
-                self._adjust_anchors_for_fixes(context, res)
+        if res is None or res == []:
+            # Assume this means no problems (also means no memory)
+            pass
+        elif isinstance(res, LintResult):
+            # Extract any memory
+            memory = res.memory
+            self._adjust_anchors_for_fixes(context, res)
+            self._process_lint_result(
+                res, templated_file, ignore_mask, new_lerrs, new_fixes, tree
+            )
+        elif isinstance(res, list) and all(
+            isinstance(elem, LintResult) for elem in res
+        ):
+            # Extract any memory from the *last* one, assuming
+            # it was the last to be added
+            memory = res[-1].memory
+            for elem in res:
+                self._adjust_anchors_for_fixes(context, elem)
                 self._process_lint_result(
-                    res, templated_file, ignore_mask, new_lerrs, new_fixes, tree
+                    elem, templated_file, ignore_mask, new_lerrs, new_fixes, tree
                 )
-            elif isinstance(res, list) and all(
-                isinstance(elem, LintResult) for elem in res
-            ):
-                # Extract any memory from the *last* one, assuming
-                # it was the last to be added
-                memory = res[-1].memory
-                for elem in res:
-                    self._adjust_anchors_for_fixes(context, elem)
-                    self._process_lint_result(
-                        elem, templated_file, ignore_mask, new_lerrs, new_fixes, tree
-                    )
-            else:  # pragma: no cover
-                raise TypeError(
-                    "Got unexpected result [{!r}] back from linting rule: {!r}".format(
-                        res, self.code
-                    )
+        else:  # pragma: no cover
+            raise TypeError(
+                "Got unexpected result [{!r}] back from linting rule: {!r}".format(
+                    res, self.code
                 )
+            )
 
-            for lerr in new_lerrs:
-                self.logger.info("!! Violation Found: %r", lerr.description)
-            if new_fixes:
-                if not self.is_fix_compatible:  # pragma: no cover
-                    rules_logger.error(
-                        f"Rule {self.code} returned a fix but is not documented as "
-                        "`is_fix_compatible`, you may encounter unusual fixing "
-                        "behaviour. Report this a bug to the developer of this rule."
-                    )
-                for lfix in new_fixes:
-                    self.logger.info("!! Fix Proposed: %r", lfix)
+        for lerr in new_lerrs:
+            self.logger.info("!! Violation Found: %r", lerr.description)
+        if new_fixes:
+            if not self.is_fix_compatible:  # pragma: no cover
+                rules_logger.error(
+                    f"Rule {self.code} returned a fix but is not documented as "
+                    "`is_fix_compatible`, you may encounter unusual fixing "
+                    "behaviour. Report this a bug to the developer of this rule."
+                )
+            for lfix in new_fixes:
+                self.logger.info("!! Fix Proposed: %r", lfix)
 
-            # Consume the new results
-            vs += new_lerrs
-            fixes += new_fixes
-        return vs, context.raw_stack if context else tuple(), fixes, context.memory
+        # Consume the new results
+        vs += new_lerrs
+        fixes += new_fixes
+        return True, memory
+
+    @staticmethod
+    def crawl_together(
+        rules: Sequence["BaseRule"],
+        tree: BaseSegment,
+        dialect: "Dialect",
+        fix: bool,
+        templated_file: Optional["TemplatedFile"],
+        ignore_mask: Optional["IgnoreMask"],
+        fname: Optional[str],
+        config: "FluffConfig",
+    ) -> Dict[str, Tuple[List[SQLLintError], List[LintFix], float]]:
+        """Run several rules on a given tree, in a single traversal.
+
+        This gives the same results as calling `crawl()` for each rule in
+        turn, but walks the tree once rather than once per rule. Rules which
+        can't be crawled together (because they use another kind of crawler,
+        override `crawl()` or don't apply to this dialect) are left out.
+
+        Returns:
+            A dict, keyed by rule code, of the violations and fixes found by
+            each rule which was run, and the time spent evaluating it.
+        """
+        rules = [
+            rule
+            for rule in rules
+            if type(rule).crawl is BaseRule.crawl
+            and MultiplexingCrawler.supports(rule.crawl_behaviour)
+            and (rule.target_dialects is None or dialect.name in rule.target_dialects)
+        ]
+        if not rules:
+            return {}
+        crawler = MultiplexingCrawler(
+            [cast(SegmentSeekerCrawler, rule.crawl_behaviour) for rule in rules]
+        )
+        root_context = RuleContext(
+            dialect=dialect,
+            fix=fix,
+            templated_file=templated_file,
+            path=pathlib.Path(fname) if fname else None,
+            segment=tree,
+            config=config,
+        )
+        vs: List[List[SQLLintError]] = [[] for _ in rules]
+        fixes: List[List[LintFix]] = [[] for _ in rules]
+        # Each rule has its own memory, propagated between its evaluations.
+        memories: List[Any] = [{} for _ in rules]
+        timings = [0.0 for _ in rules]
+        # Rules which raised an exception aren't evaluated again.
+        stopped: Set[int] = set()
+        for idx, context in crawler.crawl(root_context):
+            if idx in stopped:
+                continue
+            t0 = time.monotonic()
+            ok, memories[idx] = rules[idx]._eval_context(
+                context,
+                memories[idx],
+                tree,
+                templated_file,
+                ignore_mask,
+                fname,
+                vs[idx],
+                fixes[idx],
+            )
+            timings[idx] += time.monotonic() - t0
+            if not ok:
+                stopped.add(idx)
+        return {
+            rule.code: (vs[idx], fixes[idx], timings[idx])
+            for idx, rule in enumerate(rules)
+        }
 
     # HELPER METHODS --------
     @staticmethod
@@ -860,8 +1002,9 @@ class RulePack:
     required to interpret any noqa messages found in files.
 
     The reason for this object is that rules are filtered and instantiated
-    into this pack in the main process when running in multi-processing mode so
-    that user defined rules can be used without reference issues.
+    into this pack once for a given config. When running in multi-processing
+    mode, each worker process builds (and caches) its own packs, which means
+    any user defined rules must be importable from the worker processes.
 
     Attributes:
         rules (:obj:`list` of :obj:`BaseRule`): A filtered list of instantiated
@@ -2,7 +2,7 @@
 
 import pathlib
 from dataclasses import dataclass, field
-from typing import Any, Optional, Tuple
+from typing import Any, Optional, Set, Tuple
 
 from sqlfluff.core.config import FluffConfig
 from sqlfluff.core.dialects import Dialect
@@ -32,6 +32,11 @@ class RuleContext:
     memory: Any = field(default_factory=dict)
     # segment_idx: The index of this segment in the parent
     segment_idx: int = field(default=0)
+    # changed_uuids: During later fix loops, the uuids of segments which have
+    # changed since the rule last ran. Crawlers may use this to skip over
+    # regions which haven't changed. None means that all segments should be
+    # considered.
+    changed_uuids: Optional[Set[int]] = field(default=None)
 
     @property
     def siblings_pre(self) -> Tuple[BaseSegment, ...]:  # pragma: no cover
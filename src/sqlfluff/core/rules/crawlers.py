@@ -1,7 +1,19 @@
 """Definitions of crawlers."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterator, Set, cast
+from collections import defaultdict
+from typing import (
+    AbstractSet,
+    Any,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterator,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
 from sqlfluff.core.parser.segments.base import BaseSegment
 from sqlfluff.core.parser.segments.raw import RawSegment
@@ -27,6 +39,15 @@ class BaseCrawler(ABC):
         """
         return self.works_on_unparsable or not segment.is_type("unparsable")
 
+    def could_match(self, segment_types: AbstractSet[str]) -> bool:
+        """Could this crawler yield anything from a tree with these types?
+
+        This allows the linter to skip rules entirely for files which
+        don't contain anything they're looking for. By default crawlers
+        are assumed to match any tree.
+        """
+        return True
+
     @abstractmethod
     def crawl(self, context: RuleContext) -> Iterator[RuleContext]:
         """Yields a RuleContext for each segment the rule should process."""
@@ -73,6 +94,13 @@ class SegmentSeekerCrawler(BaseCrawler):
         """Does this segment match the relevant criteria."""
         return segment.is_type(*self.types)
 
+    def could_match(self, segment_types: AbstractSet[str]) -> bool:
+        """Could this crawler yield anything from a tree with these types?
+
+        Only if one of the types we're looking for is present.
+        """
+        return not self.types.isdisjoint(segment_types)
+
     def crawl(self, context: RuleContext) -> Iterator[RuleContext]:
         """Yields a RuleContext for each segment the rule should process.
 
@@ -91,6 +119,18 @@ class SegmentSeekerCrawler(BaseCrawler):
             self_match = True
             yield context
 
+        # If we've been told which segments have changed, and this one hasn't,
+        # then we don't need to look inside it. We only get here if the parent
+        # has changed, so this segment may still be affected by the change and
+        # is considered above.
+        if (
+            context.changed_uuids is not None
+            and context.segment.uuid not in context.changed_uuids
+        ):
+            if self.provide_raw_stack:  # pragma: no cover
+                context.raw_stack += tuple(context.segment.raw_segments)
+            return
+
         # Check whether any children?
         # Abort if not - we've already yielded self.
         # NOTE: This same clause also works if we did match but aren't
@@ -144,3 +184,120 @@ class ParentOfSegmentCrawler(SegmentSeekerCrawler):
         kind of segment.
         """
         return bool(self.types & segment.direct_descendant_type_set)
+
+
+class MultiplexingCrawler:
+    """A crawler which searches for segments on behalf of several crawlers.
+
+    Rather than each `SegmentSeekerCrawler` traversing the tree separately,
+    this traverses it once, and yields each segment along with the index of
+    each crawler which would have yielded it. Each crawler's filtering,
+    pruning and `allow_recurse` behaviour is preserved, so each crawler sees
+    exactly the segments it would see crawling alone, in the same order.
+
+    Only plain segment seeking crawlers are supported (see `supports()`),
+    and `changed_uuids` isn't, because multiplexing is only used when
+    linting rather than fixing.
+    """
+
+    def __init__(self, crawlers: Sequence[SegmentSeekerCrawler]) -> None:
+        assert all(self.supports(crawler) for crawler in crawlers)
+        self.crawlers = crawlers
+        # A dispatch table of the crawlers interested in each type. Crawlers
+        # looking for parents are dispatched on the types of their children.
+        self._by_type: DefaultDict[str, Set[int]] = defaultdict(set)
+        self._parents_by_type: DefaultDict[str, Set[int]] = defaultdict(set)
+        for idx, crawler in enumerate(crawlers):
+            table = (
+                self._parents_by_type
+                if isinstance(crawler, ParentOfSegmentCrawler)
+                else self._by_type
+            )
+            for seg_type in crawler.types:
+                table[seg_type].add(idx)
+        self._no_recurse = frozenset(
+            idx for idx, crawler in enumerate(crawlers) if not crawler.allow_recurse
+        )
+        self._on_unparsable = frozenset(
+            idx for idx, crawler in enumerate(crawlers) if crawler.works_on_unparsable
+        )
+        # Many segments share the same sets of types, so we cache lookups.
+        self._lookup_cache: Dict[Tuple[bool, FrozenSet[str]], FrozenSet[int]] = {}
+
+    @staticmethod
+    def supports(crawler: BaseCrawler) -> bool:
+        """Can this crawler be multiplexed with others?
+
+        Subclasses may override how segments are matched, so we only
+        support the exact classes we know about.
+        """
+        return (
+            type(crawler) in (SegmentSeekerCrawler, ParentOfSegmentCrawler)
+            and not cast(SegmentSeekerCrawler, crawler).provide_raw_stack
+        )
+
+    def _lookup(self, parents: bool, types: FrozenSet[str]) -> FrozenSet[int]:
+        """Find the crawlers interested in any of a set of types."""
+        key = (parents, types)
+        try:
+            return self._lookup_cache[key]
+        except KeyError:
+            table = self._parents_by_type if parents else self._by_type
+            result = frozenset(
+                idx for seg_type in types for idx in table.get(seg_type, ())
+            )
+            self._lookup_cache[key] = result
+            return result
+
+    def crawl(self, context: RuleContext) -> Iterator[Tuple[int, RuleContext]]:
+        """Yields each segment to process, with the index of each crawler.
+
+        The context is shared between crawlers and modified in place, so
+        it should be considered only valid until the next item is yielded.
+        """
+        assert context.changed_uuids is None
+        yield from self._crawl(context, frozenset(range(len(self.crawlers))))
+
+    def _crawl(
+        self, context: RuleContext, active: FrozenSet[int]
+    ) -> Iterator[Tuple[int, RuleContext]]:
+        segment = context.segment
+        parent_stack = context.parent_stack
+        segment_idx = context.segment_idx
+        if segment.is_type("unparsable"):
+            active = active & self._on_unparsable
+            if not active:
+                return
+
+        # Yield for each crawler matching the segment itself.
+        matched = active & self._lookup(False, segment.class_types)
+        if self._parents_by_type and segment.segments:
+            matched |= active & {
+                idx
+                for seg_type in segment.direct_descendant_type_set
+                for idx in self._parents_by_type.get(seg_type, ())
+            }
+        for idx in sorted(matched):
+            # Reset the context, in case it was modified after the last yield.
+            context.segment = segment
+            context.parent_stack = parent_stack
+            context.segment_idx = segment_idx
+            yield idx, context
+
+        if not segment.segments:
+            return
+        # Crawlers which don't recurse stop once they've matched, and we
+        # prune any crawlers which aren't looking for anything in here.
+        active = (active - (matched & self._no_recurse)) & (
+            self._lookup(False, segment.descendant_type_set)
+            | self._lookup(True, segment.descendant_type_set)
+        )
+        if not active:
+            return
+
+        new_parent_stack = parent_stack + (segment,)
+        for idx, child in enumerate(segment.segments):
+            context.segment = child
+            context.parent_stack = new_parent_stack
+            context.segment_idx = idx
+            yield from self._crawl(context, active)
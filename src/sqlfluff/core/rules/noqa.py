@@ -1,7 +1,9 @@
 """Defines container classes for handling noqa comments."""
 
+import bisect
 import fnmatch
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Set, Tuple, Union, cast
 
@@ -23,31 +25,51 @@ class NoQaDirective:
     raw_str: str = ""  # The raw representation of the directive for warnings.
     used: bool = False  # Has it been used.
 
-    def _filter_violations_single_line(
-        self, violations: List[SQLBaseError]
-    ) -> List[SQLBaseError]:
-        """Filter a list of violations based on this single line noqa.
 
-        Also record whether this class was _used_ in any of that filtering.
-
-        The "ignore" list is assumed to ONLY contain NoQaDirectives with
-        action=None.
+class _LineRangeIndex:
+    """The enable/disable directives which apply to a single rule.
+
+    The directives are sorted by line number, and alongside each we store
+    the disable directive (if any) which is in force after it. That
+    means the state at any line can be found by bisecting, rather than
+    walking all the directives before it.
+    """
+
+    def __init__(self, directives: List[NoQaDirective]):
+        self._directives = directives
+        self._lines = [directive.line_no for directive in directives]
+        self._active: List[Optional[NoQaDirective]] = []
+        # Enables which counteract a disable, and how many of those
+        # are before the furthest line we've looked up so far.
+        self._counteracting: List[int] = []
+        self._used_upto = 0
+        active: Optional[NoQaDirective] = None
+        for idx, directive in enumerate(directives):
+            if directive.action == "enable":
+                if active:
+                    self._counteracting.append(idx)
+                active = None
+            elif directive.action == "disable":
+                active = directive
+            self._active.append(active)
+
+    def lookup(self, line_no: int) -> Optional[NoQaDirective]:
+        """Return the disable directive in force at line_no, if any.
+
+        Any enable directives which counteract a disable before line_no
+        (and any enable which immediately follows it) are marked as used.
         """
-        assert not self.action
-        matched_violations = [
-            v
-            for v in violations
-            if (
-                v.line_no == self.line_no
-                and (self.rules is None or v.rule_code() in self.rules)
-            )
-        ]
-        if matched_violations:
-            # Successful match, mark ignore as used.
-            self.used = True
-            return [v for v in violations if v not in matched_violations]
-        else:
-            return violations
+        idx = bisect.bisect_right(self._lines, line_no)
+        # Peek at the next directive to see if it's an enable.
+        if idx < len(self._directives) and self._directives[idx].action == "enable":
+            self._directives[idx].used = True
+        while (
+            self._used_upto < len(self._counteracting)
+            and self._counteracting[self._used_upto] < idx
+        ):
+            self._directives[self._counteracting[self._used_upto]].used = True
+            self._used_upto += 1
+        return self._active[idx - 1] if idx else None
 
 
 class IgnoreMask:
@@ -55,10 +77,26 @@ class IgnoreMask:
 
     def __init__(self, ignores: List[NoQaDirective]):
         self._ignore_list = ignores
+        # Single line directives, by the line they apply to.
+        self._line_directives: Dict[int, List[NoQaDirective]] = defaultdict(list)
+        for ignore in ignores:
+            if not ignore.action:
+                self._line_directives[ignore.line_no].append(ignore)
+        self._range_directives = sorted(
+            (ignore for ignore in ignores if ignore.action),
+            key=lambda ignore: ignore.line_no,
+        )
+        # Indexes of the range directives for each rule, built as needed.
+        self._range_indexes: Dict[str, _LineRangeIndex] = {}
 
     def __repr__(self) -> str:  # pragma: no cover
         return "<IgnoreMask>"
 
+    @property
+    def directives(self) -> List[NoQaDirective]:
+        """The directives in this mask, in the order they were found."""
+        return self._ignore_list
+
     # ### Construction class methods.
 
     @staticmethod
@@ -216,90 +254,42 @@ class IgnoreMask:
 
     # ### Application methods.
 
-    @staticmethod
-    def _ignore_masked_violations_single_line(
-        violations: List[SQLBaseError], ignore_mask: List[NoQaDirective]
-    ) -> List[SQLBaseError]:
-        """Filter a list of violations based on this single line noqa.
-
-        The "ignore" list is assumed to ONLY contain NoQaDirectives with
-        action=None.
-        """
-        for ignore in ignore_mask:
-            violations = ignore._filter_violations_single_line(violations)
-        return violations
+    def _is_ignored_single_line(self, violation: SQLBaseError) -> bool:
+        """Returns whether to ignore a violation for single-line directives.
 
-    @staticmethod
-    def _should_ignore_violation_line_range(
-        line_no: int, ignore_rules: List[NoQaDirective]
-    ) -> Tuple[bool, Optional[NoQaDirective]]:
-        """Returns whether to ignore a violation at line_no.
-
-        Loop through the NoQaDirectives to find the state of things at
-        line_no. Assumptions about "ignore_rules":
-        - Contains directives for only ONE RULE, i.e. the rule that was
-          violated at line_no
-        - Sorted in ascending order by line number
+        The first directive on the violation's line which covers its rule
+        is marked as used.
         """
-        ignore = False
-        last_ignore: Optional[NoQaDirective] = None
-        for idx, ignore_rule in enumerate(ignore_rules):
-            if ignore_rule.line_no > line_no:
-                # Peak at the next rule to see if it's a matching disable
-                # and if it is, then mark it as used.
-                if ignore_rule.action == "enable":
-                    # Mark as used
-                    ignore_rule.used = True
-                break
-
-            if ignore_rule.action == "enable":
-                # First, if this enable did counteract a
-                # corresponding _disable_, then it has been _used_.
-                if last_ignore:
-                    ignore_rule.used = True
-                last_ignore = None
-                ignore = False
-            elif ignore_rule.action == "disable":
-                last_ignore = ignore_rule
-                ignore = True
-
-        return ignore, last_ignore
+        for ignore in self._line_directives.get(violation.line_no, ()):
+            if ignore.rules is None or violation.rule_code() in ignore.rules:
+                ignore.used = True
+                return True
+        return False
 
-    @classmethod
-    def _ignore_masked_violations_line_range(
-        cls, violations: List[SQLBaseError], ignore_mask: List[NoQaDirective]
-    ) -> List[SQLBaseError]:
-        """Returns whether to ignore error for line-range directives.
+    def _is_ignored_line_range(self, violation: SQLBaseError) -> bool:
+        """Returns whether to ignore a violation for line-range directives.
 
-        The "ignore" list is assumed to ONLY contain NoQaDirectives where
-        action is "enable" or "disable".
+        If it's ignored, the disable directive responsible is marked as used.
         """
-        result = []
-        for v in violations:
-            # Find the directives that affect the violated rule "v", either
+        rule_code = violation.rule_code()
+        range_index = self._range_indexes.get(rule_code)
+        if range_index is None:
+            # Find the directives that affect the violated rule, either
             # because they specifically reference it or because they don't
             # specify a list of rules, thus affecting ALL rules.
-            ignore_rule = sorted(
-                (
+            range_index = _LineRangeIndex(
+                [
                     ignore
-                    for ignore in ignore_mask
-                    if not ignore.rules or (v.rule_code() in ignore.rules)
-                ),
-                key=lambda ignore: ignore.line_no,
+                    for ignore in self._range_directives
+                    if not ignore.rules or rule_code in ignore.rules
+                ]
             )
-            # Determine whether to ignore the violation, based on the relevant
-            # enable/disable directives.
-            ignore, last_ignore = cls._should_ignore_violation_line_range(
-                v.line_no, ignore_rule
-            )
-            if not ignore:
-                result.append(v)
-            # If there was a previous ignore which mean that we filtered out
-            # a violation, then mark it as used.
-            elif last_ignore:
-                last_ignore.used = True
-
-        return result
+            self._range_indexes[rule_code] = range_index
+        last_ignore = range_index.lookup(violation.line_no)
+        if last_ignore:
+            last_ignore.used = True
+            return True
+        return False
 
     def ignore_masked_violations(
         self, violations: List[SQLBaseError]
@@ -310,13 +300,14 @@ class IgnoreMask:
         1. Filter out violations affected by single-line "noqa" directives.
         2. Filter out violations affected by disable/enable "noqa" directives.
         """
-        ignore_specific = [ignore for ignore in self._ignore_list if not ignore.action]
-        ignore_range = [ignore for ignore in self._ignore_list if ignore.action]
-        violations = self._ignore_masked_violations_single_line(
-            violations, ignore_specific
-        )
-        violations = self._ignore_masked_violations_line_range(violations, ignore_range)
-        return violations
+        if not self._ignore_list:
+            return violations
+        return [
+            v
+            for v in violations
+            if not self._is_ignored_single_line(v)
+            and not self._is_ignored_line_range(v)
+        ]
 
     def generate_warnings_for_unused(self) -> List[SQLBaseError]:
         """Generates warnings for any unused NoQaDirectives."""
@@ -1,7 +1,7 @@
 """Defines the templaters."""
 
 import logging
-from bisect import bisect_left
+from bisect import bisect_left, bisect_right
 from typing import (
     Any,
     Callable,
@@ -239,6 +239,24 @@ class TemplatedFile:
                     f"{len(templated_str)} != {tfs.templated_slice.stop}."
                 )
 
+        # Precalculate the boundaries of the slices, so that we can map
+        # positions by bisecting rather than by scanning the slices. Both
+        # are sorted, as the checks above ensure the slices are contiguous.
+        self._templated_slice_starts = [
+            tfs.templated_slice.start for tfs in self.sliced_file
+        ]
+        self._templated_slice_stops = [
+            tfs.templated_slice.stop for tfs in self.sliced_file
+        ]
+        self._raw_slice_starts = [rfs.source_idx for rfs in self.raw_sliced]
+        # The running count of non-literal raw slices, such that the number
+        # in `raw_sliced[i:j]` is `counts[j] - counts[i]`.
+        self._raw_non_literal_counts = [0]
+        for rfs in self.raw_sliced:
+            self._raw_non_literal_counts.append(
+                self._raw_non_literal_counts[-1] + (rfs.slice_type != "literal")
+            )
+
     @classmethod
     def from_string(cls, raw: str) -> "TemplatedFile":
         """Create TemplatedFile from a string."""
@@ -291,26 +309,22 @@ class TemplatedFile:
         NB: the last_idx is exclusive, as the intent is to use this as a slice.
         """
         start_idx = start_idx or 0
-        first_idx: Optional[int] = None
-        last_idx = start_idx
-        # Work through the sliced file, starting at the start_idx if given
-        # as an optimisation hint. The sliced_file is a list of TemplatedFileSlice
-        # which reference parts of the templated file and where they exist in the
-        # source.
-        for idx, elem in enumerate(self.sliced_file[start_idx:]):
-            last_idx = idx + start_idx
-            if elem[2].stop >= templated_pos:
-                if first_idx is None:
-                    first_idx = idx + start_idx
-                if elem[2].start > templated_pos:
-                    break
-                elif not inclusive and elem[2].start >= templated_pos:
-                    break
-        # If we got to the end add another index
-        else:
-            last_idx += 1
-        if first_idx is None:  # pragma: no cover
+        # The first slice (from the start_idx if given) which ends at or
+        # after this point.
+        first_idx = bisect_left(self._templated_slice_stops, templated_pos, start_idx)
+        if first_idx >= len(self.sliced_file):  # pragma: no cover
             raise ValueError("Position Not Found")
+        # The first slice which starts after this point (or at it, if not
+        # inclusive), or the end of the file. Because the slices are sorted,
+        # this can't be before the first_idx.
+        if inclusive:
+            last_idx = bisect_right(
+                self._templated_slice_starts, templated_pos, start_idx
+            )
+        else:
+            last_idx = bisect_left(
+                self._templated_slice_starts, templated_pos, start_idx
+            )
         return first_idx, last_idx
 
     def raw_slices_spanning_source_slice(
@@ -321,24 +335,18 @@ class TemplatedFile:
         last_raw_slice = self.raw_sliced[-1]
         if source_slice.start >= last_raw_slice.source_idx + len(last_raw_slice.raw):
             return []
-        # First find the start index
-        raw_slice_idx = 0
-        # Move the raw pointer forward to the start of this patch
-        while (
-            raw_slice_idx + 1 < len(self.raw_sliced)
-            and self.raw_sliced[raw_slice_idx + 1].source_idx <= source_slice.start
-        ):
-            raw_slice_idx += 1
-        # Find slice index of the end of this patch.
-        slice_span = 1
-        while (
-            raw_slice_idx + slice_span < len(self.raw_sliced)
-            and self.raw_sliced[raw_slice_idx + slice_span].source_idx
-            < source_slice.stop
-        ):
-            slice_span += 1
+        # First find the index of the last slice starting at or before the
+        # start of this patch.
+        raw_slice_idx = max(
+            bisect_right(self._raw_slice_starts, source_slice.start) - 1, 0
+        )
+        # Then the index of the first slice (after that) which starts at or
+        # after the end of this patch.
+        stop_idx = bisect_left(
+            self._raw_slice_starts, source_slice.stop, raw_slice_idx + 1
+        )
         # Return the raw slices:
-        return self.raw_sliced[raw_slice_idx : raw_slice_idx + slice_span]
+        return self.raw_sliced[raw_slice_idx:stop_idx]
 
     def templated_slice_to_source_slice(
         self,
@@ -397,11 +405,11 @@ class TemplatedFile:
 
         # Update starting position based on insertion point:
         if insertion_point >= 0:
-            for elem in self.sliced_file[ts_start_sf_start:]:
-                if elem[1].start != insertion_point:
-                    ts_start_sf_start += 1
-                else:
-                    break
+            while (
+                ts_start_sf_start < len(self.sliced_file)
+                and self.sliced_file[ts_start_sf_start][1].start != insertion_point
+            ):
+                ts_start_sf_start += 1
 
         subslices = self.sliced_file[
             # Very inclusive slice
@@ -464,20 +472,18 @@ class TemplatedFile:
         # Zero length slice. It's a literal, because it's definitely not templated.
         if source_slice.start == source_slice.stop:
             return True
-        is_literal = True
-        for raw_slice in self.raw_sliced:
-            # Reset if we find a literal and we're up to the start
-            # otherwise set false.
-            if raw_slice.source_idx <= source_slice.start:
-                is_literal = raw_slice.slice_type == "literal"
-            elif raw_slice.source_idx >= source_slice.stop:
-                # We've gone past the end. Break and Return.
-                break
-            else:
-                # We're in the middle. Check type
-                if raw_slice.slice_type != "literal":
-                    is_literal = False
-        return is_literal
+        # Find the last slice starting at or before the start of the source
+        # slice. That's the one it starts in.
+        start_idx = bisect_right(self._raw_slice_starts, source_slice.start) - 1
+        if start_idx >= 0 and self.raw_sliced[start_idx].slice_type != "literal":
+            return False
+        # Then check that any others which start within it are literal too.
+        # NOTE: As the slice has length, this is never before `start_idx + 1`.
+        stop_idx = bisect_left(self._raw_slice_starts, source_slice.stop)
+        return (
+            self._raw_non_literal_counts[stop_idx]
+            == self._raw_non_literal_counts[start_idx + 1]
+        )
 
     def source_only_slices(self) -> List[RawFileSlice]:
         """Return a list a slices which reference the parts only in the source.
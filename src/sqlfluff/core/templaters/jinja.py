@@ -1,13 +1,16 @@
 """Defines the templaters."""
 
 import copy
+import hashlib
 import importlib
 import importlib.util
 import logging
 import os.path
 import pkgutil
 import sys
+from collections import OrderedDict
 from functools import reduce
+from types import CodeType
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -27,12 +30,16 @@ from typing import (
 import jinja2.nodes
 import jinja2.parser
 from jinja2 import (
+    BytecodeCache,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
+    Template,
     TemplateError,
     TemplateSyntaxError,
     meta,
 )
+from jinja2.bccache import Bucket
 from jinja2.exceptions import TemplateNotFound, UndefinedError
 from jinja2.ext import Extension
 from jinja2.sandbox import SandboxedEnvironment
@@ -98,6 +105,176 @@ class UndefinedRecorder:
         yield UndefinedRecorder(f"iter({self.name})", self.undefined_set)
 
 
+def _environment_fingerprint(env: Environment) -> str:
+    """Identify the settings of an environment which affect compilation.
+
+    The code compiled from a template depends on the syntax and extensions
+    of the environment, and on the filters and tests available (which are
+    resolved at compile time), but not on the context it's rendered with.
+    """
+    parts = [
+        jinja2.__version__,
+        f"{type(env).__module__}.{type(env).__qualname__}",
+        repr(
+            (
+                env.block_start_string,
+                env.block_end_string,
+                env.variable_start_string,
+                env.variable_end_string,
+                env.comment_start_string,
+                env.comment_end_string,
+                env.line_statement_prefix,
+                env.line_comment_prefix,
+                env.trim_blocks,
+                env.lstrip_blocks,
+                env.newline_sequence,
+                env.keep_trailing_newline,
+                env.optimized,
+                env.autoescape,
+                env.finalize is not None,
+                env.is_async,
+            )
+        ),
+        *sorted(env.extensions),
+    ]
+    for kind, funcs in (("filter", env.filters), ("test", env.tests)):
+        parts.extend(
+            f"{kind}:{name}={getattr(func, '__qualname__', type(func).__qualname__)}"
+            for name, func in sorted(funcs.items())
+        )
+    return hashlib.sha1("\n".join(parts).encode("utf8")).hexdigest()
+
+
+class JinjaBytecodeCache(BytecodeCache):
+    """A cache of compiled templates, shared between environments.
+
+    Each file is rendered with its own environment, and the slicing of a
+    file renders several (slightly modified) copies of it. Caching the
+    compiled code, keyed on the source of the template and the fingerprint
+    of the environment, means that each distinct template is only compiled
+    once per process. This covers templates rendered from strings, and
+    those loaded by jinja itself (e.g. with `{% include %}`).
+
+    If a `directory` is given, then compiled templates are also stored
+    there, to be reused by later runs.
+    """
+
+    def __init__(self, directory: Optional[str] = None, size: int = 256) -> None:
+        self.size = size
+        self._code: "OrderedDict[str, Tuple[str, CodeType]]" = OrderedDict()
+        self._disk: Optional[FileSystemBytecodeCache] = None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._disk = FileSystemBytecodeCache(directory)
+
+    def get_bucket(
+        self,
+        environment: Environment,
+        name: str,
+        filename: Optional[str],
+        source: str,
+    ) -> Bucket:
+        """Return a cache bucket for the given template and environment."""
+        return super().get_bucket(
+            environment,
+            f"{_environment_fingerprint(environment)}|{name}",
+            filename,
+            source,
+        )
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load the compiled code for a bucket, if we have it."""
+        entry = self._code.get(bucket.key)
+        if entry and entry[0] == bucket.checksum:
+            self._code.move_to_end(bucket.key)
+            bucket.code = entry[1]
+        elif self._disk:
+            self._disk.load_bytecode(bucket)
+            if bucket.code is not None:
+                self._remember(bucket)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Store the compiled code for a bucket."""
+        self._remember(bucket)
+        if self._disk:
+            self._disk.dump_bytecode(bucket)
+
+    def clear(self) -> None:
+        """Clear the cache, including any compiled templates on disk."""
+        self._code.clear()
+        if self._disk:
+            self._disk.clear()
+
+    def _remember(self, bucket: Bucket) -> None:
+        assert bucket.code is not None
+        self._code[bucket.key] = (bucket.checksum, bucket.code)
+        self._code.move_to_end(bucket.key)
+        while len(self._code) > self.size:
+            self._code.popitem(last=False)
+
+    def from_string(
+        self,
+        env: Environment,
+        source: str,
+        globals: Optional[Dict[str, Any]] = None,
+    ) -> Template:
+        """Load a template from a string, like `Environment.from_string()`.
+
+        Unlike templates loaded by jinja, those from strings don't have a
+        name, so the source itself is used to identify them.
+        """
+        name = "<string>:" + hashlib.sha1(source.encode("utf8")).hexdigest()
+        bucket = self.get_bucket(env, name, None, source)
+        code = bucket.code
+        if code is None:
+            code = env.compile(source)
+            bucket.code = code
+            self.set_bucket(bucket)
+        return env.template_class.from_code(env, code, env.make_globals(globals))
+
+
+# Bytecode caches, one per cache directory (and one for the in memory only
+# cache), reused by all the environments in this process.
+_bytecode_caches: Dict[Optional[str], JinjaBytecodeCache] = {}
+
+
+def get_bytecode_cache(directory: Optional[str] = None) -> JinjaBytecodeCache:
+    """Get the shared bytecode cache for the given directory."""
+    if directory not in _bytecode_caches:
+        _bytecode_caches[directory] = JinjaBytecodeCache(directory)
+    return _bytecode_caches[directory]
+
+
+# Macros loaded from paths and config, cached per process and keyed on the
+# config, the templater's own context and the modification times of the
+# macro files. Each entry may hold many macros, so the cache is bounded.
+MACRO_CACHE_SIZE = 16
+_macro_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Macro]]" = OrderedDict()
+
+
+def _macro_files_signature(paths: List[str]) -> Tuple[Tuple[str, int, int], ...]:
+    """Identify the versions of the macro files in the given paths.
+
+    This mirrors the files read by `JinjaTemplater._extract_macros_from_path`,
+    returning the path, modification time and size of each.
+    """
+    signature = []
+    for path_entry in paths:
+        if os.path.isfile(path_entry):
+            fnames = [path_entry]
+        else:
+            fnames = [
+                os.path.join(dirpath, fname)
+                for dirpath, _, files in os.walk(path_entry)
+                for fname in files
+                if fname.endswith(".sql")
+            ]
+        for fname in fnames:
+            stat = os.stat(fname)
+            signature.append((fname, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
 class JinjaTemplater(PythonTemplater):
     """A templater using the jinja2 library.
 
@@ -111,6 +288,20 @@ class JinjaTemplater(PythonTemplater):
 
         pass
 
+    @staticmethod
+    def _from_string(
+        env: Environment, source: str, globals: Optional[Dict[str, Any]] = None
+    ) -> Template:
+        """Load a template from a string, reusing compiled code if we can.
+
+        This uses the environment's bytecode cache if it's a
+        `JinjaBytecodeCache` (which it is unless a subclass has configured
+        the environment differently).
+        """
+        if isinstance(env.bytecode_cache, JinjaBytecodeCache):
+            return env.bytecode_cache.from_string(env, source, globals=globals)
+        return env.from_string(source, globals=globals)
+
     @staticmethod
     def _extract_macros_from_template(
         template: str, env: Environment, ctx: Dict[str, Any]
@@ -128,9 +319,9 @@ class JinjaTemplater(PythonTemplater):
 
         # Iterate through keys exported from the loaded template string
         context: Dict[str, Macro] = {}
-        # NOTE: `env.from_string()` will raise TemplateSyntaxError if `template`
+        # NOTE: `_from_string()` will raise TemplateSyntaxError if `template`
         # is invalid.
-        macro_template = env.from_string(template, globals=ctx)
+        macro_template = JinjaTemplater._from_string(env, template, globals=ctx)
 
         # This is kind of low level and hacky but it works
         try:
@@ -352,7 +543,9 @@ class JinjaTemplater(PythonTemplater):
         regular FileSystemLoader. It then sets the extensions to ['jinja2.ext.do']
         and adds the DBTTestExtension if the _apply_dbt_builtins method returns
         True. Finally, it returns a SandboxedEnvironment object with the
-        specified settings.
+        specified settings, and with a bytecode cache which is shared by all
+        environments (and optionally stored on disk, in the directory set by
+        'bytecode_cache_dir').
 
         Args:
             config (dict, optional): A dictionary containing configuration settings.
@@ -400,6 +593,13 @@ class JinjaTemplater(PythonTemplater):
             autoescape=False,
             extensions=extensions,
             loader=loader,
+            bytecode_cache=get_bytecode_cache(
+                config.get_section(
+                    (self.templater_selector, self.name, "bytecode_cache_dir")
+                )
+                if config
+                else None
+            ),
         )
 
     def _get_macros_path(
@@ -538,30 +738,74 @@ class JinjaTemplater(PythonTemplater):
                     if name not in live_context:
                         live_context[name] = DBT_BUILTINS[name]
 
-        # Load macros from path (if applicable)
+        # Load macros from path and config (if applicable)
         if config:
-            macros_path = self._get_macros_path(config, "load_macros_from_path")
-            exclude_macros_path = self._get_macros_path(
-                config, "exclude_macros_from_path"
-            )
-            if macros_path:
-                live_context.update(
-                    self._extract_macros_from_path(
-                        macros_path,
-                        env=env,
-                        ctx=live_context,
-                        exclude_paths=exclude_macros_path,
-                    )
-                )
+            live_context.update(self._load_macros(config, env, live_context))
+
+        return live_context
+
+    def _load_macros(
+        self, config: FluffConfig, env: Environment, ctx: Dict[str, Any]
+    ) -> Dict[str, "Macro"]:
+        """Load the macros from the macro paths and the config.
+
+        Loading macros means reading and compiling every macro file, which
+        can be slow for projects with many macros, so they're cached for
+        the life of the process. The macros only depend on the context and
+        environment (both derived from the config and this templater) and
+        on the macro files themselves. Each file then only has to bind the
+        macros into its own context.
 
-            # Load config macros, these will take precedence over macros from the path
-            live_context.update(
-                self._extract_macros_from_config(
-                    config=config, env=env, ctx=live_context
+        NOTE: The cached macros keep the environment and context of the
+        file which first loaded them, but as the cache key covers all the
+        inputs to those, they behave identically.
+
+        Args:
+            config: The config to load macros with.
+            env: The environment.
+            ctx: The context, without any macros.
+
+        Returns:
+            dict: A dictionary containing the loaded macros.
+        """
+        macros_path = self._get_macros_path(config, "load_macros_from_path")
+        key = (
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            repr(sorted(self.default_context.items())),
+            repr(sorted(self.override_context.items())),
+            config.fingerprint(),
+            _macro_files_signature(macros_path or []),
+        )
+        try:
+            macros = _macro_cache[key]
+            _macro_cache.move_to_end(key)
+            return macros
+        except KeyError:
+            pass
+
+        macros = {}
+        if macros_path:
+            macros.update(
+                self._extract_macros_from_path(
+                    macros_path,
+                    env=env,
+                    ctx=ctx,
+                    exclude_paths=self._get_macros_path(
+                        config, "exclude_macros_from_path"
+                    ),
                 )
             )
+        # Load config macros, these will take precedence over macros from the path
+        macros.update(
+            self._extract_macros_from_config(
+                config=config, env=env, ctx={**ctx, **macros}
+            )
+        )
 
-        return live_context
+        _macro_cache[key] = macros
+        if len(_macro_cache) > MACRO_CACHE_SIZE:
+            _macro_cache.popitem(last=False)
+        return macros
 
     def construct_render_func(
         self, fname: Optional[str] = None, config: Optional[FluffConfig] = None
@@ -594,7 +838,7 @@ class JinjaTemplater(PythonTemplater):
             https://www.programiz.com/python-programming/closure
             """
             try:
-                template = env.from_string(in_str, globals=live_context)
+                template = self._from_string(env, in_str, globals=live_context)
             except TemplateSyntaxError as err:  # pragma: no cover
                 # NOTE: If the template fails to parse, then this clause
                 # will be triggered. However in normal that should never
@@ -0,0 +1,87 @@
+"""Opt-in tracing of the stages of linting.
+
+When enabled, spans are recorded for each stage of processing a file
+(loading config, templating, lexing, parsing, running each rule in each
+linter loop and applying fixes). They can be written out in the Chrome
+trace event format, to be viewed in a tool such as https://ui.perfetto.dev.
+
+Tracing is enabled per process. Parallel runners record the spans within
+each worker process while linting a file, and send them back to the main
+process with the result.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+TraceEvent = Dict[str, Any]
+
+# The events recorded so far, or None if tracing isn't enabled.
+_events: Optional[List[TraceEvent]] = None
+
+
+def start_tracing() -> None:
+    """Start recording spans in this process."""
+    global _events
+    if _events is None:
+        _events = []
+
+
+def stop_tracing() -> List[TraceEvent]:
+    """Stop recording spans in this process, and return those recorded."""
+    global _events
+    events, _events = _events or [], None
+    return events
+
+
+def is_tracing() -> bool:
+    """Are spans being recorded in this process?"""
+    return _events is not None
+
+
+def add_trace_events(events: List[TraceEvent]) -> None:
+    """Add events recorded elsewhere (e.g. in a worker process)."""
+    if _events is not None:
+        _events.extend(events)
+
+
+@contextmanager
+def trace_span(name: str, category: str, **args: Any) -> Iterator[Dict[str, Any]]:
+    """Record a span around a block of code, if tracing is enabled.
+
+    Any keyword arguments (e.g. the file or rule code) are attached to the
+    span. The same dict is yielded, so that further arguments can be added
+    from within the block.
+    """
+    events = _events
+    if events is None:
+        yield args
+        return
+    # NOTE: We use wall clock time so that spans from different processes
+    # line up with each other.
+    start = time.time_ns()
+    try:
+        yield args
+    finally:
+        end = time.time_ns()
+        events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start / 1000,
+                "dur": (end - start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+
+def write_trace(path: str, events: List[TraceEvent]) -> None:
+    """Write events to a file in the Chrome trace event format."""
+    with open(path, "w", encoding="utf8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
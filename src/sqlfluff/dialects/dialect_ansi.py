@@ -777,6 +777,7 @@ class FileSegment(BaseFileSegment):
         allow_gaps=True,
         allow_trailing=True,
     )
+    can_parse_statements_separately = True
 
     def get_table_references(self) -> Set[str]:
         """Use parsed tree to extract table references."""
@@ -92,6 +92,7 @@ class Rule_AL09(BaseRule):
     groups = ("all", "core", "aliasing")
     crawl_behaviour = SegmentSeekerCrawler({"select_clause"})
     is_fix_compatible = True
+    is_context_local = True
 
     def _eval(self, context: RuleContext) -> EvalResultType:
         """Find self-aliased columns and fix them.
@@ -60,6 +60,7 @@ class Rule_CV04(BaseRule):
     config_keywords = ["prefer_count_1", "prefer_count_0"]
     crawl_behaviour = SegmentSeekerCrawler({"function"})
     is_fix_compatible = True
+    is_context_local = True
 
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
         """Find rule violations and provide fixes."""
@@ -35,6 +35,7 @@ class Rule_LT06(BaseRule):
     groups = ("all", "core", "layout")
     crawl_behaviour = SegmentSeekerCrawler({"function"})
     is_fix_compatible = True
+    is_context_local = True
 
     def _eval(self, context: RuleContext) -> LintResult:
         """Function name not immediately followed by bracket.
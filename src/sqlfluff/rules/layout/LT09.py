@@ -81,6 +81,7 @@ class Rule_LT09(BaseRule):
     config_keywords = ["wildcard_policy"]
     crawl_behaviour = SegmentSeekerCrawler({"select_clause"})
     is_fix_compatible = True
+    is_context_local = True
 
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
         self.wildcard_policy: str
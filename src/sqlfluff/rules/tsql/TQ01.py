@@ -57,13 +57,11 @@ class Rule_TQ01(BaseRule):
     aliases = ("L056",)
     groups = ("all", "tsql")
     crawl_behaviour = SegmentSeekerCrawler({"create_procedure_statement"})
+    # Rule only applies to T-SQL syntax.
+    target_dialects = frozenset({"tsql"})
 
     def _eval(self, context: RuleContext) -> Optional[LintResult]:
         r"""``SP_`` prefix should not be used for user-defined stored procedures."""
-        # Rule only applies to T-SQL syntax.
-        if context.dialect.name != "tsql":
-            return None  # pragma: no cover
-
         # We are only interested in CREATE PROCEDURE statements.
         assert context.segment.is_type("create_procedure_statement")
 
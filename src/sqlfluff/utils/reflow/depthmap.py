@@ -125,7 +125,7 @@ class DepthMap:
     """
 
     def __init__(self, raws_with_stack: Sequence[Tuple[RawSegment, List[PathStep]]]):
-        self.depth_info = {}
+        self.depth_info: Dict[int, DepthInfo] = {}
         for raw, stack in raws_with_stack:
             self.depth_info[raw.uuid] = DepthInfo.from_raw_and_stack(raw, stack)
 
@@ -134,9 +134,49 @@ class DepthMap:
         """Generate a DepthMap from all the children of a segment.
 
         NOTE: This is the most efficient way to construct a DepthMap
-        due to caching in the BaseSegment.
+        because we work down from the parent, so the information for
+        each ancestor is only worked out once, rather than once for
+        every raw segment within it.
         """
-        return cls(raws_with_stack=parent.raw_segments_with_ancestors)
+        depth_map = cls(raws_with_stack=())
+        depth_map._map_children(parent, (), (), {})
+        return depth_map
+
+    def _map_children(
+        self,
+        segment: BaseSegment,
+        stack_hashes: Tuple[int, ...],
+        stack_class_types: Tuple[FrozenSet[str], ...],
+        stack_positions: Dict[int, StackPosition],
+    ) -> None:
+        """Add the depth info for the raw segments within a segment.
+
+        The arguments describe the stack of ancestors above `segment`,
+        and the result is equivalent to calling `DepthInfo.from_raw_and_stack`
+        for each raw with the stack from `path_to`.
+        """
+        segment_hash = hash(segment)
+        stack_hashes += (segment_hash,)
+        stack_hash_set = frozenset(stack_hashes)
+        stack_class_types += (segment.class_types,)
+        code_idxs = segment._code_indices
+        for idx, child in enumerate(segment.segments):
+            positions = {
+                **stack_positions,
+                segment_hash: StackPosition.from_path_step(
+                    PathStep(segment, idx, len(segment.segments), code_idxs)
+                ),
+            }
+            if child.is_type("raw"):
+                self.depth_info[child.uuid] = DepthInfo(
+                    stack_depth=len(stack_hashes),
+                    stack_hashes=stack_hashes,
+                    stack_hash_set=stack_hash_set,
+                    stack_class_types=stack_class_types,
+                    stack_positions=positions,
+                )
+            else:
+                self._map_children(child, stack_hashes, stack_class_types, positions)
 
     @classmethod
     def from_raws_and_root(
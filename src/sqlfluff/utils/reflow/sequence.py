@@ -1,6 +1,8 @@
 """Dataclasses for reflow work."""
 
 import logging
+import threading
+import weakref
 from itertools import chain
 from typing import Iterator, List, Optional, Sequence, Tuple, Type, cast
 
@@ -28,6 +30,15 @@ from sqlfluff.utils.reflow.reindent import (
 # of the rules logger.
 reflow_logger = logging.getLogger("sqlfluff.rules.reflow")
 
+# The elements and depth map most recently built by `ReflowSequence.from_root`.
+# Several layout rules build a sequence for the whole file, so while the tree
+# is unchanged (i.e. until fixes are applied to it), they can share them. This
+# is per thread, because files may be linted in parallel threads.
+# NOTE: We only keep a weak reference to the root segment. Keeping old trees
+# alive would also keep alive the (stale) parent references of any segments
+# shared with newer trees, which would confuse `BaseSegment.path_to()`.
+_root_cache = threading.local()
+
 
 class ReflowSequence:
     """Class for keeping track of elements in a reflow operation.
@@ -215,13 +226,37 @@ class ReflowSequence:
                 segment (usually the base :obj:`FileSegment`).
             config (:obj:`FluffConfig`): A config object from which
                 to load the spacing behaviours of different segments.
+
+        The elements and depth map for the most recent root segment are
+        cached, so that repeated calls for an unchanged tree (e.g. from
+        several layout rules in the same linter loop) don't rebuild them.
         """
-        return cls.from_raw_segments(
-            root_segment.raw_segments,
-            root_segment,
-            config=config,
+        reflow_config = ReflowConfig.from_fluff_config(config)
+        cached = getattr(_root_cache, "entry", None)
+        # NOTE: Segments compare equal by content and position, so we use
+        # identity to check that this is exactly the same tree.
+        if cached and cached[0]() is root_segment and cached[1] == reflow_config:
+            elements, depth_map = cached[2], cached[3]
+        else:
             # This is the efficient route. We use it here because we can.
-            depth_map=DepthMap.from_parent(root_segment),
+            depth_map = DepthMap.from_parent(root_segment)
+            elements = cls._elements_from_raw_segments(
+                root_segment.raw_segments,
+                reflow_config=reflow_config,
+                depth_map=depth_map,
+            )
+            _root_cache.entry = (
+                weakref.ref(root_segment),
+                reflow_config,
+                elements,
+                depth_map,
+            )
+        return cls(
+            # Copy the elements, so that the cached list can't be mutated.
+            elements=elements.copy(),
+            root_segment=root_segment,
+            reflow_config=reflow_config,
+            depth_map=depth_map,
         )
 
     @classmethod
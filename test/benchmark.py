@@ -0,0 +1,389 @@
+"""Utility to benchmark the stages of linting on a corpus of SQL files.
+
+The corpus is made up of the parsing fixtures for each dialect (in
+`test/fixtures/dialects`), and synthetic templated files of several sizes.
+For each case we measure the throughput of templating, lexing, parsing,
+linting and fixing, the peak memory use and the time spent in each rule.
+
+Results can be saved as a baseline, and later runs compared against it:
+
+    python test/benchmark.py --dialect ansi --save-baseline baseline.json
+    python test/benchmark.py --dialect ansi --baseline baseline.json
+
+When comparing, the run fails if the throughput of any stage falls (or
+the peak memory use rises) by more than the threshold. Baselines are only
+comparable when taken on the same machine, so for CI they should be taken
+from the target branch in the same job.
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import click
+from conftest import get_parse_fixtures, make_dialect_path
+
+from sqlfluff.core import FluffConfig, Linter
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # Not available on Windows.
+    resource = None  # type: ignore
+
+STAGES = ("template", "lex", "parse", "lint", "fix")
+
+# The statements repeated to make up each synthetic file. The jinja
+# variables mean that each file exercises the templater too.
+SYNTHETIC_STATEMENTS = (
+    """select
+    o.order_id,
+    c.customer_name,
+    sum(o.amount) as total_amount_{idx},
+    count(distinct o.product_id) as products
+from {{{{ schema }}}}.orders as o
+inner join {{{{ schema }}}}.customers as c on o.customer_id = c.customer_id
+where o.created_at > '2024-01-01' and c.region in ('north', 'south')
+group by o.order_id, c.customer_name
+having sum(o.amount) > {idx};
+""",
+    """with recent as (
+    select order_id, amount, row_number() over (
+        partition by customer_id order by created_at desc
+    ) as rn
+    from {{{{ schema }}}}.orders
+)
+SELECT Order_Id, Amount * 1.2 AS Amount_With_Tax_{idx}
+FROM recent WHERE rn = 1 ;
+""",
+    """insert into {{{{ schema }}}}.order_summary (customer_id, total)
+select customer_id,
+       case when sum(amount) > 100 then 'high'
+            when sum(amount) > {idx} then 'medium'
+            else 'low' end as band
+from {{{{ schema }}}}.orders group by customer_id;
+""",
+    """update {{{{ schema }}}}.customers set last_seen = current_timestamp
+where customer_id in (select customer_id from {{{{ schema }}}}.orders
+    where amount>{idx});
+""",
+)
+
+
+class BenchmarkCase(NamedTuple):
+    """A case to benchmark, either a dialect corpus or a synthetic file."""
+
+    name: str
+    dialect: str
+    # Paths of the files in a dialect corpus.
+    paths: Tuple[str, ...] = ()
+    # The approximate size of a synthetic file, in kilobytes.
+    size_kb: int = 0
+
+
+def generate_synthetic_sql(size_kb: int) -> str:
+    """Generate a templated SQL file of roughly the given size."""
+    statements = []
+    length = 0
+    idx = 0
+    while length < size_kb * 1024:
+        statement = SYNTHETIC_STATEMENTS[idx % len(SYNTHETIC_STATEMENTS)].format(
+            idx=idx
+        )
+        statements.append(statement)
+        length += len(statement)
+        idx += 1
+    return "\n".join(statements)
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """The peak resident set size of this process, in megabytes."""
+    if resource is None:  # pragma: no cover
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # NOTE: This is in bytes on macOS, but kilobytes elsewhere.
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_case(case: BenchmarkCase) -> Dict[str, Any]:
+    """Benchmark a single case.
+
+    Each case is run in a fresh process, so that the peak memory use
+    is that of the case alone.
+    """
+    config = FluffConfig(
+        configs={"templater": {"jinja": {"context": {"schema": "analytics"}}}},
+        overrides={
+            "dialect": case.dialect,
+            # The dialect fixtures aren't templated, and may contain
+            # characters which jinja would interpret.
+            "templater": "jinja" if case.size_kb else "raw",
+            "large_file_skip_byte_limit": 0,
+        },
+    )
+    linter = Linter(config=config)
+    rule_pack = linter.get_rulepack(config=config)
+    if case.size_kb:
+        files = [
+            (f"synthetic_{case.size_kb}kb.sql", generate_synthetic_sql(case.size_kb))
+        ]
+    else:
+        files = []
+        for path in case.paths:
+            with open(path, encoding="utf8") as f:
+                files.append((path, f.read()))
+
+    times: Dict[str, float] = defaultdict(float)
+    rule_timings: Dict[str, float] = defaultdict(float)
+    num_bytes = num_segments = num_raw_segments = 0
+    for fname, raw in files:
+        num_bytes += len(raw.encode("utf8"))
+        t0 = time.perf_counter()
+        rendered = linter.render_string(raw, fname, config, "utf8")
+        times["template"] += time.perf_counter() - t0
+        parsed = linter.parse_rendered(rendered)
+        times["lex"] += parsed.time_dict["lexing"]
+        times["parse"] += parsed.time_dict["parsing"]
+        if parsed.tree:
+            num_segments += parsed.tree.count_segments(raw_only=False)
+            num_raw_segments += parsed.tree.count_segments(raw_only=True)
+        t0 = time.perf_counter()
+        linted = linter.lint_parsed(parsed, rule_pack)
+        times["lint"] += time.perf_counter() - t0
+        if linted.timings:
+            for code, _, rule_time in linted.timings.rule_timings:
+                rule_timings[code] += rule_time
+        # Fixing changes the tree, so start again from a fresh parse.
+        parsed = linter.parse_rendered(rendered)
+        t0 = time.perf_counter()
+        linter.lint_parsed(parsed, rule_pack, fix=True)
+        times["fix"] += time.perf_counter() - t0
+
+    # Lexing produces the raw segments and the other stages work on the
+    # whole tree, so measure them against the respective counts.
+    stage_segments = {
+        "template": 0,
+        "lex": num_raw_segments,
+        "parse": num_segments,
+        "lint": num_segments,
+        "fix": num_segments,
+    }
+    return {
+        "name": case.name,
+        "files": len(files),
+        "bytes": num_bytes,
+        "segments": num_segments,
+        "raw_segments": num_raw_segments,
+        "stages": {
+            stage: {
+                "time": times[stage],
+                "bytes_per_s": num_bytes / times[stage] if times[stage] else None,
+                "segments_per_s": (
+                    stage_segments[stage] / times[stage]
+                    if times[stage] and stage_segments[stage]
+                    else None
+                ),
+            }
+            for stage in STAGES
+        },
+        "peak_rss_mb": _peak_rss_mb(),
+        "rule_timings": dict(sorted(rule_timings.items())),
+    }
+
+
+def gather_cases(
+    dialects: Optional[List[str]], sizes: List[int]
+) -> List[BenchmarkCase]:
+    """Gather the cases to benchmark, one per dialect and one per size.
+
+    If `dialects` is None, then all dialects are included.
+    """
+    parse_success_examples, _ = get_parse_fixtures()
+    paths: Dict[str, List[str]] = defaultdict(list)
+    for dialect, sqlfile in parse_success_examples:
+        paths[dialect].append(make_dialect_path(dialect, sqlfile))
+    if dialects is None:
+        dialects = list(paths)
+    for dialect in dialects:
+        if dialect not in paths:
+            raise click.BadParameter(f"Unknown dialect {dialect!r}")
+    cases = [
+        BenchmarkCase(
+            f"dialect:{dialect}", dialect, paths=tuple(sorted(paths[dialect]))
+        )
+        for dialect in sorted(dialects)
+    ]
+    cases += [
+        BenchmarkCase(f"synthetic:{size_kb}kb", "ansi", size_kb=size_kb)
+        for size_kb in sizes
+    ]
+    return cases
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+) -> List[str]:
+    """Compare results against a baseline, and return any regressions."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for stage in STAGES:
+            new = result["stages"][stage]["bytes_per_s"]
+            old = baseline[name]["stages"].get(stage, {}).get("bytes_per_s")
+            if new and old and new < old * (1 - threshold):
+                regressions.append(
+                    f"{name} {stage}: {new:,.0f} bytes/s "
+                    f"(was {old:,.0f} bytes/s, {new / old - 1:.0%})"
+                )
+        new, old = result["peak_rss_mb"], baseline[name].get("peak_rss_mb")
+        if new and old and new > old * (1 + threshold):
+            regressions.append(
+                f"{name} peak memory: {new:,.1f}MB "
+                f"(was {old:,.1f}MB, {new / old - 1:+.0%})"
+            )
+    return regressions
+
+
+def _best_result(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine repeated runs of a case, keeping the best of each stage."""
+    best = runs[0]
+    for run in runs[1:]:
+        for stage in STAGES:
+            if run["stages"][stage]["time"] < best["stages"][stage]["time"]:
+                best["stages"][stage] = run["stages"][stage]
+        if run["peak_rss_mb"] and run["peak_rss_mb"] < (best["peak_rss_mb"] or 0):
+            best["peak_rss_mb"] = run["peak_rss_mb"]
+    return best
+
+
+def _format_result(result: Dict[str, Any]) -> str:
+    """Format a result as a line of a table."""
+    return (
+        f"{result['name']:<28} {result['bytes'] / 1024:>8,.0f}KB "
+        + " ".join(
+            f"{(stage_result['bytes_per_s'] or 0) / 1024:>9,.1f}"
+            for stage_result in result["stages"].values()
+        )
+        + (f" {result['peak_rss_mb']:>8,.1f}MB" if result["peak_rss_mb"] else "")
+    )
+
+
+@click.command()
+@click.option(
+    "--dialect",
+    "-d",
+    "dialects",
+    multiple=True,
+    help="Benchmark the fixtures for this dialect. May be given more than once.",
+)
+@click.option(
+    "--all-dialects",
+    is_flag=True,
+    help="Benchmark the fixtures for all dialects.",
+)
+@click.option(
+    "--size",
+    "-s",
+    "sizes",
+    multiple=True,
+    type=int,
+    help=(
+        "Benchmark a synthetic file of this many kilobytes. May be given more "
+        "than once. Defaults to 10 and 100 if no dialects are given."
+    ),
+)
+@click.option("--output", "-o", default=None, help="Write the results to this file.")
+@click.option(
+    "--save-baseline",
+    default=None,
+    help="Write the results to this file to use as a baseline.",
+)
+@click.option(
+    "--baseline",
+    default=None,
+    help="Compare the results against the baseline in this file.",
+)
+@click.option(
+    "--repeat",
+    "-r",
+    default=1,
+    type=click.IntRange(min=1),
+    show_default=True,
+    help=(
+        "Run each case this many times, keeping the best throughput and "
+        "lowest peak memory use, to reduce the noise in the results."
+    ),
+)
+@click.option(
+    "--threshold",
+    default=0.2,
+    type=float,
+    show_default=True,
+    help=(
+        "The proportion by which throughput may fall, or peak memory use rise, "
+        "compared to the baseline before the run fails."
+    ),
+)
+def benchmark(
+    dialects: Tuple[str, ...],
+    all_dialects: bool,
+    sizes: Tuple[int, ...],
+    output: Optional[str],
+    save_baseline: Optional[str],
+    baseline: Optional[str],
+    repeat: int,
+    threshold: float,
+):
+    """Benchmark the stages of linting on a corpus of SQL files."""
+    if not dialects and not all_dialects and not sizes:
+        sizes = (10, 100)
+    cases = gather_cases(None if all_dialects else list(dialects), list(sizes))
+    print(f"Running {len(cases)} benchmark case(s).")
+    print(
+        f"{'case':<28} {'size':>10} "
+        + " ".join(f"{stage:>9}" for stage in STAGES)
+        + f" {'peak rss':>10}"
+    )
+    print(f"{'':<39} " + " ".join(f"{'KB/s':>9}" for _ in STAGES))
+
+    results: Dict[str, Dict[str, Any]] = {}
+    # NOTE: Each case runs in a fresh process (one at a time), so that
+    # they don't affect each other's peak memory or caches.
+    pool = multiprocessing.get_context("spawn").Pool(1, maxtasksperchild=1)
+    try:
+        for case in cases:
+            runs = list(pool.imap(run_case, [case] * repeat))
+            results[case.name] = _best_result(runs)
+            print(_format_result(results[case.name]))
+    finally:
+        pool.close()
+        pool.join()
+
+    for path in (output, save_baseline):
+        if path:
+            with open(path, "w", encoding="utf8") as f:
+                json.dump(results, f, indent=2)
+            print(f"Results written to {path!r}.")
+
+    if baseline:
+        with open(baseline, encoding="utf8") as f:
+            regressions = compare_to_baseline(results, json.load(f), threshold)
+        if regressions:
+            print(f"REGRESSIONS FOUND (threshold {threshold:.0%}):")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print(f"No regressions against {baseline!r} (threshold {threshold:.0%}).")
+
+
+if __name__ == "__main__":
+    # Run from the root of the repository, so that the fixture paths resolve.
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    benchmark()
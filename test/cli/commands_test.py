@@ -580,6 +580,55 @@ def test__cli__command_lint_parse(command):
     invoke_assert_code(args=command)
 
 
+@pytest.mark.parametrize("command", [parse, lint])
+def test__cli__command_parse_statistics(command, tmpdir):
+    """Check parse statistics are output as a table or json."""
+    fname = "test/fixtures/cli/passing_a.sql"
+    result = invoke_assert_code(
+        args=[command, [fname, "--dialect", "ansi", "--parse-statistics"]]
+    )
+    assert "==== parse statistics ====" in result.output
+    assert "SelectStatementSegment" in result.output
+
+    output_file = str(tmpdir / "stats.json")
+    invoke_assert_code(
+        args=[
+            command,
+            [
+                fname,
+                "--dialect",
+                "ansi",
+                "--parse-statistics",
+                "--parse-statistics-sort",
+                "attempts",
+                "--parse-statistics-output",
+                output_file,
+            ],
+        ]
+    )
+    with open(output_file) as f:
+        records = json.load(f)
+    assert {"FileSegment", "SelectStatementSegment"} <= {r["name"] for r in records}
+    attempts = [r["attempts"] for r in records]
+    assert attempts == sorted(attempts, reverse=True)
+
+
+@pytest.mark.parametrize("command", [lint, fix])
+def test__cli__command_trace_file(command, tmpdir):
+    """Check a trace is written with --trace-file."""
+    fname = str(tmpdir / "passing_a.sql")
+    shutil.copy("test/fixtures/cli/passing_a.sql", fname)
+    trace_file = str(tmpdir / "trace.json")
+    invoke_assert_code(
+        args=[command, [fname, "--dialect", "ansi", "--trace-file", trace_file]]
+    )
+    with open(trace_file) as f:
+        events = json.load(f)["traceEvents"]
+    assert {"load config", "template", "lex", "parse", "lint", "rule"} <= {
+        e["name"] for e in events
+    }
+
+
 @pytest.mark.parametrize(
     "command, ret_code",
     [
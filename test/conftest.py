@@ -286,6 +286,26 @@ def fail_on_parse_error_after_fix(monkeypatch):
     )
 
 
+def pytest_configure(config):
+    """Don't save discovered plugins in the user cache directory.
+
+    Otherwise loading plugins while collecting tests (some test modules
+    create a linter on import) would write a manifest into the real cache
+    directory of whoever is running them. See `disable_plugin_manifest`
+    for the tests themselves.
+    """
+    os.environ["SQLFLUFF_PLUGIN_CACHE_DIR"] = "none"
+
+
+@pytest.fixture(autouse=True)
+def disable_plugin_manifest(monkeypatch):
+    """Don't save discovered plugins in the user cache directory.
+
+    Tests of the manifest itself point it at a temporary directory instead.
+    """
+    monkeypatch.setenv("SQLFLUFF_PLUGIN_CACHE_DIR", "none")
+
+
 @pytest.fixture(autouse=True)
 def test_verbosity_level(request):
     """Report the verbosity level for a given pytest run.
@@ -7,7 +7,9 @@ import pytest
 
 import sqlfluff
 from sqlfluff.core import FluffConfig, Linter
+from sqlfluff.core.dialects import dialect_selector, load_raw_dialect
 from sqlfluff.core.errors import SQLFluffUserError
+from sqlfluff.core.parser import Nothing
 from sqlfluff.core.templaters import (
     JinjaTemplater,
     PlaceholderTemplater,
@@ -394,3 +396,55 @@ def test__api__immutable_config():
         "-- sqlfluff:dialect: postgres\nSELECT * FROM table1\n", config=config
     )
     assert config.get("dialect") == "ansi"
+
+
+def test__config__fingerprint_empty_section():
+    """Configs with empty sections can be iterated and fingerprinted."""
+    config = FluffConfig(
+        configs={"templater": {"jinja": {"context": {}}}},
+        overrides={"dialect": "ansi"},
+    )
+    assert (2, "context", "") in list(config.iter_vals())
+    assert (
+        config.fingerprint() != FluffConfig(overrides={"dialect": "ansi"}).fingerprint()
+    )
+
+
+def test__config__shared_dialect():
+    """Test that configs share expanded dialects unless the library changes."""
+    dialect = FluffConfig(overrides={"dialect": "ansi"}).get("dialect_obj")
+    assert FluffConfig(overrides={"dialect": "ansi"}).get("dialect_obj") is dialect
+    # Changing the library means the dialect is expanded again.
+    raw_dialect = load_raw_dialect("ansi")
+    try:
+        raw_dialect.add(TestGrammar=Nothing())
+        assert dialect_selector("ansi") is not dialect
+    finally:
+        del raw_dialect._library["TestGrammar"]
+    assert dialect_selector("ansi").expanded
+
+
+def test__config__child_config_cache(tmp_path):
+    """Test that child configs are shared between files in a directory."""
+    (tmp_path / ".sqlfluff").write_text("[sqlfluff]\ndialect = postgres\n")
+    (tmp_path / "a.sql").write_text("SELECT 1\n")
+    (tmp_path / "b.sql").write_text("-- sqlfluff:dialect:mysql\nSELECT 1\n")
+    root_config = FluffConfig(overrides={"templater": "raw"}, require_dialect=False)
+
+    config_a = root_config.make_child_from_path(str(tmp_path / "a.sql"), shared=True)
+    assert config_a.get("dialect") == "postgres"
+    assert (
+        root_config.make_child_from_path(str(tmp_path / "b.sql"), shared=True)
+        is config_a
+    )
+    # Unshared configs are copies, which can be modified.
+    assert root_config.make_child_from_path(str(tmp_path / "a.sql")) is not config_a
+    # Inline config only applies to the file it's in.
+    _, config_b, _ = Linter.load_raw_file_and_config(
+        str(tmp_path / "b.sql"), root_config
+    )
+    assert config_b.get("dialect") == "mysql"
+    _, config_a, _ = Linter.load_raw_file_and_config(
+        str(tmp_path / "a.sql"), root_config
+    )
+    assert config_a.get("dialect") == "postgres"
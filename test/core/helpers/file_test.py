@@ -1,11 +1,19 @@
 """Test the helpers."""
 
+import os
 import sys
 from pathlib import Path
 
 import pytest
 
-from sqlfluff.core.helpers.file import get_encoding, iter_intermediate_paths
+import sqlfluff.core.helpers.file
+from sqlfluff.core.helpers.file import (
+    ENCODING_SAMPLE_BYTES,
+    detect_encoding,
+    get_encoding,
+    iter_intermediate_paths,
+    read_file,
+)
 
 
 @pytest.mark.parametrize(
@@ -54,6 +62,64 @@ def test__parser__helper_get_encoding(fname, config_encoding, result):
     )
 
 
+@pytest.mark.parametrize(
+    "data,result",
+    [
+        (b"select 1\n", "ascii"),
+        (b"", "ascii"),
+        ("select 'café'\n".encode("utf-8"), "utf-8"),
+        ("select 'café'\n".encode("utf-8-sig"), "UTF-8-SIG"),
+        ("select 'café'\n".encode("utf-16"), "UTF-16"),
+        ("select 'café'\n".encode("utf-32"), "UTF-32"),
+        # Anything else falls back to chardet.
+        (
+            "select 'café crème brûlée' as dessert;\n".encode("cp1252") * 20,
+            "Windows-1252",
+        ),
+    ],
+)
+def test__parser__helper_detect_encoding(data, result):
+    """Test detect_encoding."""
+    assert detect_encoding(data) == result
+
+
+def test__parser__helper_detect_encoding_truncated():
+    """A sample can end part way through a multi-byte utf-8 character."""
+    data = b"a" * (ENCODING_SAMPLE_BYTES - 1) + "é".encode("utf-8")
+    assert detect_encoding(data) == "utf-8"
+    sample = data[:ENCODING_SAMPLE_BYTES]
+    assert detect_encoding(sample, truncated=True) == "utf-8"
+    # Unless it's the whole file, in which case it's not valid utf-8.
+    assert detect_encoding(sample) != "utf-8"
+
+
+def test__parser__helper_read_file(tmp_path, monkeypatch):
+    """Files are decoded as if read in text mode, and encodings are cached."""
+    detected = []
+
+    def _detect_encoding(data):
+        detected.append(data)
+        return detect_encoding(data)
+
+    monkeypatch.setattr(sqlfluff.core.helpers.file, "detect_encoding", _detect_encoding)
+    path = tmp_path / "a.sql"
+    path.write_bytes("select 'café'\r\nfrom b\rwhere c\n".encode("utf-8-sig"))
+
+    assert read_file(str(path)) == ("select 'café'\nfrom b\nwhere c\n", "UTF-8-SIG")
+    assert get_encoding(str(path)) == "UTF-8-SIG"
+    assert len(detected) == 1
+    # A configured encoding is used as given, even if it doesn't fit.
+    assert read_file(str(path), "ascii") == (
+        "\\xef\\xbb\\xbfselect 'caf\\xc3\\xa9'\nfrom b\nwhere c\n",
+        "ascii",
+    )
+    # Changing the file detects it again.
+    path.write_bytes(b"select 1\n")
+    os.utime(path, ns=(0, 0))
+    assert read_file(str(path)) == ("select 1\n", "ascii")
+    assert len(detected) == 2
+
+
 @pytest.mark.parametrize(
     "path,working_path,result",
     [
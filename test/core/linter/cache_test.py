@@ -0,0 +1,127 @@
+"""Tests for the on-disk lint cache."""
+
+import os
+import time
+
+import pytest
+
+from sqlfluff.core import FluffConfig, Linter
+from sqlfluff.core.linter.cache import LintCache
+
+PATHS = (
+    "test/fixtures/linter/comma_errors.sql",
+    "test/fixtures/linter/operator_errors_ignore.sql",
+    "test/fixtures/linter/parse_error.sql",
+)
+
+
+def _violations_by_path(result):
+    return {r["filepath"]: r["violations"] for r in result.as_records()}
+
+
+def _cached_linter(cache_dir, **overrides):
+    config = FluffConfig(
+        overrides={
+            "dialect": "ansi",
+            "lint_cache": True,
+            "lint_cache_dir": str(cache_dir),
+            **overrides,
+        }
+    )
+    return Linter(config=config)
+
+
+@pytest.mark.parametrize(
+    "overrides,processes",
+    [
+        ({}, 1),
+        ({}, 2),
+        ({"parallel_templating": True}, 2),
+    ],
+)
+def test__lint_cache__hit(tmp_path, overrides, processes):
+    """Test that a second run gives the same results from the cache."""
+    expected = _violations_by_path(Linter(dialect="ansi").lint_paths(PATHS))
+    # First run, populating the cache.
+    lntr = _cached_linter(tmp_path, **overrides)
+    lntr.allow_process_parallelism = False
+    result = lntr.lint_paths(PATHS, processes=processes)
+    assert _violations_by_path(result) == expected
+    assert result.stats(0, 0)["cache misses"] == len(PATHS)
+    assert result.stats(0, 0)["cache hits"] == 0
+    # Second run, from the cache.
+    lntr = _cached_linter(tmp_path, **overrides)
+    lntr.allow_process_parallelism = False
+    result = lntr.lint_paths(PATHS, processes=processes)
+    assert _violations_by_path(result) == expected
+    assert result.stats(0, 0)["cache hits"] == len(PATHS)
+    assert result.stats(0, 0)["cache misses"] == 0
+    # The cache is ignored by git.
+    assert os.path.exists(tmp_path / ".gitignore")
+
+
+def test__lint_cache__invalidation(tmp_path):
+    """Test that changes to the file or the config invalidate the cache."""
+    sql_path = tmp_path / "file.sql"
+    sql_path.write_text("SELECT a+b FROM c\n")
+    cache_dir = tmp_path / "cache"
+
+    result = _cached_linter(cache_dir).lint_paths((str(sql_path),))
+    assert result.stats(0, 0)["cache misses"] == 1
+    # Changing the config means a miss.
+    result = _cached_linter(cache_dir, rules="LT01").lint_paths((str(sql_path),))
+    assert result.stats(0, 0)["cache misses"] == 1
+    assert {v.rule_code() for v in result.get_violations()} == {"LT01"}
+    # Changing the file means a miss.
+    sql_path.write_text("SELECT a + b FROM c\n")
+    result = _cached_linter(cache_dir, rules="LT01").lint_paths((str(sql_path),))
+    assert result.stats(0, 0)["cache misses"] == 1
+    assert not result.get_violations()
+    # But otherwise, a hit.
+    result = _cached_linter(cache_dir, rules="LT01").lint_paths((str(sql_path),))
+    assert result.stats(0, 0)["cache hits"] == 1
+
+
+def test__lint_cache__fix(tmp_path):
+    """Test that only clean files are served from the cache when fixing."""
+    dirty_path = tmp_path / "dirty.sql"
+    dirty_path.write_text("SELECT a+b FROM c\n")
+    clean_path = tmp_path / "clean.sql"
+    clean_path.write_text("SELECT a + b FROM c\n")
+    paths = (str(dirty_path), str(clean_path))
+    cache_dir = tmp_path / "cache"
+
+    _cached_linter(cache_dir, rules="LT01").lint_paths(paths)
+    result = _cached_linter(cache_dir, rules="LT01").lint_paths(
+        paths, fix=True, apply_fixes=True
+    )
+    assert result.stats(0, 0)["cache hits"] == 1
+    assert result.stats(0, 0)["cache misses"] == 1
+    assert dirty_path.read_text() == "SELECT a + b FROM c\n"
+
+
+def test__lint_cache__disabled():
+    """Test that no cache statistics are reported when the cache is disabled."""
+    result = Linter(dialect="ansi").lint_paths(PATHS[:1])
+    assert "cache hits" not in result.stats(0, 0)
+    assert LintCache.from_config(FluffConfig(overrides={"dialect": "ansi"})) is None
+
+
+def test__lint_cache__evict(tmp_path):
+    """Test eviction by age and then by size."""
+    lint_cache = LintCache(str(tmp_path), max_age_days=1, max_size_mb=0.001)
+    linted_file = Linter(dialect="ansi").lint_string("SELECT 1\n")
+    keys = [f"{i:064x}" for i in range(4)]
+    for key in keys:
+        lint_cache.put(key, linted_file)
+    # Make the first entry old, and the second less recently used.
+    now = time.time()
+    os.utime(lint_cache._entry_path(keys[0]), (now - 2 * 86400, now - 2 * 86400))
+    os.utime(lint_cache._entry_path(keys[1]), (now - 60, now - 60))
+    # Make the cache oversized by padding the last entry.
+    with open(lint_cache._entry_path(keys[3]), "a") as f:
+        f.write(" " * 960)
+
+    lint_cache.evict()
+    remaining = [os.path.exists(lint_cache._entry_path(key)) for key in keys]
+    assert remaining == [False, False, True, True]
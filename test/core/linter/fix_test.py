@@ -4,7 +4,8 @@ import logging
 
 import pytest
 
-from sqlfluff.core.linter.fix import compute_anchor_edit_info
+from sqlfluff.core import FluffConfig, Linter
+from sqlfluff.core.linter.fix import apply_fixes, compute_anchor_edit_info
 from sqlfluff.core.linter.patch import FixPatch, generate_source_patches
 from sqlfluff.core.parser.markers import PositionMarker
 from sqlfluff.core.parser.segments import (
@@ -200,3 +201,53 @@ def test__fix__generate_source_patches(tree, templated_file, expected_result, ca
     with caplog.at_level(logging.DEBUG, logger="sqlfluff.linter"):
         result = generate_source_patches(tree, templated_file)
     assert result == expected_result
+
+
+def test__fix__apply_fixes_changed_uuids():
+    """Test that apply_fixes only rebuilds the regions which change."""
+    config = FluffConfig(overrides={"dialect": "ansi"})
+    tree = Linter(config=config).parse_string("SELECT 1 + 2, 3 + 4\n").tree
+    first, second = tree.recursive_crawl("select_clause_element")
+    literal = [seg for seg in second.raw_segments if seg.raw == "4"][0]
+    fixes = compute_anchor_edit_info([LintFix.replace(literal, [literal.edit("5")])])
+
+    changed_uuids = set()
+    new_tree, _, _, valid = apply_fixes(
+        tree, config.get("dialect_obj"), "TEST", fixes, changed_uuids=changed_uuids
+    )
+
+    assert valid
+    assert new_tree.raw == "SELECT 1 + 2, 3 + 5\n"
+    new_first, new_second = new_tree.recursive_crawl("select_clause_element")
+    # The unchanged region keeps its uuids.
+    assert new_first.uuid == first.uuid
+    assert not {seg.uuid for seg in new_first.recursive_crawl_all()} & changed_uuids
+    # The changed region and everything above it is recorded.
+    assert new_tree.uuid in changed_uuids
+    assert new_second.uuid in changed_uuids
+    assert {seg.uuid for seg in new_second.raw_segments if seg.raw == "5"} < (
+        changed_uuids
+    )
+
+
+@pytest.mark.parametrize(
+    "dialect,path",
+    [
+        # Here LT09 has fixes rejected in the first loop, which are only
+        # accepted once another rule has changed a different statement.
+        ("postgres", "test/fixtures/dialects/postgres/select_frame_clause.sql"),
+        ("ansi", "test/fixtures/dialects/ansi/select_union.sql"),
+    ],
+)
+def test__fix__changed_regions_match_full_crawl(dialect, path, monkeypatch):
+    """Test that only crawling changed regions doesn't change the fixes."""
+    with open(path) as f:
+        sql = f.read()
+    linter = Linter(config=FluffConfig(overrides={"dialect": dialect}))
+    fixed = linter.lint_string(sql, fix=True).fix_string()
+
+    # Crawl the whole tree in every loop.
+    for rule in linter.get_rulepack().rules:
+        monkeypatch.setattr(type(rule), "is_context_local", False)
+    linter = Linter(config=FluffConfig(overrides={"dialect": dialect}))
+    assert linter.lint_string(sql, fix=True).fix_string() == fixed
@@ -298,6 +298,86 @@ def test__linter__linting_parallel_thread(force_error, monkeypatch):
     all([isinstance(v, SQLLintError) for v in result.get_violations()])
 
 
+@pytest.mark.parametrize("allow_process_parallelism", [False, True])
+def test__linter__linting_parallel_templating(allow_process_parallelism, monkeypatch):
+    """Test rendering files within the workers gives the same result."""
+    monkeypatch.setattr(Linter, "allow_process_parallelism", allow_process_parallelism)
+    paths = (
+        "test/fixtures/linter/comma_errors.sql",
+        "test/fixtures/linter/whitespace_errors.sql",
+    )
+    expected = Linter(dialect="ansi").lint_paths(paths).check_tuples_by_path()
+    config = FluffConfig(overrides={"dialect": "ansi", "parallel_templating": True})
+    result = Linter(config=config).lint_paths(paths, processes=2)
+    assert result.check_tuples_by_path() == expected
+
+
+def test__linter__linting_parallel_templating_skip(caplog):
+    """Test that files skipped within the workers are logged and skipped."""
+    config = FluffConfig(
+        overrides={
+            "dialect": "ansi",
+            "parallel_templating": True,
+            "large_file_skip_byte_limit": 5,
+        }
+    )
+    lntr = Linter(config=config)
+    lntr.allow_process_parallelism = False
+    with caplog.at_level(logging.WARNING, logger="sqlfluff.linter"):
+        result = lntr.lint_paths(
+            (
+                "test/fixtures/linter/comma_errors.sql",
+                "test/fixtures/linter/whitespace_errors.sql",
+            ),
+            processes=2,
+        )
+    assert not result.get_violations()
+    assert "Skipping to avoid parser lock" in caplog.text
+    assert "internal error" not in caplog.text
+
+
+def test__linter__persistent_worker_pool(monkeypatch):
+    """Test that a persistent pool is reused between runs."""
+    monkeypatch.setattr(Linter, "allow_process_parallelism", False)
+    created_pools = []
+    original_create_pool = runner.MultiThreadRunner._create_pool
+
+    def _create_pool(*args, **kwargs):
+        pool = original_create_pool(*args, **kwargs)
+        created_pools.append(pool)
+        return pool
+
+    monkeypatch.setattr(
+        runner.MultiThreadRunner, "_create_pool", staticmethod(_create_pool)
+    )
+    config = FluffConfig(overrides={"dialect": "ansi", "persistent_worker_pool": True})
+    paths = (
+        "test/fixtures/linter/comma_errors.sql",
+        "test/fixtures/linter/whitespace_errors.sql",
+    )
+    try:
+        first = Linter(config=config).lint_paths(paths, processes=2)
+        second = Linter(config=config).lint_paths(paths, processes=2)
+        assert len(created_pools) == 1
+        assert first.check_tuples_by_path() == second.check_tuples_by_path()
+    finally:
+        runner.ParallelRunner.close_persistent_pools()
+    assert not runner.ParallelRunner._persistent_pools
+
+
+def test__linter__cached_rulepack():
+    """Test that rule packs are reused for equivalent configs."""
+    rule_pack = runner.get_cached_rulepack(
+        FluffConfig(overrides={"dialect": "ansi"}), []
+    )
+    assert rule_pack is runner.get_cached_rulepack(
+        FluffConfig(overrides={"dialect": "ansi"}), []
+    )
+    assert rule_pack is not runner.get_cached_rulepack(
+        FluffConfig(overrides={"dialect": "ansi", "rules": "LT01"}), []
+    )
+
+
 @patch("sqlfluff.core.linter.Linter.lint_rendered")
 def test_lint_path_parallel_wrapper_exception(patched_lint):
     """Tests the error catching behavior of _lint_path_parallel_wrapper().
@@ -316,6 +396,27 @@ def test_lint_path_parallel_wrapper_exception(patched_lint):
             result.reraise()
 
 
+def test__linter__parallel_fix_string():
+    """When fixing in parallel, fixed files are generated by the workers."""
+    results = {
+        result.path: result
+        for result in runner.MultiThreadRunner(
+            Linter(), FluffConfig(overrides={"dialect": "ansi"}), processes=2
+        ).run(
+            [
+                "test/fixtures/linter/passing.sql",
+                "test/fixtures/linter/indentation_errors.sql",
+            ],
+            fix=True,
+        )
+    }
+    # There's nothing to fix in a passing file.
+    assert results["test/fixtures/linter/passing.sql"].fix_result is None
+    linted_file = results["test/fixtures/linter/indentation_errors.sql"]
+    assert linted_file.fix_result
+    assert linted_file.fix_result == linted_file._replace(fix_result=None).fix_string()
+
+
 @pytest.mark.parametrize(
     "mock_cpu,in_processes,exp_processes",
     [
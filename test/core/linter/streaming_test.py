@@ -0,0 +1,107 @@
+"""Tests for linting large files statement by statement."""
+
+import pytest
+
+from sqlfluff.core import FluffConfig, Linter
+from sqlfluff.core.linter import streaming
+from sqlfluff.core.linter.streaming import iter_statement_bounds
+
+SQL = (
+    "-- noqa: disable=LT01\n"
+    "select a  from b;\n"
+    "-- noqa: enable=LT01\n"
+    "select 1  from x; -- noqa: LT01\n"
+    "select 'a;b' as c, (select 1; ) as d from e;\n"
+    "select   2 from y; -- noqa: CP01\n"
+    "select 4; -- noqa: AL01\n"
+    "select c /* ; */ from z  ;  select 3\n"
+)
+
+
+@pytest.mark.parametrize(
+    "raw,statements",
+    [
+        (b"", []),
+        (b"select 1", [b"select 1"]),
+        (b"select 1;\nselect 2;\n", [b"select 1;\n", b"select 2;\n"]),
+        # Trailing comments stay with their statement.
+        (b"select 1; -- noqa\n\nselect 2", [b"select 1; -- noqa\n", b"\nselect 2"]),
+        # Semicolons in brackets, comments and strings don't split.
+        (b"select (1;2) ; select 3", [b"select (1;2) ; ", b"select 3"]),
+        (b"select '--;' -- ;\n;select 3", [b"select '--;' -- ;\n;", b"select 3"]),
+        (
+            b"select /* ; */ 1; select 'it\\'s;'",
+            [b"select /* ; */ 1; ", b"select 'it\\'s;'"],
+        ),
+    ],
+)
+def test__streaming__iter_statement_bounds(raw, statements):
+    """Test splitting a buffer into statements."""
+    assert [raw[start:end] for start, end in iter_statement_bounds(raw)] == statements
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test__streaming__matches_normal_lint(tmp_path, monkeypatch, processes):
+    """Test that streaming a file gives the same violations as linting it whole."""
+    # Put each statement in its own section.
+    monkeypatch.setattr(streaming, "SECTION_BYTES", 1)
+    path = tmp_path / "file.sql"
+    path.write_text(SQL)
+
+    def lint(**overrides):
+        config = FluffConfig(
+            overrides={
+                "dialect": "ansi",
+                "templater": "raw",
+                "warn_unused_ignores": True,
+                **overrides,
+            }
+        )
+        linter = Linter(config=config)
+        linter.allow_process_parallelism = False
+        result = linter.lint_paths((str(path),), processes=processes)
+        linted_file = result.paths[0].files[0]
+        return result.as_records()[0]["violations"], [
+            v.check_tuple()
+            for v in linted_file.get_violations(
+                filter_warning=False, warn_unused_ignores=True
+            )
+        ]
+
+    expected_records, expected_violations = lint()
+    records, violations = lint(streaming_lint_byte_limit=1)
+    assert records == expected_records
+    assert sorted(violations) == sorted(expected_violations)
+    # The parse error in the third statement means it's linted together
+    # with the following statements, which are then still linted.
+    assert ("PRS", 5, 29) in violations
+    assert ("LT01", 6, 7) in violations
+    # An unused noqa comment, and a used one which doesn't appear.
+    assert ("NOQA", 7, 11) in violations
+    assert ("LT01", 4, 9) not in violations
+
+
+def test__streaming__statement_limit(tmp_path):
+    """Test that the byte limit applies to statements rather than the file."""
+    path = tmp_path / "file.sql"
+    path.write_text("select 1;\n" * 100)
+    config = FluffConfig(
+        overrides={
+            "dialect": "ansi",
+            "templater": "raw",
+            "streaming_lint_byte_limit": 1,
+            "large_file_skip_byte_limit": 20,
+        }
+    )
+    result = Linter(config=config).lint_paths((str(path),))
+    assert result.stats(0, 0)["files"] == 1
+    path.write_text("select 1;\n" + "select 1 + 1 + 1 + 1;\n")
+    result = Linter(config=config).lint_paths((str(path),))
+    assert result.stats(0, 0)["files"] == 0
+
+
+def test__streaming__detect_encoding_sample():
+    """A sample ending part way through a character is still utf-8."""
+    buffer = b"a" * (streaming.ENCODING_SAMPLE_BYTES - 1) + "é".encode("utf-8")
+    assert streaming._detect_encoding(buffer, "autodetect") == "utf-8"
+    assert streaming._detect_encoding(buffer, "latin-1") == "latin-1"
@@ -0,0 +1,94 @@
+"""Tests for writing out fixed files."""
+
+import pytest
+
+from sqlfluff.core import FluffConfig, Linter
+from sqlfluff.core.errors import SQLFluffUserError
+from sqlfluff.core.formatter import FormatterInterface
+from sqlfluff.core.linter import LintedFile
+from sqlfluff.core.linter.writer import FixedFileWriter
+
+
+class RecordingFormatter(FormatterInterface):
+    """A formatter which records the results of persisting files."""
+
+    def __init__(self):
+        self.persisted = []
+
+    def dispatch_persist_filename(self, filename: str, result: str) -> None:
+        """Record the result for each file."""
+        self.persisted.append((filename, result))
+
+
+def _lint_files(tmp_path, contents):
+    """Write out files with the given contents, and lint them for fixing."""
+    paths = []
+    for idx, content in enumerate(contents):
+        path = tmp_path / f"file_{idx}.sql"
+        path.write_text(content)
+        paths.append(str(path))
+    linter = Linter(config=FluffConfig(overrides={"dialect": "ansi", "rules": "CP01"}))
+    result = linter.lint_paths(tuple(paths), fix=True, retain_files=True)
+    return paths, [file for path in result.paths for file in path.files]
+
+
+@pytest.mark.parametrize("durability", ["file", "directory", "none"])
+def test__writer__write_batches(durability, tmp_path):
+    """Fixed files are written in batches, and reported in order."""
+    contents = [
+        "SELECT 1 from a\n",
+        "SELECT 1\n",
+        "SELECT 2 from b\n",
+        "SELECT 3 from c\n",
+    ]
+    paths, linted_files = _lint_files(tmp_path, contents)
+    formatter = RecordingFormatter()
+    with FixedFileWriter(
+        durability=durability, formatter=formatter, batch_size=2
+    ) as writer:
+        for linted_file in linted_files:
+            writer.add(linted_file)
+    assert writer.results == {path: True for path in paths}
+    assert formatter.persisted == [
+        (paths[0], "FIXED"),
+        (paths[1], "SKIP"),
+        (paths[2], "FIXED"),
+        (paths[3], "FIXED"),
+    ]
+    assert [open(path).read() for path in paths] == [
+        "SELECT 1 FROM a\n",
+        "SELECT 1\n",
+        "SELECT 2 FROM b\n",
+        "SELECT 3 FROM c\n",
+    ]
+
+
+def test__writer__suffix(tmp_path):
+    """Fixed files can be written alongside the originals."""
+    paths, linted_files = _lint_files(tmp_path, ["SELECT 1 from a\n"])
+    with FixedFileWriter() as writer:
+        writer.add(linted_files[0], suffix="_fixed")
+    assert open(paths[0]).read() == "SELECT 1 from a\n"
+    assert (tmp_path / "file_0_fixed.sql").read_text() == "SELECT 1 FROM a\n"
+
+
+def test__writer__write_error(tmp_path, monkeypatch):
+    """Errors from writing files are raised in the calling thread."""
+
+    def _fail(*args, **kwargs):
+        raise OSError("Disk full")
+
+    monkeypatch.setattr(LintedFile, "_safe_create_replace_file", _fail)
+    _, linted_files = _lint_files(tmp_path, ["SELECT 1 from a\n"])
+    formatter = RecordingFormatter()
+    writer = FixedFileWriter(formatter=formatter)
+    writer.add(linted_files[0])
+    with pytest.raises(OSError, match="Disk full"):
+        writer.close()
+    assert not formatter.persisted
+
+
+def test__writer__invalid_durability():
+    """An unknown durability mode raises an error."""
+    with pytest.raises(SQLFluffUserError, match="fix_durability"):
+        FixedFileWriter(durability="sometimes")
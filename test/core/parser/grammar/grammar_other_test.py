@@ -4,6 +4,8 @@ NOTE: All of these tests depend somewhat on the KeywordSegment working as planne
 """
 
 import logging
+import subprocess
+import sys
 
 import pytest
 
@@ -238,3 +240,38 @@ def test__parser__grammar_noncode_match(test_segments, fresh_ansi_dialect):
     match = NonCodeMatcher().match(test_segments, 1, parse_context=ctx)
     assert match
     assert match.matched_slice == slice(1, 2)
+
+
+def test__parser__grammar_cache_key():
+    """Test that cache keys are structural and stable between processes."""
+    bar = StringParser("bar", KeywordSegment)
+    grammar = Delimited(bar, delimiter=StringParser(".", SymbolSegment))
+    same_grammar = Delimited(
+        StringParser("bar", KeywordSegment),
+        delimiter=StringParser(".", SymbolSegment),
+    )
+    assert grammar.cache_key() == same_grammar.cache_key()
+    # Different options or elements mean different keys.
+    assert (
+        Delimited(
+            bar, delimiter=StringParser(".", SymbolSegment), min_delimiters=1
+        ).cache_key()
+        != grammar.cache_key()
+    )
+    copied_grammar = grammar.copy(insert=[StringParser("foo", KeywordSegment)])
+    assert copied_grammar.cache_key() != grammar.cache_key()
+    assert StringParser("foo", KeywordSegment).cache_key() != bar.cache_key()
+    assert KeywordSegment.cache_key() != SymbolSegment.cache_key()
+
+    # The same key is generated in a fresh process.
+    code = (
+        "from sqlfluff.core.parser import KeywordSegment, StringParser, "
+        "SymbolSegment\n"
+        "from sqlfluff.core.parser.grammar import Delimited\n"
+        "print(Delimited(StringParser('bar', KeywordSegment), "
+        "delimiter=StringParser('.', SymbolSegment)).cache_key())\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == grammar.cache_key()
@@ -123,6 +123,39 @@ def test__parser__lexer_lex_match(caplog):
         assert res.elements[2].raw == "#..#"
 
 
+def test__parser__lexer_lex_match_position_sensitive():
+    """Test that anchored patterns match as though at the start of the string."""
+    matchers = [
+        RegexLexer("comment", r"^--[^\n]*", CodeSegment),
+        RegexLexer("word", r"(?<![a-z])[a-z]+", CodeSegment),
+        RegexLexer("whitespace", r"[^\S\r\n]+", CodeSegment),
+    ]
+    assert matchers[0]._position_sensitive
+    assert matchers[1]._position_sensitive
+    assert not matchers[2]._position_sensitive
+    res = Lexer.lex_match("ab --c\n", matchers)
+    assert [e.raw for e in res.elements] == ["ab", " ", "--c"]
+    assert res.forward_string == "\n"
+
+
+@pytest.mark.parametrize(
+    "matcher,char,expected",
+    [
+        (StringLexer("dot", ".", CodeSegment), ".", True),
+        (StringLexer("dot", "::", CodeSegment), ":", True),
+        (StringLexer("dot", ".", CodeSegment), "a", False),
+        (RegexLexer("test", r"#[^#]*#", CodeSegment), "#", True),
+        (RegexLexer("test", r"#[^#]*#", CodeSegment), "a", False),
+        (RegexLexer("test", r"(--|#)[^\n]*", CodeSegment), "-", True),
+        (RegexLexer("test", r"[0-9a-zA-Z_]+", CodeSegment), "_", True),
+        (RegexLexer("test", r"[0-9a-zA-Z_]+", CodeSegment), "-", False),
+    ],
+)
+def test__parser__lexer_could_start_with(matcher, char, expected):
+    """Test working out which characters a matcher could start with."""
+    assert matcher.could_start_with(char) is expected
+
+
 def test__parser__lexer_fail():
     """Test the how the lexer fails and reports errors."""
     lex = Lexer(config=FluffConfig(overrides={"dialect": "ansi"}))
@@ -1,5 +1,8 @@
 """Tests for PositionMarker."""
 
+import copy
+import pickle
+
 import pytest
 
 from sqlfluff.core.parser.markers import PositionMarker
@@ -70,3 +73,16 @@ def test_markers__comparison():
     assert all(a_pos <= p for p in all_pos)
     # Check greater than or equal
     assert all(c_pos >= p for p in all_pos)
+
+
+def test_markers__compact():
+    """Test that markers are compact, but still pickle and copy."""
+    templ = TemplatedFile.from_string("foobar\nbaz")
+    pos = PositionMarker(slice(2, 8), slice(3, 9), templ)
+    assert not hasattr(pos, "__dict__")
+    assert pos.source_slice == slice(2, 8)
+    assert pos.templated_slice == slice(3, 9)
+    for other in (pickle.loads(pickle.dumps(pos)), copy.deepcopy(pos)):
+        assert other.source_slice == pos.source_slice
+        assert other.templated_slice == pos.templated_slice
+        assert other.working_loc == pos.working_loc
@@ -8,18 +8,22 @@ import pytest
 from sqlfluff.core.dialects.base import Dialect
 from sqlfluff.core.errors import SQLParseError
 from sqlfluff.core.parser import (
+    Anything,
     CodeSegment,
     KeywordSegment,
     StringParser,
     SymbolSegment,
+    TypedParser,
     WhitespaceSegment,
 )
 from sqlfluff.core.parser.context import ParseContext
 from sqlfluff.core.parser.lexer import RegexLexer
 from sqlfluff.core.parser.match_algorithms import (
+    get_prune_index,
     greedy_match,
     next_ex_bracket_match,
     next_match,
+    prune_options,
     resolve_bracket,
     trim_to_terminator,
 )
@@ -256,3 +260,48 @@ def test__parser__algorithms__trim_to_terminator(
         )
         == expected_result
     )
+
+
+@pytest.mark.parametrize(
+    "raw_segments,result_idxs",
+    [
+        # Matches on raw, along with the non-simple option.
+        ([" ", "foo"], [0, 1, 4]),
+        (["bar"], [1, 2]),
+        # Matches on type.
+        (["'bar'"], [1, 3]),
+        # Only the non-simple option.
+        (["baz"], [1]),
+        # Nothing to prune on.
+        ([" "], [0, 1, 2, 3, 4]),
+    ],
+)
+def test__parser__algorithms__prune_options(
+    raw_segments,
+    result_idxs,
+    generate_test_segments,
+    test_dialect,
+):
+    """Test the `prune_options()` method, with and without an index."""
+    test_segments = generate_test_segments(raw_segments)
+    options = [
+        StringParser("foo", KeywordSegment),
+        Anything(),
+        StringParser("bar", KeywordSegment),
+        TypedParser("single_quote", CodeSegment),
+        StringParser("foo", KeywordSegment),
+    ]
+    ctx = ParseContext(dialect=test_dialect)
+
+    expected = [options[idx] for idx in result_idxs]
+    assert prune_options(options, test_segments, parse_context=ctx) == expected
+    # Twice with the index, to check the memoised lookup too.
+    for _ in range(2):
+        assert (
+            prune_options(options, test_segments, parse_context=ctx, use_index=True)
+            == expected
+        )
+    # The index is stored on the dialect, and reused by later contexts.
+    prune_index = get_prune_index(options, ctx)
+    assert test_dialect.prune_indexes[id(options)] == (options, prune_index)
+    assert get_prune_index(options, ParseContext(dialect=test_dialect)) is prune_index
@@ -1,10 +1,22 @@
 """The Test file for The New Parser (Grammar Classes)."""
 
+import pytest
+
 from sqlfluff.core import FluffConfig
-from sqlfluff.core.errors import SQLParseError
+from sqlfluff.core.errors import SQLFluffUserError, SQLParseError
 from sqlfluff.core.linter.linter import Linter
-from sqlfluff.core.parser import Anything, BaseSegment, KeywordSegment, StringParser
+from sqlfluff.core.parser import (
+    Anything,
+    BaseSegment,
+    KeywordSegment,
+    Lexer,
+    Parser,
+    StringParser,
+)
+from sqlfluff.core.parser import parser as parser_module
 from sqlfluff.core.parser.context import ParseContext
+from sqlfluff.core.parser.match_result import MatchResult
+from sqlfluff.core.parser.parser import split_statements
 
 BarKeyword = StringParser("bar", KeywordSegment)
 
@@ -66,3 +78,81 @@ def test_parse_jinja_macro_exclude():
     parsed = linter.parse_path(sql_file_path)
     for parse in parsed:
         assert parse.violations == []
+
+
+@pytest.mark.parametrize(
+    "eviction,remaining",
+    [
+        # The least recently used entries are evicted one at a time.
+        ("lru", [0, 2, 3, 4]),
+        # The entries furthest behind are evicted, in batches.
+        ("position", [2, 3, 4]),
+    ],
+)
+def test__parser__parse_cache_eviction(eviction, remaining):
+    """Test that a bounded parse cache evicts entries, and counts them."""
+    ctx = ParseContext(dialect=None, parse_cache_size=4, parse_cache_eviction=eviction)
+    # Location keys are (raw, working_loc, type, max_idx).
+    loc_keys = [("a", loc, "raw", 10) for loc in range(5)]
+    for loc_key in loc_keys[:4]:
+        ctx.put_parse_cache(loc_key, "matcher", MatchResult.empty_at(loc_key[1]))
+    # Use the first entry, so that it's no longer the least recently used.
+    assert ctx.check_parse_cache(loc_keys[0], "matcher") is not None
+    assert ctx.check_parse_cache(loc_keys[0], "other_matcher") is None
+    ctx.put_parse_cache(loc_keys[4], "matcher", MatchResult.empty_at(4))
+
+    assert [
+        loc
+        for loc, loc_key in enumerate(loc_keys)
+        if ctx.check_parse_cache(loc_key, "matcher") is not None
+    ] == remaining
+    assert ctx.parse_stats["cache_evictions"] == 5 - len(remaining)
+    assert ctx.parse_stats["cache_hits"] == 1 + len(remaining)
+    assert ctx.parse_stats["cache_misses"] == 1 + 5 - len(remaining)
+
+
+@pytest.mark.parametrize("eviction", ["lru", "position"])
+def test__parser__parse_cache_bounded(eviction):
+    """Test that bounding the parse cache doesn't change the parse tree."""
+    in_str = "SELECT a, b + 1 FROM tbl WHERE c IN (1, 2);\n" * 5
+    expected = Linter(dialect="ansi").parse_string(in_str).tree.stringify()
+    config = FluffConfig(
+        overrides={
+            "dialect": "ansi",
+            "parse_cache_size": 20,
+            "parse_cache_eviction": eviction,
+        }
+    )
+    assert Linter(config=config).parse_string(in_str).tree.stringify() == expected
+
+
+def test__parser__parse_cache_invalid_eviction():
+    """Test that an unknown eviction policy raises an error."""
+    with pytest.raises(SQLFluffUserError):
+        ParseContext(dialect=None, parse_cache_eviction="random")
+
+
+def test__parser__split_statements(generate_test_segments):
+    """Test splitting segments into statements at top level delimiters."""
+    segments = generate_test_segments(
+        ["a", ";", " ", "--c", "\n", "b", "(", ";", ")", ";", ";", "c", " "]
+    )
+    assert split_statements(segments) == [
+        slice(0, 5),
+        slice(5, 11),
+        slice(11, 13),
+    ]
+
+
+def test__parser__parse_statements_in_parallel(monkeypatch):
+    """Test that parsing statements in parallel gives the same result."""
+    monkeypatch.setattr(parser_module, "MIN_STATEMENTS_PER_PROCESS", 1)
+    in_str = "SELECT a, b + 1 FROM tbl WHERE c IN (1, 2);\n-- Comment\n" * 3
+    config = FluffConfig(overrides={"dialect": "ansi", "parse_processes": 2})
+    parser = Parser(config=config)
+    lexed, _ = Lexer(config=config).lex(in_str)
+    parsed = parser._parse_statements_in_parallel(tuple(lexed))
+    assert parsed
+    expected = Parser(dialect="ansi").parse(lexed)
+    assert parsed.stringify() == expected.stringify()
+    assert parsed.raw == in_str
@@ -0,0 +1,85 @@
+"""Tests for profiling the grammars matched while parsing."""
+
+import pytest
+
+from sqlfluff.core import FluffConfig, Linter
+from sqlfluff.core.parser.profiler import GrammarProfile, GrammarStats
+
+
+def test__parser__profiler_recursion():
+    """Recursive grammars only count their outermost time."""
+    profile = GrammarProfile()
+    profile.start("a", 0)
+    profile.start("b", 1)
+    profile.start("a", 2)
+    profile.record_cache(True)
+    profile.record_prune(4, 1)
+    profile.stop()
+    profile.record_cache(False)
+    profile.stop()
+    profile.stop()
+    a, b = profile.stats["a"], profile.stats["b"]
+    assert (a.attempts, a.cache_hits, a.cache_misses, a.max_depth) == (2, 1, 0, 2)
+    assert (b.attempts, b.cache_hits, b.cache_misses, b.max_depth) == (1, 0, 1, 1)
+    assert a.prune_ratio == 0.75
+    assert b.prune_ratio is None
+    # The self times of all the grammars add up to the total.
+    assert a.self_time + b.self_time == pytest.approx(a.time)
+    assert b.time <= a.time
+
+
+def test__parser__profiler_merge():
+    """Profiles can be combined, and sorted."""
+    profile = GrammarProfile()
+    profile.stats["a"] = GrammarStats(attempts=1, self_time=2.0, max_depth=3)
+    other = GrammarProfile()
+    other.stats["a"] = GrammarStats(attempts=2, self_time=1.0, max_depth=1)
+    other.stats["b"] = GrammarStats(attempts=5, self_time=0.5, max_depth=4)
+    profile.merge(other)
+    assert [r["name"] for r in profile.as_records()] == ["a", "b"]
+    assert [r["name"] for r in profile.as_records("attempts")] == ["b", "a"]
+    record = profile.as_records()[0]
+    assert (record["attempts"], record["self_time"], record["max_depth"]) == (
+        3,
+        3.0,
+        3,
+    )
+
+
+def test__parser__profiler_parse():
+    """A profile is recorded when parsing with statistics."""
+    linter = Linter(dialect="ansi")
+    parsed = linter.parse_string("select a, b from c join d using (e)\n")
+    assert parsed.parse_profile is None
+
+    parsed = linter.parse_string(
+        "select a, b from c join d using (e)\n", parse_statistics=True
+    )
+    profile = parsed.parse_profile
+    assert profile
+    # The root segment is the outermost.
+    assert profile.stats["FileSegment"].attempts == 1
+    assert profile.stats["FileSegment"].max_depth == 0
+    assert profile.stats["SelectStatementSegment"].attempts >= 1
+    assert profile.stats["JoinClauseSegment"].options > 0
+    assert sum(stats.cache_misses for stats in profile.stats.values()) > 0
+    # References to a segment aren't counted separately to the segment.
+    assert profile.stats["StatementSegment"].attempts == 1
+
+
+def test__parser__profiler_lint_paths():
+    """Profiles are combined across files when linting."""
+    linter = Linter(
+        config=FluffConfig(
+            overrides={"dialect": "ansi", "rules": "LT01", "parse_statistics": True}
+        )
+    )
+    result = linter.lint_paths(
+        (
+            "test/fixtures/linter/indentation_errors.sql",
+            "test/fixtures/linter/whitespace_errors.sql",
+        )
+    )
+    profile = result.parse_profile()
+    assert profile
+    assert profile.stats["FileSegment"].attempts == 2
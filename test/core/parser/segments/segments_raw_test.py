@@ -1,5 +1,7 @@
 """Test the RawSegment class."""
 
+import pickle
+
 from sqlfluff.core.parser.segments.base import PathStep
 
 
@@ -28,3 +30,19 @@ def test__parser__raw_segments_with_ancestors(
         ),
         (raw_segments[1], [PathStep(test_seg, 1, 2, (0, 1))]),
     ]
+
+
+def test__parser__raw_segments_compact(raw_segments):
+    """Test raw segments use slots, and copy and pickle with them."""
+    raw_seg = raw_segments[0]
+    # Any cached properties which a raw segment would use shouldn't
+    # create a __dict__.
+    assert raw_seg.descendant_type_set == frozenset()
+    assert not getattr(raw_seg, "__dict__", None)
+    for other in (raw_seg.copy(), pickle.loads(pickle.dumps(raw_seg))):
+        assert other is not raw_seg
+        assert other == raw_seg
+        assert other.raw == raw_seg.raw
+        assert other.pos_marker.source_slice == raw_seg.pos_marker.source_slice
+        assert other.instance_types == raw_seg.instance_types
+        assert repr(other) == repr(raw_seg)
@@ -9,6 +9,8 @@ import pytest
 from sqlfluff import __version__ as pkg_version
 from sqlfluff.core.config import FluffConfig
 from sqlfluff.core.plugin.host import (
+    _discover_plugins,
+    _get_plugin_manifest_path,
     _get_sqlfluff_version,
     _load_plugin,
     get_plugin_manager,
@@ -124,3 +126,53 @@ def test__plugin_handle_bad_load():
 def test__plugin_get_version():
     """Test the plugin method of getting the version gets the right version."""
     assert _get_sqlfluff_version() == pkg_version
+
+
+def _fake_distribution(path, name, version, entry_points):
+    """Write the metadata for a fake installed distribution."""
+    dist_info = path / f"{name}-{version}.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(f"Name: {name}\nVersion: {version}\n")
+    (dist_info / "entry_points.txt").write_text(
+        "[sqlfluff]\n"
+        + "".join(f"{ep_name} = {value}\n" for ep_name, value in entry_points)
+    )
+
+
+def test__plugin_manifest(tmp_path, monkeypatch):
+    """Test that discovered plugins are saved in, and loaded from, a manifest."""
+    cache_dir = tmp_path / "cache"
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    monkeypatch.setenv("SQLFLUFF_PLUGIN_CACHE_DIR", str(cache_dir))
+    monkeypatch.syspath_prepend(str(site_dir))
+    _fake_distribution(site_dir, "fake_plugin", "1.0.0", [("fake", "fake_module")])
+
+    plugins = [(ep.value, name, version) for ep, name, version in _discover_plugins()]
+    assert ("fake_module", "fake", "1.0.0") in plugins
+    assert (cache_dir / "plugin_manifest.json").exists()
+
+    # Once the manifest is saved, distributions aren't inspected again.
+    def _distributions():
+        raise AssertionError("Distributions were inspected.")
+
+    monkeypatch.setattr(importlib.metadata, "distributions", _distributions)
+    assert [
+        (ep.value, name, version) for ep, name, version in _discover_plugins()
+    ] == plugins
+    monkeypatch.undo()
+
+    # Installing something else means discovering the plugins again.
+    monkeypatch.setenv("SQLFLUFF_PLUGIN_CACHE_DIR", str(cache_dir))
+    monkeypatch.syspath_prepend(str(site_dir))
+    _fake_distribution(site_dir, "other_plugin", "2.0.0", [("other", "other_module")])
+    plugins = [(ep.value, name, version) for ep, name, version in _discover_plugins()]
+    assert ("fake_module", "fake", "1.0.0") in plugins
+    assert ("other_module", "other", "2.0.0") in plugins
+
+
+def test__plugin_manifest_disabled(tmp_path, monkeypatch):
+    """Test that the manifest can be disabled."""
+    monkeypatch.setenv("SQLFLUFF_PLUGIN_CACHE_DIR", "none")
+    assert _get_plugin_manifest_path() is None
+    assert any(name == "sqlfluff" for _, name, _ in _discover_plugins())
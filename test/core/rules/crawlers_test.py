@@ -5,7 +5,9 @@ import pytest
 from sqlfluff.core.config import FluffConfig
 from sqlfluff.core.linter.linter import Linter
 from sqlfluff.core.rules.context import RuleContext
+from sqlfluff.core.rules.base import BaseRule
 from sqlfluff.core.rules.crawlers import (
+    MultiplexingCrawler,
     ParentOfSegmentCrawler,
     RootOnlyCrawler,
     SegmentSeekerCrawler,
@@ -51,3 +53,129 @@ def test_rules_crawlers(CrawlerType, crawler_kwargs, raw_sql_in, target_raws_out
     result_raws = [context.segment.raw for context in crawler.crawl(root_context)]
 
     assert result_raws == target_raws_out
+
+
+def test_rules_crawlers_changed_uuids():
+    """Test that only changed regions are crawled, given changed_uuids."""
+    raw_sql_in = "SELECT 1 + 2, 3 + 4"
+    cfg = FluffConfig(overrides={"dialect": "ansi"})
+    linter = Linter(config=cfg)
+    root = linter.parse_string(raw_sql_in).tree
+    # Mark the second expression and everything above it as changed.
+    target = [seg for seg in root.recursive_crawl("expression") if seg.raw == "3 + 4"][
+        0
+    ]
+    changed_uuids = {step.segment.uuid for step in root.path_to(target)}
+    changed_uuids.add(target.uuid)
+
+    root_context = RuleContext(
+        dialect=cfg.get("dialect_obj"),
+        fix=True,
+        templated_file=TemplatedFile(raw_sql_in, "<test-case>"),
+        path=None,
+        segment=root,
+        config=cfg,
+        changed_uuids=changed_uuids,
+    )
+    crawler = SegmentSeekerCrawler(types={"numeric_literal", "select_clause_element"})
+
+    result_raws = [context.segment.raw for context in crawler.crawl(root_context)]
+
+    # The first element is unchanged, but is still yielded because its
+    # parent has changed. Nothing within it is considered.
+    assert result_raws == ["1 + 2", "3 + 4", "3", "4"]
+
+
+def test_rules_crawlers_rule_applicability():
+    """Test that rules are skipped for files they can't find anything in."""
+    linter = Linter(dialect="ansi", rules=["ST01", "LT01", "TQ01"])
+    rule_pack = linter.get_rulepack()
+    rules = {rule.code: rule for rule in rule_pack.rules}
+    tree = linter.parse_string("SELECT 1 + 2\n").tree
+    segment_types = tree.descendant_type_set | tree.class_types
+    dialect = linter.config.get("dialect_obj")
+    # ST01 looks for CASE expressions, which aren't present.
+    assert not rules["ST01"].is_applicable(segment_types, dialect)
+    assert rules["LT01"].is_applicable(segment_types, dialect)
+    # TQ01 only applies to T-SQL.
+    assert not rules["TQ01"].is_applicable(
+        segment_types | {"create_procedure_statement"}, dialect
+    )
+
+    # Skipped rules aren't run, so they have no timings.
+    _, _, _, rule_timings = linter.lint_fix_parsed(tree, linter.config, rule_pack)
+    assert {code for code, _, _ in rule_timings} == {"LT01"}
+
+
+def test_rules_crawlers_multiplexing():
+    """Test that a multiplexing crawler yields what each crawler would."""
+    raw_sql_in = "SELECT 1 + 2, (3 + 4) * 5 FROM tbl"
+    cfg = FluffConfig(overrides={"dialect": "ansi"})
+    root = Linter(config=cfg).parse_string(raw_sql_in).tree
+
+    def root_context():
+        return RuleContext(
+            dialect=cfg.get("dialect_obj"),
+            fix=False,
+            templated_file=TemplatedFile(raw_sql_in, "<test-case>"),
+            path=None,
+            segment=root,
+            config=cfg,
+        )
+
+    crawlers = [
+        SegmentSeekerCrawler({"numeric_literal"}),
+        SegmentSeekerCrawler({"expression"}, allow_recurse=False),
+        ParentOfSegmentCrawler({"numeric_literal"}),
+        SegmentSeekerCrawler({"from_clause", "bracketed"}),
+        SegmentSeekerCrawler({"case_expression"}),
+    ]
+    expected = [
+        [context.segment.raw for context in crawler.crawl(root_context())]
+        for crawler in crawlers
+    ]
+    result_raws = [[] for _ in crawlers]
+    for idx, context in MultiplexingCrawler(crawlers).crawl(root_context()):
+        result_raws[idx].append(context.segment.raw)
+
+    assert result_raws == expected
+    assert expected[1] == ["1 + 2", "(3 + 4) * 5"]
+    assert not MultiplexingCrawler.supports(RootOnlyCrawler())
+    assert not MultiplexingCrawler.supports(
+        SegmentSeekerCrawler({"keyword"}, provide_raw_stack=True)
+    )
+
+
+def test_rules_crawlers_crawl_together():
+    """Test that running rules together matches running them separately."""
+    linter = Linter(dialect="ansi", rules=["AL03", "CP01", "LT01", "RF02", "ST06"])
+    rule_pack = linter.get_rulepack()
+    parsed = linter.parse_string(
+        "SELECT upper(d), b, a.c + 1 from a join B on a.b = B.b\n"
+    )
+    kwargs = dict(
+        tree=parsed.tree,
+        dialect=linter.config.get("dialect_obj"),
+        fix=False,
+        templated_file=parsed.parsed_variants[0].templated_file,
+        ignore_mask=None,
+        fname=None,
+        config=linter.config,
+    )
+
+    results = BaseRule.crawl_together(rule_pack.rules, **kwargs)
+
+    # LT01 uses a `RootOnlyCrawler`, so it can't be run with the others.
+    assert set(results) == {"AL03", "CP01", "RF02", "ST06"}
+    for rule in rule_pack.rules:
+        if rule.code not in results:
+            continue
+        linting_errors, _, fixes, _ = rule.crawl(**kwargs)
+        assert results[rule.code][0] == linting_errors
+        assert results[rule.code][1] == fixes
+    assert {code for code, result in results.items() if result[0]} == {
+        "AL03",
+        "CP01",
+        "RF02",
+        "ST06",
+    }
@@ -377,6 +377,51 @@ def test_linted_file_ignore_masked_violations(
     assert actually_used == expected_used
 
 
+def test_linted_file_ignore_masked_violations_one_at_a_time():
+    """Violations can be filtered one at a time, as they are while linting.
+
+    The results (and the directives marked as used) should be the same as
+    filtering them all together.
+    """
+    noqa = []
+    for line_no in range(1, 100, 10):
+        noqa += [
+            NoQaDirective(line_no, 0, ("LT01",), "disable"),
+            NoQaDirective(line_no + 5, 0, ("LT01",), "enable"),
+        ]
+    noqa += [
+        NoQaDirective(50, 0, None, None),
+        NoQaDirective(52, 0, ("CP01",), None),
+        # A second disable without an enable, and an enable of a different rule.
+        NoQaDirective(110, 0, None, "disable"),
+        NoQaDirective(112, 0, None, "disable"),
+        NoQaDirective(120, 0, ("CP01",), "enable"),
+    ]
+    violations = [
+        DummyLintError(line_no, code)
+        for line_no in range(1, 130, 3)
+        for code in ("LT01", "CP01")
+    ]
+    expected = IgnoreMask(noqa).ignore_masked_violations(violations)
+    expected_used = [ignore.used for ignore in noqa]
+    for ignore in noqa:
+        ignore.used = False
+
+    ignore_mask = IgnoreMask(noqa)
+    result = [v for v in violations if ignore_mask.ignore_masked_violations([v])]
+    assert result == expected
+    assert [ignore.used for ignore in noqa] == expected_used
+    assert [(v.line_no, v.rule_code()) for v in result][-5:] == [
+        (109, "LT01"),
+        (109, "CP01"),
+        (121, "CP01"),
+        (124, "CP01"),
+        (127, "CP01"),
+    ]
+    # The second disable was the one in force, so the first isn't used.
+    assert [ignore.used for ignore in noqa[-3:]] == [False, True, True]
+
+
 def test_linter_noqa():
     """Test "noqa" feature at the higher "Linter" level."""
     lntr = Linter(
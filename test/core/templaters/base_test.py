@@ -333,6 +333,31 @@ def test__templated_file_templated_slice_to_source_slice(
     assert (is_literal, source_slice) == (literal_test, out_slice)
 
 
+@pytest.mark.parametrize(
+    "source_slice,raw_slice_starts,is_literal",
+    [
+        (slice(0, 5), [0], True),
+        # Spanning a comment.
+        (slice(10, 30), [0, 13, 29], False),
+        (slice(81, 86), [81], False),
+        (slice(85, 87), [81, 86], False),
+        (slice(87, 100), [86], True),
+        # Zero length slices.
+        (slice(13, 13), [13], True),
+        # The end of the file.
+        (slice(230, 230), [], True),
+    ],
+)
+def test__templated_file_raw_slices_spanning_source_slice(
+    source_slice, raw_slice_starts, is_literal
+):
+    """Test TemplatedFile.raw_slices_spanning_source_slice."""
+    file = TemplatedFile(**COMPLEX_FILE_KWARGS)
+    raw_slices = file.raw_slices_spanning_source_slice(source_slice)
+    assert [raw_slice.source_idx for raw_slice in raw_slices] == raw_slice_starts
+    assert file.is_source_slice_literal(source_slice) == is_literal
+
+
 @pytest.mark.parametrize(
     "file,expected_result",
     [
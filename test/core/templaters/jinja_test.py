@@ -6,7 +6,9 @@ sense to test in the context of a templater which supports
 loops and placeholders.
 """
 
+import hashlib
 import logging
+import os
 from collections import defaultdict
 from pathlib import Path
 from typing import List, NamedTuple, Union
@@ -23,7 +25,11 @@ from sqlfluff.core.errors import SQLFluffSkipFile, SQLFluffUserError, SQLTemplat
 from sqlfluff.core.parser import BaseSegment
 from sqlfluff.core.templaters import JinjaTemplater
 from sqlfluff.core.templaters.base import RawFileSlice, TemplatedFile
-from sqlfluff.core.templaters.jinja import DummyUndefined
+from sqlfluff.core.templaters.jinja import (
+    DummyUndefined,
+    JinjaBytecodeCache,
+    get_bytecode_cache,
+)
 from sqlfluff.core.templaters.slicers.tracer import JinjaAnalyzer, JinjaTagConfiguration
 
 JINJA_STRING = (
@@ -1714,6 +1720,108 @@ def test__templater_jinja_large_file_check():
     assert "Length of file" in str(excinfo.value)
 
 
+def test__templater_jinja_bytecode_cache():
+    """Compiled templates are shared between environments with the same settings."""
+    cache = JinjaBytecodeCache()
+    envs = [JinjaTemplater()._get_jinja_env() for _ in range(3)]
+    for env in envs:
+        env.bytecode_cache = cache
+    # A filter is resolved when compiling, so the last environment can't
+    # share compiled templates with the others.
+    envs[2].filters["shout"] = str.upper
+
+    template = "select {{ a }} from {{ b | default('tbl') }}"
+    first = cache.from_string(envs[0], template, globals={"a": 1})
+    second = cache.from_string(envs[1], template, globals={"a": 2})
+    assert len(cache._code) == 1
+    # The globals and environment are still those given.
+    assert first.render() == "select 1 from tbl"
+    assert second.render(b="foo") == "select 2 from foo"
+    assert second.environment is envs[1]
+
+    cache.from_string(envs[2], template)
+    cache.from_string(envs[0], "select 1")
+    assert len(cache._code) == 3
+
+    # The cache is bounded.
+    cache.size = 2
+    cache.from_string(envs[0], "select 2")
+    assert len(cache._code) == 2
+
+
+def test__templater_jinja_bytecode_cache_dir(tmp_path):
+    """Compiled templates can be stored on disk for later runs."""
+    cache_dir = str(tmp_path / "jinja_cache")
+    config = FluffConfig(
+        configs={"templater": {"jinja": {"bytecode_cache_dir": cache_dir}}},
+        overrides={"dialect": "ansi"},
+    )
+    templater = JinjaTemplater()
+    templated_file, _ = templater.process(
+        in_str="select {{ 1 + 1 }}\n", fname="a.sql", config=config
+    )
+    assert templated_file.templated_str == "select 2\n"
+    assert get_bytecode_cache(cache_dir)._disk
+    assert len(os.listdir(cache_dir)) > 0
+
+    # A fresh cache (i.e. in a later run) loads them rather than compiling.
+    env = templater._get_jinja_env(config)
+    fresh_cache = JinjaBytecodeCache(cache_dir)
+    bucket = fresh_cache.get_bucket(
+        env,
+        "<string>:" + hashlib.sha1(b"select {{ 1 + 1 }}\n").hexdigest(),
+        None,
+        "select {{ 1 + 1 }}\n",
+    )
+    assert bucket.code is not None
+
+
+def test__templater_jinja_macro_cache(tmp_path, monkeypatch):
+    """Macros are only loaded again if their files or the config change."""
+    macro_file = tmp_path / "macros.sql"
+    macro_file.write_text("{% macro col(n) %}col_{{ n }}{% endmacro %}")
+    config = FluffConfig(
+        configs={"templater": {"jinja": {"load_macros_from_path": str(tmp_path)}}},
+        overrides={"dialect": "ansi"},
+    )
+    loads = []
+    extract = JinjaTemplater._extract_macros_from_template
+
+    def _extract(*args, **kwargs):
+        loads.append(args)
+        return extract(*args, **kwargs)
+
+    monkeypatch.setattr(
+        JinjaTemplater, "_extract_macros_from_template", staticmethod(_extract)
+    )
+
+    def _render(templater: JinjaTemplater, config: FluffConfig) -> str:
+        templated_file, _ = templater.process(
+            in_str="select {{ col(1) }}\n", fname="a.sql", config=config
+        )
+        return templated_file.templated_str
+
+    templater = JinjaTemplater()
+    assert _render(templater, config) == "select col_1\n"
+    # Other files, and other templaters with the same config, reuse them.
+    assert _render(templater, config) == "select col_1\n"
+    assert _render(JinjaTemplater(), config) == "select col_1\n"
+    assert len(loads) == 1
+
+    # Changing the macro file loads them again.
+    macro_file.write_text("{% macro col(n) %}column_{{ n }}{% endmacro %}")
+    os.utime(macro_file, ns=(0, 0))
+    assert _render(templater, config) == "select column_1\n"
+    assert len(loads) == 2
+
+    # As does changing the config or the templater's context.
+    config.set_value(["templater", "jinja", "context", "foo"], "bar")
+    assert _render(templater, config) == "select column_1\n"
+    assert len(loads) == 3
+    assert _render(JinjaTemplater(override_context={"foo": 1}), config)
+    assert len(loads) == 4
+
+
 @pytest.mark.parametrize(
     "in_str, ignore, expected_violation",
     [
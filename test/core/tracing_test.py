@@ -0,0 +1,90 @@
+"""Tests for tracing the stages of linting."""
+
+import json
+
+from sqlfluff.core import FluffConfig, Linter
+from sqlfluff.core.linter.runner import ParallelRunner
+from sqlfluff.core.tracing import (
+    is_tracing,
+    start_tracing,
+    stop_tracing,
+    trace_span,
+    write_trace,
+)
+
+
+def test__tracing__disabled():
+    """Spans aren't recorded unless tracing is enabled."""
+    assert not is_tracing()
+    with trace_span("foo", "stage", file="a.sql") as span:
+        span["bar"] = 1
+    assert stop_tracing() == []
+
+
+def test__tracing__spans(tmpdir):
+    """Spans are recorded with their arguments, and written as json."""
+    start_tracing()
+    try:
+        with trace_span("outer", "stage", file="a.sql") as span:
+            with trace_span("inner", "rule", rule="LT01"):
+                pass
+            span["variants"] = 1
+    finally:
+        events = stop_tracing()
+    assert not is_tracing()
+    # Spans are recorded as they finish.
+    assert [(e["name"], e["cat"], e["ph"]) for e in events] == [
+        ("inner", "rule", "X"),
+        ("outer", "stage", "X"),
+    ]
+    inner, outer = events
+    assert inner["args"] == {"rule": "LT01"}
+    assert outer["args"] == {"file": "a.sql", "variants": 1}
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+    path = str(tmpdir / "trace.json")
+    write_trace(path, events)
+    with open(path) as f:
+        assert json.load(f)["traceEvents"] == events
+
+
+def test__tracing__lint():
+    """Linting a file records spans for each stage and rule."""
+    start_tracing()
+    try:
+        Linter(
+            config=FluffConfig(overrides={"dialect": "ansi", "rules": "LT01,CP01"})
+        ).lint_paths(("test/fixtures/linter/indentation_errors.sql",), fix=True)
+    finally:
+        events = stop_tracing()
+    names = {e["name"] for e in events}
+    assert {"file", "load config", "template", "lex", "parse", "lint"} <= names
+    assert {e["args"]["rule"] for e in events if e["name"] == "rule"} == {
+        "LT01",
+        "CP01",
+    }
+    assert all(
+        e["args"]["file"] == "test/fixtures/linter/indentation_errors.sql"
+        for e in events
+        if e["cat"] == "stage"
+    )
+
+
+def test__tracing__worker():
+    """Spans recorded in a worker process are returned with the result."""
+    linter = Linter(config=FluffConfig(overrides={"dialect": "ansi"}))
+    fname = "test/fixtures/linter/indentation_errors.sql"
+
+    def _lint():
+        return linter.lint_string("select 1\n", fname=fname)
+
+    # Tracing isn't enabled in this process, as if we're a worker.
+    linted_file = ParallelRunner._apply((fname, _lint), trace=True)
+    assert not is_tracing()
+    assert linted_file.trace_events
+    assert linted_file.trace_events[-1]["name"] == "file"
+    assert linted_file.trace_events[-1]["args"] == {"file": fname}
+
+    # If tracing isn't requested, then nothing is returned.
+    assert ParallelRunner._apply((fname, _lint)).trace_events is None
@@ -62,6 +62,24 @@ def test_reflow_sequence_from_segments(
     assert_reflow_structure(result, StartClass, raw_elems)
 
 
+def test_reflow_sequence_from_root_shared(default_config):
+    """Test that sequences from the same root share their elements."""
+    root = parse_ansi_string("select 1 +2", default_config)
+    first = ReflowSequence.from_root(root, config=default_config)
+    first.elements.pop()
+    second = ReflowSequence.from_root(root, config=default_config)
+    assert second.depth_map is first.depth_map
+    # Each sequence has its own copy of the elements.
+    assert len(second.elements) == len(first.elements) + 1
+    assert second.get_raw() == "select 1 +2"
+
+    # A different tree (even with the same content) gets a new depth map.
+    other_root = parse_ansi_string("select 1 +2", default_config)
+    third = ReflowSequence.from_root(other_root, config=default_config)
+    assert third.depth_map is not first.depth_map
+    assert third.elements[0].segments[0] is other_root.raw_segments[0]
+
+
 @pytest.mark.parametrize(
     "raw_sql,sides,target_idx,target_raw,StartClass,raw_elems",
     [